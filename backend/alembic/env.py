@@ -12,7 +12,7 @@ from app.core.config import settings
 from app.models.base import Base
 
 # Import all models to ensure they are registered with SQLAlchemy
-from app.models import employee, lead, developer, project, inventory, contact, enquiry, land_parcel, document
+from app.models import employee, lead, developer, project, inventory, contact, enquiry, land_parcel, document, job
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
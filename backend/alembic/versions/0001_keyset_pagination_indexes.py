@@ -0,0 +1,37 @@
+"""keyset pagination indexes on (created_at, id)
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+PAGINATED_TABLES = (
+    "employees",
+    "leads",
+    "developers",
+    "projects",
+    "inventory",
+    "land_parcels",
+    "contacts",
+    "enquiries",
+)
+
+
+def upgrade() -> None:
+    for table in PAGINATED_TABLES:
+        op.create_index(f"ix_{table}_created_at_id", table, ["created_at", "id"])
+
+
+def downgrade() -> None:
+    for table in PAGINATED_TABLES:
+        op.drop_index(f"ix_{table}_created_at_id", table_name=table)
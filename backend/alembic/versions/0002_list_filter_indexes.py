@@ -0,0 +1,40 @@
+"""composite indexes for filtered list queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns) matching the common filter combinations of
+# the list endpoints; the trailing column serves the default sort/range.
+INDEXES = (
+    ("ix_leads_assigned_employee_id_status_created_at", "leads", ["assigned_employee_id", "status", "created_at"]),
+    ("ix_leads_status_created_at", "leads", ["status", "created_at"]),
+    ("ix_inventory_project_id_status_price", "inventory", ["project_id", "status", "price"]),
+    ("ix_inventory_status_price", "inventory", ["status", "price"]),
+    ("ix_projects_developer_id_status", "projects", ["developer_id", "status"]),
+    ("ix_projects_status_total_value", "projects", ["status", "total_value"]),
+    ("ix_enquiries_assigned_employee_id_status_created_at", "enquiries", ["assigned_employee_id", "status", "created_at"]),
+    ("ix_land_parcels_district_land_type_total_value", "land_parcels", ["district", "land_type", "total_value"]),
+    ("ix_contacts_contact_type_city", "contacts", ["contact_type", "city"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,62 @@
+"""materialized summary views for the dashboard
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# (view, query, unique key). The unique index is what allows
+# REFRESH MATERIALIZED VIEW CONCURRENTLY, so readers never block on a refresh.
+VIEWS = (
+    (
+        "lead_summary",
+        """
+        SELECT assigned_employee_id, status, source, count(*) AS lead_count,
+               now() AS refreshed_at
+        FROM leads
+        GROUP BY assigned_employee_id, status, source
+        """,
+        ["assigned_employee_id", "status", "source"],
+    ),
+    (
+        "inventory_summary",
+        """
+        SELECT project_id, status, count(*) AS unit_count,
+               coalesce(sum(price), 0) AS total_value, now() AS refreshed_at
+        FROM inventory
+        GROUP BY project_id, status
+        """,
+        ["project_id", "status"],
+    ),
+    (
+        "enquiry_summary",
+        """
+        SELECT status, count(*) AS enquiry_count,
+               min(created_at) AS oldest_created_at, now() AS refreshed_at
+        FROM enquiries
+        GROUP BY status
+        """,
+        ["status"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for name, query, key in VIEWS:
+        op.execute(f"CREATE MATERIALIZED VIEW {name} AS {query}")
+        op.create_index(f"ux_{name}", name, key, unique=True)
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(VIEWS):
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {name}")
@@ -0,0 +1,82 @@
+"""full-text and trigram search indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+# table -> (columns folded into the generated search_vector,
+#           columns with a trigram index for fuzzy matches,
+#           phone columns with a trigram index on their digits only)
+SEARCH_COLUMNS = {
+    "leads": (
+        ["name", "company", "email", "phone"],
+        ["name", "email"],
+        ["phone"],
+    ),
+    "contacts": (
+        ["name", "company", "email", "phone", "alternate_phone", "city"],
+        ["name", "email"],
+        ["phone", "alternate_phone"],
+    ),
+    "enquiries": (
+        ["customer_name", "customer_email", "customer_phone", "subject"],
+        ["customer_name", "customer_email"],
+        ["customer_phone"],
+    ),
+    "land_parcels": (
+        ["survey_number", "village", "owner_name", "district", "owner_contact"],
+        ["survey_number", "village", "owner_name"],
+        ["owner_contact"],
+    ),
+}
+
+# Must match app.services.search.phone_digits() for the planner to use it
+PHONE_DIGITS = "regexp_replace({column}, '\\D', '', 'g')"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, (vector_columns, trigram_columns, phone_columns) in SEARCH_COLUMNS.items():
+        # 'simple': names, phones and survey numbers must not be stemmed
+        document = " || ' ' || ".join(f"coalesce({c}, '')" for c in vector_columns)
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, {document})) STORED"
+        )
+        op.create_index(
+            f"ix_{table}_search_vector", table, ["search_vector"], postgresql_using="gin"
+        )
+        for column in trigram_columns:
+            op.create_index(
+                f"ix_{table}_{column}_trgm",
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+        for column in phone_columns:
+            op.execute(
+                f"CREATE INDEX ix_{table}_{column}_digits_trgm ON {table} "
+                f"USING gin (({PHONE_DIGITS.format(column=column)}) gin_trgm_ops)"
+            )
+
+
+def downgrade() -> None:
+    for table, (_, trigram_columns, phone_columns) in reversed(list(SEARCH_COLUMNS.items())):
+        for column in reversed(phone_columns):
+            op.drop_index(f"ix_{table}_{column}_digits_trgm", table_name=table)
+        for column in reversed(trigram_columns):
+            op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
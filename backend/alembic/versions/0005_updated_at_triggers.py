@@ -0,0 +1,56 @@
+"""maintain updated_at on UPDATE
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# Every table built on app.models.base.BaseModel. The updated_at indexes let
+# the conditional GET fingerprint (count, max(updated_at)) read the newest
+# row without scanning the table.
+TIMESTAMPED_TABLES = (
+    "employees",
+    "leads",
+    "developers",
+    "projects",
+    "inventory",
+    "land_parcels",
+    "contacts",
+    "enquiries",
+    "documents",
+)
+
+
+def upgrade() -> None:
+    # The column's server default only fires on INSERT
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TIMESTAMPED_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+
+def downgrade() -> None:
+    for table in reversed(TIMESTAMPED_TABLES):
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
+        op.execute(f"DROP TRIGGER trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION set_updated_at()")
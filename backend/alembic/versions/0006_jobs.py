@@ -0,0 +1,61 @@
+"""background job queue table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()")),
+        sa.Column("is_active", sa.Boolean(), server_default=sa.true()),
+        sa.Column("kind", sa.String(100), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column(
+            "status",
+            sa.Enum("QUEUED", "RUNNING", "SUCCEEDED", "FAILED", name="jobstatus"),
+            nullable=False,
+            server_default="QUEUED",
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="5"),
+        sa.Column("run_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("locked_at", sa.DateTime(timezone=True)),
+        sa.Column("locked_by", sa.String(100)),
+        sa.Column("finished_at", sa.DateTime(timezone=True)),
+        sa.Column("last_error", sa.Text()),
+        sa.Column("result", postgresql.JSONB()),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("employees.id")),
+    )
+    # Partial index: the claim query only ever looks at due, queued jobs, so
+    # finished history does not slow it down.
+    op.create_index("ix_jobs_due", "jobs", ["run_at"], postgresql_where=sa.text("status = 'QUEUED'"))
+    op.create_index("ix_jobs_created_by", "jobs", ["created_by", "created_at"])
+    # set_updated_at() comes from revision 0005
+    op.execute(
+        "CREATE TRIGGER trg_jobs_updated_at BEFORE UPDATE ON jobs "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER trg_jobs_updated_at ON jobs")
+    op.drop_index("ix_jobs_created_by", table_name="jobs")
+    op.drop_index("ix_jobs_due", table_name="jobs")
+    op.drop_table("jobs")
+    sa.Enum(name="jobstatus").drop(op.get_bind())
@@ -0,0 +1,79 @@
+import functools
+import inspect
+from typing import Callable, Optional
+from fastapi import APIRouter, Depends
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db, get_db
+
+
+def _get_db_param(endpoint: Callable) -> Optional[str]:
+    for name, param in inspect.signature(endpoint).parameters.items():
+        if getattr(param.default, "dependency", None) is get_db:
+            return name
+    return None
+
+
+def _make_async_endpoint(endpoint: Callable, db_param: str) -> Callable:
+    """Run a sync handler on the event loop against an AsyncSession.
+
+    The handler body executes inside ``AsyncSession.run_sync``, so every query
+    it issues goes through the async driver instead of blocking a threadpool
+    worker, and the sync and async stacks share a single implementation.
+    Everything else in the body also runs on the loop; other blocking I/O
+    must hand itself off (see RedisCacheBackend).
+    """
+    signature = inspect.signature(endpoint)
+    parameters = [
+        param.replace(default=Depends(get_async_db), annotation=AsyncSession)
+        if name == db_param else param
+        for name, param in signature.parameters.items()
+    ]
+
+    @functools.wraps(endpoint)
+    async def async_endpoint(**kwargs):
+        db: AsyncSession = kwargs.pop(db_param)
+        return await db.run_sync(
+            lambda session: endpoint(**kwargs, **{db_param: session})
+        )
+
+    async_endpoint.__signature__ = signature.replace(parameters=parameters)
+    return async_endpoint
+
+
+def to_async_router(router: APIRouter) -> APIRouter:
+    """Return a copy of ``router`` whose DB-bound sync handlers are async"""
+    async_router = APIRouter()
+    for route in router.routes:
+        db_param = None
+        if isinstance(route, APIRoute) and not inspect.iscoroutinefunction(route.endpoint):
+            db_param = _get_db_param(route.endpoint)
+        if db_param is None:
+            async_router.routes.append(route)
+            continue
+        async_router.add_api_route(
+            route.path,
+            _make_async_endpoint(route.endpoint, db_param),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            tags=route.tags,
+            dependencies=route.dependencies,
+            summary=route.summary,
+            description=route.description,
+            response_description=route.response_description,
+            responses=route.responses,
+            deprecated=route.deprecated,
+            methods=route.methods,
+            operation_id=route.operation_id,
+            response_model_include=route.response_model_include,
+            response_model_exclude=route.response_model_exclude,
+            response_model_by_alias=route.response_model_by_alias,
+            response_model_exclude_unset=route.response_model_exclude_unset,
+            response_model_exclude_defaults=route.response_model_exclude_defaults,
+            response_model_exclude_none=route.response_model_exclude_none,
+            include_in_schema=route.include_in_schema,
+            response_class=route.response_class,
+            name=route.name,
+            openapi_extra=route.openapi_extra,
+        )
+    return async_router
@@ -0,0 +1,105 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from fastapi import Request, Response
+from app.api.serializers import JSON_MEDIA_TYPE
+from app.core.cache import reference_cache
+
+# Per-user data behind Authorization: browsers may keep it but must
+# revalidate on every use, shared caches must not store it.
+CACHE_CONTROL = "private, no-cache"
+
+def _etag(request: Request, fingerprint: Sequence[Any]) -> str:
+    # The URL is part of the key so pages, filters, fields= and include=
+    # over the same rows get distinct tags.
+    key = f"{request.url.path}?{request.url.query}|{fingerprint!r}"
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()[:32]}"'
+
+def _opaque(tag: str) -> str:
+    # Weak comparison (RFC 9110 8.8.3.2)
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+def _http_date(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+def last_modified_header(value: Optional[datetime]) -> Dict[str, str]:
+    return {"Last-Modified": format_datetime(_http_date(value), usegmt=True)} if value else {}
+
+def _is_fresh(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence over If-Modified-Since
+        tags = [_opaque(tag) for tag in if_none_match.split(",")]
+        return "*" in tags or _opaque(etag) in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return since.tzinfo is not None and _http_date(last_modified) <= since
+    return False
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    fingerprint: Optional[Sequence[Any]],
+    *,
+    last_modified: bool = False
+) -> Optional[Response]:
+    """Attach validators for ``fingerprint`` and short-circuit fresh requests.
+
+    ``fingerprint`` comes from CRUDBase.fingerprint: (count, max(updated_at),
+    ...). Returns a 304 Response when the client's copy is current, else
+    None after setting ETag (and Last-Modified) on ``response``; the
+    handler then renders the body as usual.
+
+    Pass ``last_modified`` only for single rows without includes: a list's
+    newest updated_at does not move when a row is deleted, so lists are
+    validated by ETag alone.
+    """
+    if fingerprint is None:
+        return None
+    headers = {"ETag": _etag(request, fingerprint), "Cache-Control": CACHE_CONTROL}
+    modified = fingerprint[1] if last_modified and len(fingerprint) == 2 else None
+    if modified is not None:
+        headers.update(last_modified_header(modified))
+    if _is_fresh(request, headers["ETag"], modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+def cached_read(
+    request: Request,
+    tables: Sequence[str],
+    render: Callable[[], Tuple[bytes, Dict[str, str]]]
+) -> Response:
+    """Serve a read through reference_cache, keyed by its URL.
+
+    ``render`` returns the JSON body and extra headers; it only runs on a
+    miss, so hits use no database connection at all. ``tables`` are every
+    table the body is built from (see ListQueryMixin.source_tables). The
+    ETag is the body's hash and is checked against If-None-Match.
+    """
+    def load() -> bytes:
+        body, headers = render()
+        headers = {
+            **headers,
+            "ETag": f'"{hashlib.sha1(body).hexdigest()[:32]}"',
+            "Cache-Control": CACHE_CONTROL,
+        }
+        return json.dumps(headers).encode() + b"\n" + body
+
+    entry = reference_cache.get_or_load(tables, f"{request.url.path}?{request.url.query}", load)
+    raw_headers, _, body = entry.partition(b"\n")
+    headers = json.loads(raw_headers)
+    modified = headers.get("Last-Modified")
+    if _is_fresh(request, headers["ETag"], parsedate_to_datetime(modified) if modified else None):
+        validators = ("ETag", "Cache-Control", "Last-Modified")
+        return Response(status_code=304, headers={k: v for k, v in headers.items() if k in validators})
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -1,51 +1,231 @@
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Set, Tuple, Type
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from supabase import Client
-from app.database import get_db
-from app.core.security import verify_token
+from app.api.export import ExportFormat
+from app.database import get_async_db, get_db
+from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.security import verify_token, verify_token_async
+from app.crud.crud_employee import employee_async
 from app.services.supabase_service import supabase_service
 from app.models.employee import Employee, UserRole
+from app.schemas.bulk import BulkResult, BulkRowError
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 security = HTTPBearer()
 
-def get_supabase() -> Client:
+@dataclass(frozen=True)
+class Principal:
+    """Detached, read-only snapshot of the authenticated Employee"""
+    id: Any
+    user_id: Optional[str]
+    username: str
+    full_name: str
+    role: UserRole
+    phone: Optional[str]
+    department: Optional[str]
+    is_active: bool
+
+    @classmethod
+    def from_employee(cls, employee: Employee) -> "Principal":
+        return cls(
+            id=employee.id,
+            user_id=str(employee.user_id) if employee.user_id else None,
+            username=employee.username,
+            full_name=employee.full_name,
+            role=employee.role,
+            phone=employee.phone,
+            department=employee.department,
+            is_active=employee.is_active,
+        )
+
+# Keyed by the token ``sub`` (Employee.user_id). Entries are per-process, so
+# the TTL bounds how long other workers can serve a stale principal.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+def invalidate_principal(user_id: Optional[Any]) -> None:
+    if user_id is not None:
+        principal_cache.invalidate(str(user_id))
+
+@dataclass(frozen=True)
+class PageParams:
+    """List query parameters; ``cursor`` is the previous page's X-Next-Cursor"""
+    skip: int = 0
+    limit: int = 100
+    cursor: Optional[str] = None
+    sort: Optional[str] = None
+    include: Optional[str] = None
+    fields: Optional[str] = None
+    filters: Dict[str, str] = field(default_factory=dict)
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        return {
+            "cursor": self.cursor,
+            "skip": self.skip,
+            "limit": self.limit,
+            "sort": self.sort,
+            "include": self.include,
+            "fields": self.fields,
+            "filters": self.filters,
+        }
+
+PAGE_PARAM_NAMES = frozenset(("skip", "limit", "cursor", "sort", "include", "fields"))
+EXPORT_PARAM_NAMES = frozenset(("format", "sort"))
+
+def _query_filters(request: Request, reserved: frozenset) -> Dict[str, str]:
+    # Every other query parameter is a filter; CRUDBase validates it against
+    # the model's whitelist. Repeated keys are treated like ``a,b``.
+    filters: Dict[str, str] = {}
+    for key, value in request.query_params.multi_items():
+        if key not in reserved:
+            filters[key] = f"{filters[key]},{value}" if key in filters else value
+    return filters
+
+def get_page_params(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    sort: Optional[str] = None,
+    include: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> PageParams:
+    filters = _query_filters(request, PAGE_PARAM_NAMES)
+    return PageParams(
+        skip=skip, limit=limit, cursor=cursor, sort=sort, include=include, fields=fields,
+        filters=filters
+    )
+
+def include_names(include: Optional[str]) -> Set[str]:
+    return {name for name in (include or "").split(",") if name}
+
+@dataclass(frozen=True)
+class ExportParams:
+    format: ExportFormat = ExportFormat.CSV
+    sort: Optional[str] = None
+    filters: Dict[str, str] = field(default_factory=dict)
+
+def get_export_params(
+    request: Request,
+    format: ExportFormat = ExportFormat.CSV,
+    sort: Optional[str] = None,
+) -> ExportParams:
+    return ExportParams(format=format, sort=sort, filters=_query_filters(request, EXPORT_PARAM_NAMES))
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+def set_job_location(response: Response, job) -> None:
+    """Point a 202 response at the status of the job doing the work"""
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+
+def check_bulk_size(count: int) -> None:
+    if count > settings.BULK_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.BULK_MAX_ROWS} rows per request",
+        )
+
+def parse_bulk_rows(
+    rows: List[Dict[str, Any]], schema: Type[BaseModel], *, with_id: bool = False
+) -> Tuple[Dict[int, Any], BulkResult]:
+    """Validate bulk rows individually so one bad row does not reject the batch.
+
+    Returns the valid rows keyed by their index (as ``(id, obj)`` pairs when
+    ``with_id``) and a BulkResult seeded with the validation errors.
+    """
+    check_bulk_size(len(rows))
+    parsed: Dict[int, Any] = {}
+    result = BulkResult()
+    for index, row in enumerate(rows):
+        row = dict(row)
+        id = row.pop("id", None) if with_id else None
+        if with_id and id is None:
+            result.errors.append(BulkRowError(index=index, detail="Missing id"))
+            continue
+        try:
+            obj = schema.model_validate(row)
+        except ValidationError as exc:
+            detail = [
+                {"loc": error["loc"], "msg": error["msg"], "type": error["type"]}
+                for error in exc.errors()
+            ]
+            result.errors.append(BulkRowError(index=index, detail=detail))
+            continue
+        parsed[index] = (id, obj) if with_id else obj
+    return parsed, result
+
+def get_supabase() -> "Client":
     return supabase_service.supabase
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> Employee:
-    token = credentials.credentials
-    payload = verify_token(token)
-    
-    user_id: str = payload.get("sub")
-    if user_id is None:
+def _token_subject(payload: Dict[str, Any]) -> UUID:
+    # Employee.user_id is a UUID; anything else cannot match an employee
+    try:
+        return UUID(str(payload["sub"]))
+    except (KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
-    
-    # Get user from employees table using user_id
-    user = db.query(Employee).filter(Employee.user_id == user_id).first()
-    if user is None:
+
+def _resolve_principal(user_id: UUID, employee: Optional[Employee]) -> Principal:
+    if employee is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    
+    user = Principal.from_employee(employee)
+    principal_cache.set(str(user_id), user)
+    return user
+
+def _ensure_active(user: Principal) -> Principal:
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
-    
     return user
 
+def get_current_user(
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    user_id = _token_subject(verify_token(credentials.credentials))
+    user = principal_cache.get(str(user_id))
+    if user is None:
+        # Get user from employees table using user_id
+        employee = db.query(Employee).filter(Employee.user_id == user_id).first()
+        user = _resolve_principal(user_id, employee)
+    return _ensure_active(user)
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    """Drop-in replacement for get_current_user on the asyncio stack"""
+    user_id = _token_subject(await verify_token_async(credentials.credentials))
+    user = principal_cache.get(str(user_id))
+    if user is None:
+        employee = await employee_async.get_by_user_id(db, user_id=user_id)
+        user = _resolve_principal(user_id, employee)
+    return _ensure_active(user)
+
 def get_current_admin(
-    current_user: Employee = Depends(get_current_user)
-) -> Employee:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -54,8 +234,8 @@ def get_current_admin(
     return current_user
 
 def get_current_active_user(
-    current_user: Employee = Depends(get_current_user)
-) -> Employee:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     if not current_user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
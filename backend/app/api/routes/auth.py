@@ -1,25 +1,42 @@
 from datetime import timedelta
+from typing import TYPE_CHECKING
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from supabase import Client
 from app.database import get_db
 from app.core.config import settings
-from app.core.security import create_access_token, authenticate_with_supabase, create_user_with_supabase
+from app.core.security import create_access_token, authenticate_with_supabase, create_user_with_supabase, run_auth_blocking
 from app.services.supabase_service import supabase_service
 from app.schemas.auth import LoginRequest, RegisterRequest, Token, UserResponse
-from app.api.deps import get_current_user, get_supabase
+from app.api.deps import Principal, get_current_user, get_supabase
 from app.models.employee import Employee
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 router = APIRouter()
 
+# The handlers stay async; every Supabase Auth round trip and DB call is
+# awaited through run_auth_blocking so it never blocks the event loop.
+
+def _employee_for(db: Session, user_id) -> Employee:
+    return db.query(Employee).filter(Employee.user_id == user_id).first()
+
+def _save(db: Session, obj):
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    return obj
+
 @router.post("/login", response_model=Token)
 async def login(
     login_data: LoginRequest,
     db: Session = Depends(get_db),
-    supabase: Client = Depends(get_supabase)
+    supabase: "Client" = Depends(get_supabase)
 ):
     # Authenticate with Supabase
-    auth_result = authenticate_with_supabase(supabase, login_data.email, login_data.password)
+    auth_result = await run_auth_blocking(
+        authenticate_with_supabase, supabase, login_data.email, login_data.password
+    )
     
     if not auth_result:
         raise HTTPException(
@@ -30,7 +47,7 @@ async def login(
     user = auth_result["user"]
     
     # Get employee profile
-    employee = db.query(Employee).filter(Employee.user_id == user.id).first()
+    employee = await run_auth_blocking(_employee_for, db, user.id)
     if not employee:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -43,17 +60,22 @@ async def login(
             detail="Inactive user"
         )
     
-    # Create JWT token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
-    )
+    # Supabase's own access token is verified locally when enabled
+    session = auth_result["session"]
+    if settings.SUPABASE_JWT_VERIFY and session is not None:
+        access_token = session.access_token
+    else:
+        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token = create_access_token(
+            data={"sub": user.id}, expires_delta=access_token_expires
+        )
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
         "user": {
             "id": str(employee.id),
+            "username": employee.username,
             "email": user.email,
             "full_name": employee.full_name,
             "role": employee.role,
@@ -65,10 +87,11 @@ async def login(
 async def register(
     register_data: RegisterRequest,
     db: Session = Depends(get_db),
-    supabase: Client = Depends(get_supabase)
+    supabase: "Client" = Depends(get_supabase)
 ):
     # Create user with Supabase Auth
-    auth_result = create_user_with_supabase(
+    auth_result = await run_auth_blocking(
+        create_user_with_supabase,
         supabase, 
         register_data.email, 
         register_data.password,
@@ -93,9 +116,7 @@ async def register(
         department=register_data.department
     )
     
-    db.add(employee)
-    db.commit()
-    db.refresh(employee)
+    employee = await run_auth_blocking(_save, db, employee)
     
     # Create JWT token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -108,6 +129,7 @@ async def register(
         "token_type": "bearer",
         "user": {
             "id": str(employee.id),
+            "username": employee.username,
             "email": user.email,
             "full_name": employee.full_name,
             "role": employee.role,
@@ -116,7 +138,7 @@ async def register(
     }
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(current_user: Employee = Depends(get_current_user)):
+async def read_users_me(current_user: Principal = Depends(get_current_user)):
     return {
         "id": str(current_user.id),
         "username": current_user.username,
@@ -129,11 +151,11 @@ async def read_users_me(current_user: Employee = Depends(get_current_user)):
 
 @router.post("/logout")
 async def logout(
-    supabase: Client = Depends(get_supabase),
-    current_user: Employee = Depends(get_current_user)
+    supabase: "Client" = Depends(get_supabase),
+    current_user: Principal = Depends(get_current_user)
 ):
     try:
-        supabase.auth.sign_out()
+        await run_auth_blocking(supabase.auth.sign_out)
         return {"message": "Successfully logged out"}
     except Exception as e:
         return {"message": "Logged out locally"}
\ No newline at end of file
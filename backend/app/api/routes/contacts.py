@@ -1,37 +1,42 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict, List
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.contact import Contact
-from app.schemas.contact import ContactCreate, ContactUpdate
-from app.api.deps import get_current_user
+from app.crud.crud_contact import contact_crud
+from app.schemas.contact import ContactCreate, ContactDetail, ContactResponse, ContactUpdate
+from app.api.serializers import Serializer
+from app.api.export import export_response
+from app.api.deps import ExportParams, PageParams, check_bulk_size, get_export_params, get_page_params, parse_bulk_rows, get_current_user, set_next_cursor
+from app.schemas.bulk import BulkDelete, BulkResult
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
+contact_list = Serializer(ContactDetail, default_fields=contact_crud.list_fields)
+contact_detail = Serializer(ContactDetail)
+
+@router.get("/", response_model=List[ContactResponse])
 def read_contacts(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    contacts = db.query(Contact).offset(skip).limit(limit).all()
-    return [
-        {
-            "id": c.id,
-            "name": c.name,
-            "company": c.company,
-            "contact_type": c.contact_type,
-            "email": c.email,
-            "phone": c.phone,
-            "city": c.city,
-            "state": c.state,
-            "is_active": c.is_active
-        }
-        for c in contacts
-    ]
+    contacts, next_cursor = contact_crud.get_page(db, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
+    return contact_list.many(contacts, fields=page.fields, response=response)
+
+@router.get("/export")
+def export_contacts(
+    params: ExportParams = Depends(get_export_params),
+    current_user = Depends(get_current_user)
+):
+    return export_response(
+        contact_crud, params.format, filename="contacts",
+        sort=params.sort, filters=params.filters
+    )
 
-@router.post("/")
+@router.post("/", response_model=ContactDetail)
 def create_contact(
     contact: ContactCreate,
     db: Session = Depends(get_db),
@@ -41,9 +46,37 @@ def create_contact(
     db.add(db_contact)
     db.commit()
     db.refresh(db_contact)
-    return db_contact
+    return contact_detail.one(db_contact)
+
+@router.post("/bulk", response_model=BulkResult)
+def create_contacts_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    objs_in, result = parse_bulk_rows(rows, ContactCreate)
+    return contact_crud.create_many(db, objs_in=objs_in, result=result)
+
+@router.put("/bulk", response_model=BulkResult)
+def update_contacts_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    objs_in, result = parse_bulk_rows(rows, ContactUpdate, with_id=True)
+    return contact_crud.update_many(db, objs_in=objs_in, result=result)
+
+@router.post("/bulk/delete", response_model=BulkResult)
+def delete_contacts_bulk(
+    body: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    check_bulk_size(len(body.ids))
+    ids = dict(enumerate(body.ids))
+    return contact_crud.remove_many(db, ids=ids)
 
-@router.get("/{contact_id}")
+@router.get("/{contact_id}", response_model=ContactDetail)
 def read_contact(
     contact_id: int,
     db: Session = Depends(get_db),
@@ -52,19 +85,9 @@ def read_contact(
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if contact is None:
         raise HTTPException(status_code=404, detail="Contact not found")
-    return {
-        "id": contact.id,
-        "name": contact.name,
-        "company": contact.company,
-        "contact_type": contact.contact_type,
-        "email": contact.email,
-        "phone": contact.phone,
-        "city": contact.city,
-        "state": contact.state,
-        "is_active": contact.is_active
-    }
+    return contact_detail.one(contact)
 
-@router.put("/{contact_id}")
+@router.put("/{contact_id}", response_model=ContactDetail)
 def update_contact(
     contact_id: int,
     contact: ContactUpdate,
@@ -81,17 +104,7 @@ def update_contact(
     
     db.commit()
     db.refresh(db_contact)
-    return {
-        "id": db_contact.id,
-        "name": db_contact.name,
-        "company": db_contact.company,
-        "contact_type": db_contact.contact_type,
-        "email": db_contact.email,
-        "phone": db_contact.phone,
-        "city": db_contact.city,
-        "state": db_contact.state,
-        "is_active": db_contact.is_active
-    }
+    return contact_detail.one(db_contact)
 
 @router.delete("/{contact_id}")
 def delete_contact(
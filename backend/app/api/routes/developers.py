@@ -1,22 +1,33 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
+from app.crud.crud_developer import developer_crud
 from app.schemas.developer import Developer, DeveloperCreate, DeveloperUpdate
-from app.api.deps import get_current_user
+from app.api.conditional import cached_read, last_modified_header
+from app.api.deps import NEXT_CURSOR_HEADER, PageParams, get_page_params, get_current_user
+from app.api.serializers import Serializer
+from app.core.cache import reference_cache
 from app.models.developer import Developer as DeveloperModel
 
 router = APIRouter()
 
+developer_serializer = Serializer(Developer)
+
 @router.get("/", response_model=List[Developer])
 def read_developers(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    developers = db.query(DeveloperModel).offset(skip).limit(limit).all()
-    return developers
+    def render():
+        developers, next_cursor = developer_crud.get_page(db, **page.as_kwargs())
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+        return developer_serializer.dump_many(developers), headers
+
+    return cached_read(request, developer_crud.source_tables(page.include), render)
 
 @router.post("/", response_model=Developer)
 def create_developer(
@@ -27,23 +38,28 @@ def create_developer(
     db_developer = DeveloperModel(**developer.dict())
     db.add(db_developer)
     db.commit()
+    reference_cache.invalidate(DeveloperModel.__tablename__)
     db.refresh(db_developer)
     return db_developer
 
 @router.get("/{developer_id}", response_model=Developer)
 def read_developer(
-    developer_id: int,
+    developer_id: UUID,
+    request: Request,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    developer = db.query(DeveloperModel).filter(DeveloperModel.id == developer_id).first()
-    if developer is None:
-        raise HTTPException(status_code=404, detail="Developer not found")
-    return developer
+    def render():
+        developer = db.query(DeveloperModel).filter(DeveloperModel.id == developer_id).first()
+        if developer is None:
+            raise HTTPException(status_code=404, detail="Developer not found")
+        return developer_serializer.dump_one(developer), last_modified_header(developer.updated_at)
+
+    return cached_read(request, developer_crud.source_tables(), render)
 
 @router.put("/{developer_id}", response_model=Developer)
 def update_developer(
-    developer_id: int,
+    developer_id: UUID,
     developer: DeveloperUpdate,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -57,12 +73,13 @@ def update_developer(
         setattr(db_developer, field, value)
     
     db.commit()
+    reference_cache.invalidate(DeveloperModel.__tablename__)
     db.refresh(db_developer)
     return db_developer
 
 @router.delete("/{developer_id}", response_model=Developer)
 def delete_developer(
-    developer_id: int,
+    developer_id: UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -72,4 +89,5 @@ def delete_developer(
     
     db.delete(developer)
     db.commit()
+    reference_cache.invalidate(DeveloperModel.__tablename__)
     return developer
@@ -1,21 +1,23 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.crud.crud_employee import employee_crud
+from app.crud.crud_employee import employee as employee_crud
 from app.schemas.employee import Employee, EmployeeCreate, EmployeeUpdate
-from app.api.deps import get_current_admin, get_current_user
+from app.api.deps import PageParams, get_page_params, get_current_admin, get_current_user, invalidate_principal, set_next_cursor
 
 router = APIRouter()
 
 @router.get("/", response_model=List[Employee])
 def read_employees(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
-    employees = employee_crud.get_multi(db, skip=skip, limit=limit)
+    employees, next_cursor = employee_crud.get_page(db, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
     return employees
 
 @router.post("/", response_model=Employee)
@@ -40,7 +42,7 @@ def create_employee(
 
 @router.get("/{employee_id}", response_model=Employee)
 def read_employee(
-    employee_id: int,
+    employee_id: UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -51,7 +53,7 @@ def read_employee(
 
 @router.put("/{employee_id}", response_model=Employee)
 def update_employee(
-    employee_id: int,
+    employee_id: UUID,
     employee: EmployeeUpdate,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
@@ -59,15 +61,20 @@ def update_employee(
     db_employee = employee_crud.get(db, id=employee_id)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return employee_crud.update(db=db, db_obj=db_employee, obj_in=employee)
+    updated = employee_crud.update(db=db, db_obj=db_employee, obj_in=employee)
+    invalidate_principal(updated.user_id)
+    return updated
 
 @router.delete("/{employee_id}", response_model=Employee)
 def delete_employee(
-    employee_id: int,
+    employee_id: UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
     db_employee = employee_crud.get(db, id=employee_id)
     if db_employee is None:
         raise HTTPException(status_code=404, detail="Employee not found")
-    return employee_crud.delete(db=db, id=employee_id)
+    user_id = db_employee.user_id
+    deleted = employee_crud.remove(db=db, id=employee_id)
+    invalidate_principal(user_id)
+    return deleted
@@ -1,38 +1,44 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.enquiry import Enquiry
-from app.schemas.enquiry import EnquiryCreate, EnquiryUpdate
-from app.api.deps import get_current_user
+from app.crud.crud_enquiry import enquiry_crud
+from app.schemas.enquiry import EnquiryCreate, EnquiryDetail, EnquiryResponse, EnquiryUpdate
+from app.api.serializers import Serializer
+from app.api.export import export_response
+from app.api.deps import ExportParams, PageParams, get_export_params, get_page_params, get_current_user, set_next_cursor
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
+ENQUIRY_INCLUDES = {"assignee": "assignee_name"}
+enquiry_list = Serializer(
+    EnquiryDetail, default_fields=enquiry_crud.list_fields, include_fields=ENQUIRY_INCLUDES
+)
+enquiry_detail = Serializer(EnquiryDetail, include_fields=ENQUIRY_INCLUDES)
+
+@router.get("/", response_model=List[EnquiryResponse])
 def read_enquiries(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    enquiries = db.query(Enquiry).offset(skip).limit(limit).all()
-    return [
-        {
-            "id": e.id,
-            "subject": e.subject,
-            "enquiry_type": e.enquiry_type,
-            "status": e.status,
-            "customer_name": e.customer_name,
-            "customer_email": e.customer_email,
-            "customer_phone": e.customer_phone,
-            "budget": float(e.budget) if e.budget else None,
-            "assigned_employee_id": e.assigned_employee_id,
-            "is_active": e.is_active
-        }
-        for e in enquiries
-    ]
+    enquiries, next_cursor = enquiry_crud.get_page(db, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
+    return enquiry_list.many(enquiries, include=page.include, fields=page.fields, response=response)
 
-@router.post("/", response_model=dict)
+@router.get("/export")
+def export_enquiries(
+    params: ExportParams = Depends(get_export_params),
+    current_user = Depends(get_current_user)
+):
+    return export_response(
+        enquiry_crud, params.format, filename="enquiries",
+        sort=params.sort, filters=params.filters
+    )
+
+@router.post("/", response_model=EnquiryDetail)
 def create_enquiry(
     enquiry: EnquiryCreate,
     db: Session = Depends(get_db),
@@ -42,42 +48,21 @@ def create_enquiry(
     db.add(db_enquiry)
     db.commit()
     db.refresh(db_enquiry)
-    return {
-        "id": db_enquiry.id,
-        "subject": db_enquiry.subject,
-        "enquiry_type": db_enquiry.enquiry_type,
-        "status": db_enquiry.status,
-        "customer_name": db_enquiry.customer_name,
-        "customer_email": db_enquiry.customer_email,
-        "customer_phone": db_enquiry.customer_phone,
-        "budget": float(db_enquiry.budget) if db_enquiry.budget else None,
-        "assigned_employee_id": db_enquiry.assigned_employee_id,
-        "is_active": db_enquiry.is_active
-    }
+    return enquiry_detail.one(db_enquiry)
 
-@router.get("/{enquiry_id}", response_model=dict)
+@router.get("/{enquiry_id}", response_model=EnquiryDetail)
 def read_enquiry(
     enquiry_id: int,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    enquiry = db.query(Enquiry).filter(Enquiry.id == enquiry_id).first()
+    enquiry = enquiry_crud.get(db, id=enquiry_id, include=include)
     if enquiry is None:
         raise HTTPException(status_code=404, detail="Enquiry not found")
-    return {
-        "id": enquiry.id,
-        "subject": enquiry.subject,
-        "enquiry_type": enquiry.enquiry_type,
-        "status": enquiry.status,
-        "customer_name": enquiry.customer_name,
-        "customer_email": enquiry.customer_email,
-        "customer_phone": enquiry.customer_phone,
-        "budget": float(enquiry.budget) if enquiry.budget else None,
-        "assigned_employee_id": enquiry.assigned_employee_id,
-        "is_active": enquiry.is_active
-    }
+    return enquiry_detail.one(enquiry, include=include)
 
-@router.put("/{enquiry_id}", response_model=dict)
+@router.put("/{enquiry_id}", response_model=EnquiryDetail)
 def update_enquiry(
     enquiry_id: int,
     enquiry: EnquiryUpdate,
@@ -94,18 +79,7 @@ def update_enquiry(
     
     db.commit()
     db.refresh(db_enquiry)
-    return {
-        "id": db_enquiry.id,
-        "subject": db_enquiry.subject,
-        "enquiry_type": db_enquiry.enquiry_type,
-        "status": db_enquiry.status,
-        "customer_name": db_enquiry.customer_name,
-        "customer_email": db_enquiry.customer_email,
-        "customer_phone": db_enquiry.customer_phone,
-        "budget": float(db_enquiry.budget) if db_enquiry.budget else None,
-        "assigned_employee_id": db_enquiry.assigned_employee_id,
-        "is_active": db_enquiry.is_active
-    }
+    return enquiry_detail.one(db_enquiry)
 
 @router.delete("/{enquiry_id}")
 def delete_enquiry(
@@ -0,0 +1,212 @@
+from dataclasses import asdict
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.responses import RedirectResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.database import get_db
+from app.core.config import settings
+from app.crud.crud_document import document_crud
+from app.models.document import Document
+from app.models.employee import UserRole
+from app.schemas.document import (
+    DocumentAttach, DocumentCreate, DocumentResponse, DocumentWithURL, DownloadURL, UploadRequest, UploadTicket
+)
+from app.schemas.job import JobResponse
+from app.api.deps import PageParams, get_page_params, get_current_user, set_job_location, set_next_cursor
+from app.services.job_handlers import STORAGE_DELETE
+from app.services.jobs import job_queue
+from app.services.storage import (
+    FileTooLarge, get_storage, object_key, signed_download_urls, signed_url_cache, upload_token, verify_upload_token
+)
+
+router = APIRouter()
+
+# Both services expose upload_stream / presigned_upload /
+# presigned_download_url(s) / object_size / delete_object
+storage = get_storage()
+
+DEFAULT_MIME_TYPE = "application/octet-stream"
+
+def _get_document(db: Session, document_id: UUID) -> Document:
+    document = db.query(Document).filter(Document.id == document_id).first()
+    if document is None:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return document
+
+def _check_can_modify(current_user, document: Document) -> None:
+    if current_user.role != UserRole.ADMIN and str(document.uploaded_by) != str(current_user.id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+def _save(db: Session, document: Document) -> Document:
+    db.add(document)
+    db.commit()
+    db.refresh(document)
+    return document
+
+@router.get("/", response_model=List[DocumentWithURL])
+def read_documents(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Documents, e.g. ``?entity_type=project&entity_id=<id>``, with URLs.
+
+    The download URLs for the whole page come from one batched signing
+    call (and signed_url_cache), not one storage request per document.
+    """
+    documents, next_cursor = document_crud.get_page(db, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
+    urls = signed_download_urls(storage, [document.file_path for document in documents])
+    items = []
+    for document in documents:
+        item = DocumentWithURL.model_validate(document)
+        item.url, item.url_expires_in = urls.get(document.file_path, (None, None))
+        items.append(item)
+    return items
+
+@router.post("/upload", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
+async def upload_document(
+    file: UploadFile = File(...),
+    entity_type: Optional[str] = Form(None),
+    entity_id: Optional[UUID] = Form(None),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Upload through the API, streamed to storage in chunks.
+
+    Prefer POST /uploads for large files: the bytes then go straight to
+    storage instead of through this worker.
+    """
+    key = object_key(file.filename, entity_type)
+    content_type = file.content_type or DEFAULT_MIME_TYPE
+    try:
+        size = await storage.upload_stream(file, key, content_type)
+    except FileTooLarge as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
+    document = Document(
+        name=file.filename or "file",
+        file_path=key,
+        file_size=size,
+        mime_type=content_type,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        uploaded_by=current_user.id,
+    )
+    try:
+        document = await run_in_threadpool(_save, db, document)
+    except Exception:
+        await storage.delete_object(key)
+        raise
+    return DocumentResponse.model_validate(document)
+
+@router.post("/uploads", response_model=UploadTicket)
+def create_upload(
+    upload: UploadRequest,
+    current_user = Depends(get_current_user)
+):
+    """Presigned direct-to-storage upload; register the file with POST / after"""
+    key = object_key(upload.name, upload.entity_type)
+    ticket = storage.presigned_upload(
+        key, upload.mime_type or DEFAULT_MIME_TYPE, settings.FILE_URL_EXPIRE_SECONDS
+    )
+    return UploadTicket(
+        key=key, upload_token=upload_token(key, current_user.id, ticket.expires_in), **asdict(ticket)
+    )
+
+def _is_registered(db: Session, key: str) -> bool:
+    return db.query(Document.id).filter(Document.file_path == key).first() is not None
+
+@router.post("/", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
+async def register_document(
+    document: DocumentCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    # Only keys issued to this user by POST /uploads; anything else in the
+    # bucket is not theirs to register (or to have deleted as oversized)
+    if not verify_upload_token(document.upload_token, document.key, current_user.id):
+        raise HTTPException(status_code=403, detail="Invalid or expired upload token")
+    if await run_in_threadpool(_is_registered, db, document.key):
+        raise HTTPException(status_code=409, detail="File is already registered")
+    size = await run_in_threadpool(storage.object_size, document.key)
+    if size is None:
+        raise HTTPException(status_code=400, detail="File has not been uploaded")
+    if size > settings.FILE_MAX_BYTES:
+        # Supabase signed upload URLs carry no size limit of their own
+        await run_in_threadpool(
+            job_queue.enqueue, db, STORAGE_DELETE, {"key": document.key}, created_by=current_user.id
+        )
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(FileTooLarge(settings.FILE_MAX_BYTES)),
+        )
+    db_document = Document(
+        name=document.name,
+        file_path=document.key,
+        file_size=size,
+        mime_type=document.mime_type,
+        entity_type=document.entity_type,
+        entity_id=document.entity_id,
+        uploaded_by=current_user.id,
+    )
+    return DocumentResponse.model_validate(await run_in_threadpool(_save, db, db_document))
+
+@router.get("/{document_id}", response_model=DocumentResponse)
+def read_document(
+    document_id: UUID,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    return _get_document(db, document_id)
+
+@router.get("/{document_id}/download", response_model=DownloadURL)
+def download_document(
+    document_id: UUID,
+    redirect: bool = True,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Short-lived signed storage URL; by default a redirect to it"""
+    document = _get_document(db, document_id)
+    url = storage.presigned_download_url(
+        document.file_path, settings.FILE_URL_EXPIRE_SECONDS, filename=document.name.replace('"', "")
+    )
+    if redirect:
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    return DownloadURL(url=url, expires_in=settings.FILE_URL_EXPIRE_SECONDS)
+
+@router.put("/{document_id}/attachment", response_model=DocumentResponse)
+def attach_document(
+    document_id: UUID,
+    attachment: DocumentAttach,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    document = _get_document(db, document_id)
+    _check_can_modify(current_user, document)
+    document.entity_type = attachment.entity_type
+    document.entity_id = attachment.entity_id
+    return _save(db, document)
+
+@router.delete("/{document_id}", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def delete_document(
+    document_id: UUID,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Delete the record now; the stored file is removed by a background job"""
+    document = _get_document(db, document_id)
+    _check_can_modify(current_user, document)
+    db.delete(document)
+    # Same transaction: the file is queued for removal iff the row is gone
+    job = job_queue.enqueue(
+        db, STORAGE_DELETE, {"key": document.file_path}, created_by=current_user.id, commit=False
+    )
+    db.commit()
+    signed_url_cache.invalidate(document.file_path)
+    set_job_location(response, job)
+    return job
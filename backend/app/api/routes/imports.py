@@ -0,0 +1,93 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
+from fastapi.responses import RedirectResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.database import get_db
+from app.api.deps import get_current_user, set_job_location
+from app.core.config import settings
+from app.models.employee import UserRole
+from app.models.job import Job, JobStatus
+from app.schemas.document import DownloadURL
+from app.schemas.job import JobResponse
+from app.services.csv_import import IMPORT_TARGETS
+from app.services.job_handlers import CSV_IMPORT
+from app.services.jobs import job_queue
+from app.services.storage import FileTooLarge, get_storage, object_key
+
+router = APIRouter()
+
+# Shared with the workers that run the imports
+storage = get_storage()
+
+def _get_job(db: Session, job_id: UUID, current_user) -> Job:
+    job = db.query(Job).filter(Job.id == job_id, Job.kind == CSV_IMPORT).first()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    if current_user.role != UserRole.ADMIN and str(job.created_by) != str(current_user.id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return job
+
+@router.post("/{resource}", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_import(
+    resource: str,
+    response: Response,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Store the CSV and queue its import; progress is in the job's result"""
+    target = IMPORT_TARGETS.get(resource)
+    if target is None:
+        raise HTTPException(status_code=404, detail=f"Unknown import resource: {resource}")
+    if target.admin_only and current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    defaults = {}
+    if resource == "leads" and current_user.role != UserRole.ADMIN:
+        defaults["assigned_employee_id"] = str(current_user.id)
+    filename = file.filename or "upload.csv"
+    key = object_key(filename, "imports")
+    try:
+        await storage.upload_stream(file, key, "text/csv")
+    except FileTooLarge as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
+    payload = {"resource": resource, "filename": filename, "key": key, "defaults": defaults}
+    try:
+        # Inserted rows are not rolled back, so a failed import is not retried
+        job = await run_in_threadpool(
+            job_queue.enqueue, db, CSV_IMPORT, payload, created_by=current_user.id, max_attempts=1
+        )
+    except Exception:
+        await storage.delete_object(key)
+        raise
+    set_job_location(response, job)
+    return job
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def read_import_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    return _get_job(db, job_id, current_user)
+
+@router.get("/jobs/{job_id}/errors", response_model=DownloadURL)
+def download_import_errors(
+    job_id: UUID,
+    redirect: bool = True,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Signed URL of the rejected rows as CSV; by default a redirect to it"""
+    job = _get_job(db, job_id, current_user)
+    if job.status not in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+        raise HTTPException(status_code=409, detail="Import has not finished")
+    key = (job.result or {}).get("error_report_key")
+    if not key:
+        raise HTTPException(status_code=404, detail="Import has no rejected rows")
+    url = storage.presigned_download_url(
+        key, settings.FILE_URL_EXPIRE_SECONDS, filename=f"import-{job.id}-errors.csv"
+    )
+    if redirect:
+        return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+    return DownloadURL(url=url, expires_in=settings.FILE_URL_EXPIRE_SECONDS)
@@ -1,36 +1,50 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict, List
+from uuid import UUID
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.inventory import InventoryItem
-from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse
-from app.api.deps import get_current_user, get_current_admin
+from app.crud.crud_inventory import inventory_crud
+from app.schemas.inventory import InventoryCreate, InventoryUpdate, InventoryResponse, InventorySummary
+from app.api.serializers import Serializer
+from app.api.conditional import conditional_get
+from app.api.export import export_response
+from app.core.cache import reference_cache
+from app.api.deps import ExportParams, PageParams, check_bulk_size, get_export_params, get_page_params, parse_bulk_rows, get_current_user, get_current_admin, set_next_cursor
+from app.schemas.bulk import BulkDelete, BulkResult
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
+inventory_list = Serializer(
+    InventoryResponse, default_fields=inventory_crud.list_fields, include_fields={"project": "project_name"}
+)
+inventory_detail = Serializer(InventoryResponse, include_fields={"project": "project_name"})
+
+@router.get("/", response_model=List[InventorySummary])
 def read_inventory(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    items = db.query(InventoryItem).offset(skip).limit(limit).all()
-    return [
-        {
-            "id": item.id,
-            "unit_number": item.unit_number,
-            "property_type": item.property_type,
-            "status": item.status,
-            "area": float(item.area) if item.area else None,
-            "price": float(item.price) if item.price else None,
-            "bedrooms": item.bedrooms,
-            "bathrooms": item.bathrooms,
-            "project_id": item.project_id,
-            "is_active": item.is_active
-        }
-        for item in items
-    ]
+    fingerprint = inventory_crud.fingerprint(db, filters=page.filters, include=page.include)
+    not_modified = conditional_get(request, response, fingerprint)
+    if not_modified is not None:
+        return not_modified
+    items, next_cursor = inventory_crud.get_page(db, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
+    return inventory_list.many(items, include=page.include, fields=page.fields, response=response)
+
+@router.get("/export")
+def export_inventory(
+    params: ExportParams = Depends(get_export_params),
+    current_user = Depends(get_current_user)
+):
+    return export_response(
+        inventory_crud, params.format, filename="inventory",
+        sort=params.sort, filters=params.filters
+    )
 
 @router.post("/", response_model=InventoryResponse)
 def create_inventory_item(
@@ -41,23 +55,65 @@ def create_inventory_item(
     db_item = InventoryItem(**item.model_dump())
     db.add(db_item)
     db.commit()
+    # Inventory feeds the cached project reads (include=inventory_count)
+    reference_cache.invalidate(InventoryItem.__tablename__)
     db.refresh(db_item)
-    return db_item
+    return inventory_detail.one(db_item)
+
+@router.post("/bulk", response_model=BulkResult)
+def create_inventory_items_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    objs_in, result = parse_bulk_rows(rows, InventoryCreate)
+    result = inventory_crud.create_many(db, objs_in=objs_in, result=result)
+    reference_cache.invalidate(InventoryItem.__tablename__)
+    return result
+
+@router.put("/bulk", response_model=BulkResult)
+def update_inventory_items_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    objs_in, result = parse_bulk_rows(rows, InventoryUpdate, with_id=True)
+    result = inventory_crud.update_many(db, objs_in=objs_in, result=result)
+    reference_cache.invalidate(InventoryItem.__tablename__)
+    return result
+
+@router.post("/bulk/delete", response_model=BulkResult)
+def delete_inventory_items_bulk(
+    body: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    check_bulk_size(len(body.ids))
+    ids = dict(enumerate(body.ids))
+    result = inventory_crud.remove_many(db, ids=ids)
+    reference_cache.invalidate(InventoryItem.__tablename__)
+    return result
 
 @router.get("/{item_id}", response_model=InventoryResponse)
 def read_inventory_item(
-    item_id: int,
+    item_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
+    fingerprint = inventory_crud.fingerprint(db, id=item_id)
+    not_modified = conditional_get(request, response, fingerprint, last_modified=True)
+    if not_modified is not None:
+        return not_modified
     item = db.query(InventoryItem).filter(InventoryItem.id == item_id).first()
     if item is None:
         raise HTTPException(status_code=404, detail="Inventory item not found")
-    return item
+    return inventory_detail.one(item, response=response)
 
 @router.put("/{item_id}", response_model=InventoryResponse)
 def update_inventory_item(
-    item_id: int,
+    item_id: UUID,
     item: InventoryUpdate,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
@@ -71,12 +127,13 @@ def update_inventory_item(
         setattr(db_item, field, value)
     
     db.commit()
+    reference_cache.invalidate(InventoryItem.__tablename__)
     db.refresh(db_item)
-    return db_item
+    return inventory_detail.one(db_item)
 
 @router.delete("/{item_id}")
 def delete_inventory_item(
-    item_id: int,
+    item_id: UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
@@ -86,4 +143,5 @@ def delete_inventory_item(
     
     db.delete(item)
     db.commit()
+    reference_cache.invalidate(InventoryItem.__tablename__)
     return {"message": "Inventory item deleted successfully"}
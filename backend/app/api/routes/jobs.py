@@ -0,0 +1,40 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.crud.crud_job import job_crud
+from app.models.employee import UserRole
+from app.models.job import Job
+from app.schemas.job import JobResponse
+from app.api.deps import PageParams, get_page_params, get_current_user, set_next_cursor
+
+router = APIRouter()
+
+@router.get("/", response_model=List[JobResponse])
+def read_jobs(
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    # Employees see the jobs they started
+    query = db.query(Job)
+    if current_user.role != UserRole.ADMIN:
+        query = query.filter(Job.created_by == current_user.id)
+    jobs, next_cursor = job_crud.get_page(db, query=query, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
+    return jobs
+
+@router.get("/{job_id}", response_model=JobResponse)
+def read_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if current_user.role != UserRole.ADMIN and str(job.created_by) != str(current_user.id):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return job
\ No newline at end of file
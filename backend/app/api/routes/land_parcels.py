@@ -1,38 +1,42 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, Dict, List
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.land_parcel import LandParcel
-from app.schemas.land_parcel import LandParcelCreate, LandParcelUpdate
-from app.api.deps import get_current_user, get_current_admin
+from app.crud.crud_land_parcel import land_parcel_crud
+from app.schemas.land_parcel import LandParcelCreate, LandParcelDetail, LandParcelResponse, LandParcelUpdate
+from app.api.serializers import Serializer
+from app.api.export import export_response
+from app.api.deps import ExportParams, PageParams, check_bulk_size, get_export_params, get_page_params, parse_bulk_rows, get_current_user, get_current_admin, set_next_cursor
+from app.schemas.bulk import BulkDelete, BulkResult
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
+land_parcel_list = Serializer(LandParcelDetail, default_fields=land_parcel_crud.list_fields)
+land_parcel_detail = Serializer(LandParcelDetail)
+
+@router.get("/", response_model=List[LandParcelResponse])
 def read_land_parcels(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    parcels = db.query(LandParcel).offset(skip).limit(limit).all()
-    return [
-        {
-            "id": p.id,
-            "survey_number": p.survey_number,
-            "village": p.village,
-            "district": p.district,
-            "state": p.state,
-            "area_acres": float(p.area_acres) if p.area_acres else None,
-            "land_type": p.land_type,
-            "owner_name": p.owner_name,
-            "total_value": float(p.total_value) if p.total_value else None,
-            "is_active": p.is_active
-        }
-        for p in parcels
-    ]
+    parcels, next_cursor = land_parcel_crud.get_page(db, **page.as_kwargs())
+    set_next_cursor(response, next_cursor)
+    return land_parcel_list.many(parcels, fields=page.fields, response=response)
+
+@router.get("/export")
+def export_land_parcels(
+    params: ExportParams = Depends(get_export_params),
+    current_user = Depends(get_current_user)
+):
+    return export_response(
+        land_parcel_crud, params.format, filename="land_parcels",
+        sort=params.sort, filters=params.filters
+    )
 
-@router.post("/", response_model=dict)
+@router.post("/", response_model=LandParcelDetail)
 def create_land_parcel(
     parcel: LandParcelCreate,
     db: Session = Depends(get_db),
@@ -42,20 +46,37 @@ def create_land_parcel(
     db.add(db_parcel)
     db.commit()
     db.refresh(db_parcel)
-    return {
-        "id": db_parcel.id,
-        "survey_number": db_parcel.survey_number,
-        "village": db_parcel.village,
-        "district": db_parcel.district,
-        "state": db_parcel.state,
-        "area_acres": float(db_parcel.area_acres) if db_parcel.area_acres else None,
-        "land_type": db_parcel.land_type,
-        "owner_name": db_parcel.owner_name,
-        "total_value": float(db_parcel.total_value) if db_parcel.total_value else None,
-        "is_active": db_parcel.is_active
-    }
+    return land_parcel_detail.one(db_parcel)
+
+@router.post("/bulk", response_model=BulkResult)
+def create_land_parcels_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    objs_in, result = parse_bulk_rows(rows, LandParcelCreate)
+    return land_parcel_crud.create_many(db, objs_in=objs_in, result=result)
+
+@router.put("/bulk", response_model=BulkResult)
+def update_land_parcels_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    objs_in, result = parse_bulk_rows(rows, LandParcelUpdate, with_id=True)
+    return land_parcel_crud.update_many(db, objs_in=objs_in, result=result)
+
+@router.post("/bulk/delete", response_model=BulkResult)
+def delete_land_parcels_bulk(
+    body: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    check_bulk_size(len(body.ids))
+    ids = dict(enumerate(body.ids))
+    return land_parcel_crud.remove_many(db, ids=ids)
 
-@router.get("/{parcel_id}", response_model=dict)
+@router.get("/{parcel_id}", response_model=LandParcelDetail)
 def read_land_parcel(
     parcel_id: int,
     db: Session = Depends(get_db),
@@ -64,20 +85,9 @@ def read_land_parcel(
     parcel = db.query(LandParcel).filter(LandParcel.id == parcel_id).first()
     if parcel is None:
         raise HTTPException(status_code=404, detail="Land parcel not found")
-    return {
-        "id": parcel.id,
-        "survey_number": parcel.survey_number,
-        "village": parcel.village,
-        "district": parcel.district,
-        "state": parcel.state,
-        "area_acres": float(parcel.area_acres) if parcel.area_acres else None,
-        "land_type": parcel.land_type,
-        "owner_name": parcel.owner_name,
-        "total_value": float(parcel.total_value) if parcel.total_value else None,
-        "is_active": parcel.is_active
-    }
+    return land_parcel_detail.one(parcel)
 
-@router.put("/{parcel_id}", response_model=dict)
+@router.put("/{parcel_id}", response_model=LandParcelDetail)
 def update_land_parcel(
     parcel_id: int,
     parcel: LandParcelUpdate,
@@ -94,18 +104,7 @@ def update_land_parcel(
     
     db.commit()
     db.refresh(db_parcel)
-    return {
-        "id": db_parcel.id,
-        "survey_number": db_parcel.survey_number,
-        "village": db_parcel.village,
-        "district": db_parcel.district,
-        "state": db_parcel.state,
-        "area_acres": float(db_parcel.area_acres) if db_parcel.area_acres else None,
-        "land_type": db_parcel.land_type,
-        "owner_name": db_parcel.owner_name,
-        "total_value": float(db_parcel.total_value) if db_parcel.total_value else None,
-        "is_active": db_parcel.is_active
-    }
+    return land_parcel_detail.one(db_parcel)
 
 @router.delete("/{parcel_id}")
 def delete_land_parcel(
@@ -1,27 +1,49 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.crud.crud_lead import lead
+from app.models.lead import Lead as LeadModel
 from app.schemas.lead import Lead, LeadCreate, LeadUpdate
-from app.api.deps import get_current_user, get_current_admin
+from app.api.export import export_response
+from app.api.deps import ExportParams, PageParams, check_bulk_size, get_export_params, get_page_params, parse_bulk_rows, get_current_user, get_current_admin, set_next_cursor
+from app.schemas.bulk import BulkDelete, BulkResult
 from app.models.employee import UserRole
 
 router = APIRouter()
 
+def lead_scope(current_user):
+    # Non-admins only export or bulk-edit the leads assigned to them
+    if current_user.role == UserRole.ADMIN:
+        return None
+    return LeadModel.assigned_employee_id == current_user.id
+
 @router.get("/", response_model=List[Lead])
 def read_leads(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     if current_user.role == UserRole.ADMIN:
-        leads = lead.get_multi(db, skip=skip, limit=limit)
+        leads, next_cursor = lead.get_page(db, **page.as_kwargs())
     else:
-        leads = lead.get_by_employee(db, employee_id=str(current_user.id), skip=skip, limit=limit)
+        leads, next_cursor = lead.get_page_by_employee(
+            db, employee_id=current_user.id, **page.as_kwargs()
+        )
+    set_next_cursor(response, next_cursor)
     return leads
 
+@router.get("/export")
+def export_leads(
+    params: ExportParams = Depends(get_export_params),
+    current_user = Depends(get_current_user)
+):
+    return export_response(
+        lead, params.format, filename="leads",
+        sort=params.sort, filters=params.filters, scope=lead_scope(current_user)
+    )
+
 @router.post("/", response_model=Lead)
 def create_lead(
     lead_in: LeadCreate,
@@ -29,16 +51,49 @@ def create_lead(
     current_user = Depends(get_current_user)
 ):
     if current_user.role != UserRole.ADMIN and not lead_in.assigned_employee_id:
-        lead_in.assigned_employee_id = str(current_user.id)
+        lead_in.assigned_employee_id = current_user.id
     return lead.create(db=db, obj_in=lead_in)
 
+@router.post("/bulk", response_model=BulkResult)
+def create_leads_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    objs_in, result = parse_bulk_rows(rows, LeadCreate)
+    if current_user.role != UserRole.ADMIN:
+        for obj_in in objs_in.values():
+            if not obj_in.assigned_employee_id:
+                obj_in.assigned_employee_id = current_user.id
+    return lead.create_many(db, objs_in=objs_in, result=result)
+
+@router.put("/bulk", response_model=BulkResult)
+def update_leads_bulk(
+    rows: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    objs_in, result = parse_bulk_rows(rows, LeadUpdate, with_id=True)
+    return lead.update_many(db, objs_in=objs_in, scope=lead_scope(current_user), result=result)
+
+@router.post("/bulk/delete", response_model=BulkResult)
+def delete_leads_bulk(
+    body: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    check_bulk_size(len(body.ids))
+    ids = dict(enumerate(body.ids))
+    return lead.remove_many(db, ids=ids, scope=lead_scope(current_user))
+
 @router.get("/{lead_id}", response_model=Lead)
 def read_lead(
     lead_id: str,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    db_lead = lead.get(db, id=lead_id)
+    db_lead = lead.get(db, id=lead_id, include=include)
     if db_lead is None:
         raise HTTPException(status_code=404, detail="Lead not found")
     
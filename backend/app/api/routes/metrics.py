@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.api.deps import get_current_admin, principal_cache
+from app.core.cache import reference_cache
+from app.core.config import settings
+from app.core.instrumentation import request_metrics
+from app.core.profiling import profiler
+from app.core.security import token_cache
+from app.database import get_pool_stats
+from app.schemas.profiling import ProfilingSettings
+from app.services.storage import signed_url_cache
+
+router = APIRouter()
+
+@router.get("/principal-cache")
+def read_principal_cache_stats(current_user = Depends(get_current_admin)):
+    return principal_cache.stats()
+
+@router.get("/token-cache")
+def read_token_cache_stats(current_user = Depends(get_current_admin)):
+    return token_cache.stats()
+
+@router.get("/reference-cache")
+def read_reference_cache_stats(current_user = Depends(get_current_admin)):
+    return reference_cache.stats()
+
+@router.get("/signed-url-cache")
+def read_signed_url_cache_stats(current_user = Depends(get_current_admin)):
+    return signed_url_cache.stats()
+
+@router.get("/slow-queries")
+def read_slow_queries(current_user = Depends(get_current_admin)):
+    return request_metrics.slow_queries()
+
+@router.get("/db-pool")
+def read_db_pool_stats(current_user = Depends(get_current_admin)):
+    return get_pool_stats()
+
+@router.get("/profiling")
+def read_profiling(current_user = Depends(get_current_admin)):
+    return {**profiler.state(), "profiles": profiler.store.list()}
+
+@router.put("/profiling")
+def update_profiling(
+    profiling: ProfilingSettings,
+    current_user = Depends(get_current_admin)
+):
+    if not settings.PROFILE_DIR and settings.WEB_CONCURRENCY > 1:
+        # Only the worker serving this request would see the change
+        raise HTTPException(
+            status_code=409,
+            detail="Set PROFILE_DIR to adjust profiling with more than one worker",
+        )
+    profiler.configure(sample_rate=profiling.sample_rate, path_prefix=profiling.path_prefix)
+    return profiler.state()
+
+@router.get("/profiling/{profile_id}", response_class=PlainTextResponse)
+def download_profile(profile_id: str, current_user = Depends(get_current_admin)):
+    """Folded stacks for flamegraph.pl, inferno or speedscope"""
+    folded = profiler.store.get(profile_id)
+    if folded is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        folded, headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'}
+    )
\ No newline at end of file
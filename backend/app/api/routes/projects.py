@@ -1,38 +1,50 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate
-from app.api.deps import get_current_user, get_current_admin
+from app.crud.crud_project import project_crud
+from app.schemas.project import ProjectCreate, ProjectDetail, ProjectResponse, ProjectUpdate
+from app.api.serializers import Serializer
+from app.api.conditional import cached_read, last_modified_header
+from app.api.export import export_response
+from app.api.deps import ExportParams, PageParams, get_export_params, get_page_params, get_current_user, get_current_admin, NEXT_CURSOR_HEADER
+from app.core.cache import reference_cache
 
 router = APIRouter()
 
-@router.get("/", response_model=List[dict])
+PROJECT_INCLUDES = {"developer": "developer", "inventory_count": "inventory_count"}
+project_list = Serializer(
+    ProjectDetail, default_fields=project_crud.list_fields, include_fields=PROJECT_INCLUDES
+)
+project_detail = Serializer(ProjectDetail, include_fields=PROJECT_INCLUDES)
+
+@router.get("/", response_model=List[ProjectResponse])
 def read_projects(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    page: PageParams = Depends(get_page_params),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    projects = db.query(Project).offset(skip).limit(limit).all()
-    return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "project_type": p.project_type,
-            "status": p.status,
-            "location": p.location,
-            "total_area": float(p.total_area) if p.total_area else None,
-            "total_units": p.total_units,
-            "price_per_sqft": float(p.price_per_sqft) if p.price_per_sqft else None,
-            "developer_id": p.developer_id,
-            "is_active": p.is_active
-        }
-        for p in projects
-    ]
+    def render():
+        projects, next_cursor = project_crud.get_page(db, **page.as_kwargs())
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+        return project_list.dump_many(projects, include=page.include, fields=page.fields), headers
+
+    return cached_read(request, project_crud.source_tables(page.include), render)
+
+@router.get("/export")
+def export_projects(
+    params: ExportParams = Depends(get_export_params),
+    current_user = Depends(get_current_user)
+):
+    return export_response(
+        project_crud, params.format, filename="projects",
+        sort=params.sort, filters=params.filters
+    )
 
-@router.post("/", response_model=dict)
+@router.post("/", response_model=ProjectDetail)
 def create_project(
     project: ProjectCreate,
     db: Session = Depends(get_db),
@@ -41,45 +53,31 @@ def create_project(
     db_project = Project(**project.model_dump())
     db.add(db_project)
     db.commit()
+    reference_cache.invalidate(Project.__tablename__)
     db.refresh(db_project)
-    return {
-        "id": db_project.id,
-        "name": db_project.name,
-        "project_type": db_project.project_type,
-        "status": db_project.status,
-        "location": db_project.location,
-        "total_area": float(db_project.total_area) if db_project.total_area else None,
-        "total_units": db_project.total_units,
-        "price_per_sqft": float(db_project.price_per_sqft) if db_project.price_per_sqft else None,
-        "developer_id": db_project.developer_id,
-        "is_active": db_project.is_active
-    }
+    return project_detail.one(db_project)
 
-@router.get("/{project_id}", response_model=dict)
+@router.get("/{project_id}", response_model=ProjectDetail)
 def read_project(
-    project_id: int,
+    project_id: UUID,
+    request: Request,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if project is None:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return {
-        "id": project.id,
-        "name": project.name,
-        "project_type": project.project_type,
-        "status": project.status,
-        "location": project.location,
-        "total_area": float(project.total_area) if project.total_area else None,
-        "total_units": project.total_units,
-        "price_per_sqft": float(project.price_per_sqft) if project.price_per_sqft else None,
-        "developer_id": project.developer_id,
-        "is_active": project.is_active
-    }
+    def render():
+        project = project_crud.get(db, id=project_id, include=include)
+        if project is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        # Included rows change independently of the project's updated_at
+        headers = {} if include else last_modified_header(project.updated_at)
+        return project_detail.dump_one(project, include=include), headers
+
+    return cached_read(request, project_crud.source_tables(include), render)
 
-@router.put("/{project_id}", response_model=dict)
+@router.put("/{project_id}", response_model=ProjectDetail)
 def update_project(
-    project_id: int,
+    project_id: UUID,
     project: ProjectUpdate,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
@@ -93,23 +91,13 @@ def update_project(
         setattr(db_project, field, value)
     
     db.commit()
+    reference_cache.invalidate(Project.__tablename__)
     db.refresh(db_project)
-    return {
-        "id": db_project.id,
-        "name": db_project.name,
-        "project_type": db_project.project_type,
-        "status": db_project.status,
-        "location": db_project.location,
-        "total_area": float(db_project.total_area) if db_project.total_area else None,
-        "total_units": db_project.total_units,
-        "price_per_sqft": float(db_project.price_per_sqft) if db_project.price_per_sqft else None,
-        "developer_id": db_project.developer_id,
-        "is_active": db_project.is_active
-    }
+    return project_detail.one(db_project)
 
 @router.delete("/{project_id}")
 def delete_project(
-    project_id: int,
+    project_id: UUID,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin)
 ):
@@ -119,4 +107,5 @@ def delete_project(
     
     db.delete(project)
     db.commit()
+    reference_cache.invalidate(Project.__tablename__)
     return {"message": "Project deleted successfully"}
@@ -0,0 +1,32 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.api.deps import get_current_user, include_names
+from app.api.routes.leads import lead_scope
+from app.services.search import MIN_QUERY_LENGTH, SEARCH_TARGETS, search_service
+
+router = APIRouter()
+
+@router.get("/")
+def search(
+    q: str = Query(..., min_length=MIN_QUERY_LENGTH, max_length=100),
+    types: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    kinds = include_names(types)
+    unknown = kinds - SEARCH_TARGETS.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported search type: {', '.join(sorted(unknown))}"
+        )
+    return search_service.search(
+        db,
+        q.strip(),
+        types=sorted(kinds) or None,
+        limit=limit,
+        # Same visibility as the lead list: employees only find their leads
+        scopes={"lead": lead_scope(current_user)},
+    )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Response, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.api.deps import get_current_user, get_current_admin, set_job_location
+from app.models.employee import UserRole
+from app.schemas.job import JobResponse
+from app.services.job_handlers import STATS_REFRESH
+from app.services.jobs import job_queue
+from app.services.stats import stats_service
+
+router = APIRouter()
+
+@router.get("/dashboard")
+def read_dashboard(
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    # Employees see lead figures for the leads assigned to them
+    employee_id = None if current_user.role == UserRole.ADMIN else current_user.id
+    return stats_service.dashboard(db, employee_id=employee_id)
+
+@router.post("/refresh", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def refresh_stats(
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin)
+):
+    # A concurrent refresh of every view can take minutes on large tables
+    job = job_queue.enqueue(db, STATS_REFRESH, created_by=current_user.id)
+    set_job_location(response, job)
+    return job
@@ -0,0 +1,109 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from app.api.deps import include_names
+
+JSON_MEDIA_TYPE = "application/json"
+# Field subsets requested through fields= are compiled on first use
+MAX_CACHED_PROJECTIONS = 128
+
+class Serializer:
+    """Renders ORM rows straight to JSON bytes through a response schema.
+
+    The validators/serializers are built once per field set by
+    pydantic-core, and the handler returns the finished Response, so
+    FastAPI's second response_model validation and jsonable_encoder pass
+    are skipped. Only the fields being output are read from the row, so
+    columns deferred by the list projection and relationships that were
+    not eager-loaded are never touched.
+
+    ``include_fields`` maps an include= name to the schema field it fills;
+    those are only output when requested. ``default_fields`` is the field
+    set used without fields= (default: every other schema field).
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        *,
+        default_fields: Optional[Iterable[str]] = None,
+        include_fields: Optional[Dict[str, str]] = None
+    ):
+        self.schema = schema
+        self._include_fields = include_fields or {}
+        optional = set(self._include_fields.values())
+        self._default_fields = frozenset(
+            default_fields if default_fields is not None
+            else (name for name in schema.model_fields if name not in optional)
+        )
+        self._adapters: Dict[FrozenSet[str], Tuple[TypeAdapter, TypeAdapter]] = {}
+        self._adapters_for(self._output_fields(None, None))
+
+    def _output_fields(self, fields: Optional[str], include: Optional[str]) -> FrozenSet[str]:
+        names = set(include_names(fields) or self._default_fields)
+        names.add("id")
+        names.update(
+            self._include_fields[name] for name in include_names(include) if name in self._include_fields
+        )
+        return frozenset(name for name in names if name in self.schema.model_fields)
+
+    def _adapters_for(self, names: FrozenSet[str]) -> Tuple[TypeAdapter, TypeAdapter]:
+        adapters = self._adapters.get(names)
+        if adapters is None:
+            if names == frozenset(self.schema.model_fields):
+                model = self.schema
+            else:
+                model = create_model(
+                    self.schema.__name__,
+                    __config__=ConfigDict(from_attributes=True),
+                    **{
+                        name: (info.annotation, info)
+                        for name, info in self.schema.model_fields.items()
+                        if name in names
+                    },
+                )
+            adapters = (TypeAdapter(model), TypeAdapter(List[model]))
+            if len(self._adapters) >= MAX_CACHED_PROJECTIONS:
+                self._adapters.clear()
+            self._adapters[names] = adapters
+        return adapters
+
+    @staticmethod
+    def _response(body: bytes, status_code: int, response: Optional[Response]) -> Response:
+        rendered = Response(content=body, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+        if response is not None:
+            # Headers set on the injected Response (e.g. X-Next-Cursor) are
+            # not merged by FastAPI when a Response is returned directly.
+            rendered.headers.raw.extend(response.headers.raw)
+        return rendered
+
+    def dump_one(self, obj: Any, *, include: Optional[str] = None, fields: Optional[str] = None) -> bytes:
+        adapter, _ = self._adapters_for(self._output_fields(fields, include))
+        return adapter.dump_json(adapter.validate_python(obj, from_attributes=True))
+
+    def dump_many(
+        self, rows: Iterable[Any], *, include: Optional[str] = None, fields: Optional[str] = None
+    ) -> bytes:
+        _, adapter = self._adapters_for(self._output_fields(fields, include))
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    def one(
+        self,
+        obj: Any,
+        *,
+        include: Optional[str] = None,
+        fields: Optional[str] = None,
+        status_code: int = 200,
+        response: Optional[Response] = None
+    ) -> Response:
+        return self._response(self.dump_one(obj, include=include, fields=fields), status_code, response)
+
+    def many(
+        self,
+        rows: Iterable[Any],
+        *,
+        include: Optional[str] = None,
+        fields: Optional[str] = None,
+        response: Optional[Response] = None
+    ) -> Response:
+        return self._response(self.dump_many(rows, include=include, fields=fields), 200, response)
@@ -0,0 +1,231 @@
+import asyncio
+import functools
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+from sqlalchemy.util import await_only
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class LocalCacheBackend:
+    """In-process byte store for ReferenceCache (LRU + TTL, per worker)"""
+
+    def __init__(self, maxsize: int = 1024):
+        self._data = TTLCache(maxsize=maxsize)
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return [self._data.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data.set(key, value, ttl=ttl)
+
+    def get_counters(self, keys: Sequence[str]) -> List[int]:
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class RedisCacheBackend:
+    """ReferenceCache store shared by all workers.
+
+    ``client`` only needs redis-py's mget/set/incr, so tests can pass a
+    fake (e.g. fakeredis.FakeRedis()) instead of a server connection.
+
+    With DB_ASYNC, handlers run inside AsyncSession.run_sync on the event
+    loop; from there each round trip is handed to the threadpool so a
+    slow Redis never blocks other requests.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("REFERENCE_CACHE_URL needs the redis package (pip install redis)") from exc
+        # Short timeouts: a slow cache must not be slower than the database
+        return cls(redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.25))
+
+    def _call(self, method: str, *args, **kwargs):
+        call = functools.partial(getattr(self.client, method), *args, **kwargs)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return call()
+        # On the loop: we are in run_sync's greenlet, which can await
+        return await_only(run_in_threadpool(call))
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return list(self._call("mget", keys))
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._call("set", key, value, ex=max(1, int(ttl)))
+
+    def get_counters(self, keys: Sequence[str]) -> List[int]:
+        return [int(value or 0) for value in self._call("mget", keys)]
+
+    def incr(self, key: str) -> int:
+        return self._call("incr", key)
+
+
+class ReferenceCache:
+    """Read-through cache for rarely-changing reads, invalidated per table.
+
+    Entry keys embed a generation counter for every table the value was
+    built from; ``invalidate(table)`` bumps the counter, so all pages,
+    filters and includes over that table miss at once without scanning
+    keys. A load racing a write is stored under the old generation, which
+    nothing reads any more. Backend errors degrade to uncached loads.
+    """
+
+    def __init__(self, backend, ttl: float = 60.0, prefix: str = "ref"):
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self.errors = 0
+
+    def _generation_key(self, table: str) -> str:
+        return f"{self.prefix}:gen:{table}"
+
+    def _record(self, counts: Dict[str, int], name: str) -> None:
+        with self._lock:
+            counts[name] = counts.get(name, 0) + 1
+
+    def _failed(self, action: str) -> None:
+        with self._lock:
+            self.errors += 1
+        logger.warning("Reference cache %s failed", action, exc_info=True)
+
+    def get_or_load(self, tables: Sequence[str], key: str, load: Callable[[], bytes]) -> bytes:
+        """Cached value for ``key`` built from ``tables``, else ``load()``"""
+        if self.ttl <= 0:
+            return load()
+        name = tables[0]
+        try:
+            generations = self.backend.get_counters([self._generation_key(t) for t in tables])
+            versions = ":".join(f"{t}.{g}" for t, g in zip(tables, generations))
+            digest = hashlib.sha1(key.encode()).hexdigest()
+            entry_key = f"{self.prefix}:{versions}:{digest}"
+            value = self.backend.get_many([entry_key])[0]
+        except Exception:
+            self._failed("read")
+            return load()
+        if value is not None:
+            self._record(self._hits, name)
+            return value
+        self._record(self._misses, name)
+        value = load()
+        try:
+            self.backend.set(entry_key, value, self.ttl)
+        except Exception:
+            self._failed("write")
+        return value
+
+    def invalidate(self, *tables: str) -> None:
+        """Call after committing a write to any of ``tables``"""
+        for table in tables:
+            try:
+                self.backend.incr(self._generation_key(table))
+            except Exception:
+                self._failed("invalidate")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            names = sorted(set(self._hits) | set(self._misses))
+            tables = {}
+            for name in names:
+                hits, misses = self._hits.get(name, 0), self._misses.get(name, 0)
+                tables[name] = {"hits": hits, "misses": misses, "hit_ratio": hits / (hits + misses)}
+            hits, misses = sum(self._hits.values()), sum(self._misses.values())
+            return {
+                "backend": type(self.backend).__name__,
+                "ttl": self.ttl,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "errors": self.errors,
+                "tables": tables,
+            }
+
+
+def _reference_backend():
+    if settings.REFERENCE_CACHE_URL:
+        return RedisCacheBackend.from_url(settings.REFERENCE_CACHE_URL)
+    return LocalCacheBackend(maxsize=settings.REFERENCE_CACHE_MAX_SIZE)
+
+# Rendered developer/project reads. With the local backend each worker only
+# sees its own invalidations, so others may serve stale data for up to the
+# TTL; point REFERENCE_CACHE_URL at Redis to share them.
+reference_cache = ReferenceCache(_reference_backend(), ttl=settings.REFERENCE_CACHE_TTL_SECONDS)
@@ -11,14 +11,142 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
-    # Supabase Configuration
-    SUPABASE_URL: str
-    SUPABASE_KEY: str
-    SUPABASE_SERVICE_ROLE_KEY: str
+    # Threads for blocking auth work (Supabase Auth calls, bcrypt) awaited
+    # by the async auth routes
+    AUTH_WORKERS: int = 8
+    
+    # Verified-claims cache for bearer tokens (entries never outlive exp)
+    TOKEN_CACHE_MAX_SIZE: int = 4096
+    TOKEN_CACHE_MAX_TTL_SECONDS: int = 300
+    
+    # Supabase Configuration (checked when the client is first used, so the
+    # app imports without them)
+    SUPABASE_URL: str = ""
+    SUPABASE_KEY: str = ""
+    SUPABASE_SERVICE_ROLE_KEY: str = ""
+
+    # Accept Supabase Auth access tokens directly, verified locally with the
+    # project's JWT secret (HS256) or its cached JWKS (RS256/ES256); login
+    # then returns the Supabase token instead of issuing one of our own.
+    SUPABASE_JWT_VERIFY: bool = False
+    SUPABASE_JWT_SECRET: str = ""
+    SUPABASE_JWT_AUDIENCE: str = "authenticated"
+    SUPABASE_JWKS_CACHE_SECONDS: int = 600
     
     # Database URL (Supabase PostgreSQL)
     DATABASE_URL: str
     
+    # Opt-in asyncio stack (AsyncEngine + async route handlers). When
+    # ASYNC_DATABASE_URL is unset it is derived from DATABASE_URL. The sync
+    # handlers are reused: each body runs in AsyncSession.run_sync on the
+    # event loop, so ORM hydration, validation and serialization are CPU
+    # spent on the loop rather than in threadpool workers. Keep that in mind
+    # when comparing requests/sec against the sync stack.
+    DB_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Connection pool. DB_PGBOUNCER hands pooling to a pgbouncer running in
+    # transaction mode: no client-side pool, no prepared statement cache and
+    # the statement timeout is applied per transaction with SET LOCAL.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 300
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 disables the timeout
+    DB_PGBOUNCER: bool = False
+
+    # Lifespan (app.main). Startup opens DB_POOL_WARM_CONNECTIONS pooled
+    # connections (at most DB_POOL_SIZE), runs the hot list queries on them
+    # and creates the storage clients. Shutdown answers new requests with 503
+    # and gives in-flight ones (and running CSV imports) SHUTDOWN_DRAIN_SECONDS
+    # before the engines are disposed; keep it below the orchestrator's kill
+    # timeout.
+    STARTUP_WARMUP: bool = True
+    DB_POOL_WARM_CONNECTIONS: int = 2
+    SHUTDOWN_DRAIN_SECONDS: float = 20.0
+
+    # Bulk endpoints: batches above the threshold are loaded with COPY
+    BULK_MAX_ROWS: int = 5000
+    BULK_COPY_THRESHOLD: int = 1000
+
+    # CSV imports (run as jobs by the worker): rows per validation batch /
+    # insert transaction, validation processes per worker process (0
+    # validates in the job thread) and how long error reports are kept
+    IMPORT_BATCH_SIZE: int = 500
+    IMPORT_WORKERS: int = 2
+    IMPORT_REPORT_RETENTION_SECONDS: int = 7 * 24 * 3600
+
+    # Background jobs (jobs table, run by ``python -m app.worker``). Failed
+    # attempts retry after up to JOB_RETRY_BASE_SECONDS * 2**(attempt - 1),
+    # capped at JOB_RETRY_MAX_SECONDS; a job locked longer than
+    # JOB_LOCK_TIMEOUT_SECONDS is assumed orphaned by a dead worker.
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 10.0
+    JOB_RETRY_MAX_SECONDS: float = 3600.0
+    JOB_LOCK_TIMEOUT_SECONDS: int = 600
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_WORKER_THREADS: int = 2
+
+    # Documents: STORAGE_BACKEND is "supabase" (Storage bucket
+    # STORAGE_BUCKET) or "s3" (AWS_BUCKET_NAME). Presigned URLs let clients
+    # move file bytes to/from storage without passing through the API.
+    STORAGE_BACKEND: str = "supabase"
+    STORAGE_BUCKET: str = "documents"
+    FILE_MAX_BYTES: int = 200 * 1024 * 1024
+    FILE_URL_EXPIRE_SECONDS: int = 900
+    # Signed download URLs are reused until this long before they expire
+    SIGNED_URL_MIN_REMAINING_SECONDS: int = 300
+    SIGNED_URL_CACHE_MAX_SIZE: int = 10000
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+
+    # S3 (AWS_S3_ENDPOINT_URL points at a local stand-in such as moto or
+    # MinIO); parts of S3_PART_SIZE (>= 5 MiB) upload S3_UPLOAD_CONCURRENCY
+    # at a time
+    AWS_ACCESS_KEY_ID: Optional[str] = None
+    AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    AWS_REGION: str = "ap-south-1"
+    AWS_BUCKET_NAME: str = ""
+    AWS_S3_ENDPOINT_URL: Optional[str] = None
+    S3_PART_SIZE: int = 8 * 1024 * 1024
+    S3_UPLOAD_CONCURRENCY: int = 4
+
+    # Dashboard summary views refresh interval (0 disables the scheduler)
+    STATS_REFRESH_SECONDS: int = 300
+
+    # Per-route latency / SQL / size metrics, served in Prometheus format
+    # at /metrics (Bearer METRICS_TOKEN when set). Statements slower than
+    # SLOW_QUERY_MS (0 disables) go to the app.slow_query log.
+    REQUEST_METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str = ""
+    SLOW_QUERY_MS: float = 500
+    SLOW_QUERY_MAX_STATEMENTS: int = 500
+
+    # On-demand profiling (see app.core.profiling): a PROFILE_SAMPLE_RATE
+    # fraction of requests under PROFILE_PATH_PREFIX, plus any request
+    # sending X-Profile-Token: PROFILE_TOKEN. Admins adjust the rate at
+    # /api/metrics/profiling. Profiles, and those adjustments, are kept in
+    # PROFILE_DIR so every worker on the host shares them; when it is empty
+    # they stay in memory and can only be adjusted with a single worker.
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_PATH_PREFIX: str = "/api/"
+    PROFILE_TOKEN: str = ""
+    PROFILE_INTERVAL_MS: float = 2.0
+    PROFILE_DIR: str = ""
+    PROFILE_MAX_STORED: int = 50
+    # Worker processes; uvicorn and gunicorn read the same variable
+    WEB_CONCURRENCY: int = 1
+    
+    # Reference-data read cache (developers/projects). Empty URL keeps it
+    # in-process; redis://... shares entries and invalidations between workers.
+    REFERENCE_CACHE_URL: str = ""
+    REFERENCE_CACHE_TTL_SECONDS: int = 60  # 0 disables the cache
+    REFERENCE_CACHE_MAX_SIZE: int = 1024
+    
+    # Authenticated principal cache (get_current_user)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+    
     # CORS Configuration
     ALLOWED_HOSTS: List[str] = ["http://localhost:3000", "http://localhost:5173"]
     
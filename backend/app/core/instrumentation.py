@@ -0,0 +1,204 @@
+import logging
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.core.metrics import Histogram, prometheus_labels, prometheus_histogram
+from app.database import async_engine, engine
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.slow_query")
+
+SQL_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 250)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+# Requests that matched no route share one label so bad URLs cannot
+# explode the number of series.
+UNMATCHED_ROUTE = "<unmatched>"
+
+@dataclass
+class RequestStats:
+    """Per-request accumulators, shared with threadpool workers via contextvars"""
+    scope: Dict[str, Any] = field(default_factory=dict)
+    sql_count: int = 0
+    db_seconds: float = 0.0
+
+    @property
+    def route(self) -> str:
+        # The router stores the matched route in the (shared) scope
+        route = self.scope.get("route")
+        return route.path if route is not None else UNMATCHED_ROUTE
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+class RouteMetrics:
+    """Histograms for one (method, route template)"""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.db_seconds = Histogram()
+        self.sql_count = Histogram(SQL_COUNT_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.statuses: Dict[int, int] = {}
+
+class RequestMetrics:
+    """Registry of RouteMetrics plus the slow-query aggregate"""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self._slow: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, stats: RequestStats, status: int, seconds: float, size: int) -> None:
+        key = (method, stats.route)
+        with self._lock:
+            route = self._routes.get(key)
+            if route is None:
+                route = self._routes[key] = RouteMetrics()
+            route.statuses[status] = route.statuses.get(status, 0) + 1
+        route.latency.observe(seconds)
+        route.db_seconds.observe(stats.db_seconds)
+        route.sql_count.observe(stats.sql_count)
+        route.response_bytes.observe(size)
+
+    def slow_query(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._slow.get(statement)
+            if entry is None:
+                if len(self._slow) >= settings.SLOW_QUERY_MAX_STATEMENTS:
+                    return
+                entry = self._slow[statement] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def slow_queries(self) -> List[Dict[str, object]]:
+        """Normalized slow statements, slowest total first"""
+        with self._lock:
+            rows = [
+                {"statement": statement, "count": count, "total_seconds": total, "max_seconds": worst}
+                for statement, (count, total, worst) in self._slow.items()
+            ]
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._slow.clear()
+
+    def prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            routes = [(key, route, dict(route.statuses)) for key, route in self._routes.items()]
+        series = (
+            ("http_request_duration_seconds", "Request latency", lambda r: r.latency),
+            ("http_request_db_seconds", "Time spent in SQL per request", lambda r: r.db_seconds),
+            ("http_request_sql_statements", "SQL statements per request", lambda r: r.sql_count),
+            ("http_response_size_bytes", "Response body size", lambda r: r.response_bytes),
+        )
+        lines: List[str] = []
+        for name, help_text, pick in series:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for (method, path), route, _ in routes:
+                lines += prometheus_histogram(name, pick(route), {"method": method, "route": path})
+        lines += ["# HELP http_requests_total Requests by status", "# TYPE http_requests_total counter"]
+        for (method, path), _, statuses in routes:
+            for status, count in sorted(statuses.items()):
+                labels = {"method": method, "route": path, "status": str(status)}
+                lines += [f"http_requests_total{{{prometheus_labels(labels)}}} {count}"]
+        lines += _pool_lines()
+        return "\n".join(lines) + "\n"
+
+def _pool_lines() -> List[str]:
+    name = "db_pool_wait_seconds"
+    lines = [f"# HELP {name} Time waiting for a pooled connection", f"# TYPE {name} histogram"]
+    engines = {"sync": engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    for label, bound in engines.items():
+        wait = getattr(bound.pool, "wait_seconds", None)
+        if wait is not None:
+            lines += prometheus_histogram(name, wait, {"engine": label})
+    return lines
+
+request_metrics = RequestMetrics()
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_statement(statement: str) -> str:
+    """Statement with literals and bind parameters replaced by ``?``"""
+    statement = _STRING.sub("?", statement)
+    statement = _PARAM.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _IN_LIST.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("query_start")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.sql_count += 1
+        stats.db_seconds += elapsed
+    threshold = settings.SLOW_QUERY_MS
+    if threshold and elapsed * 1000 >= threshold:
+        normalized = normalize_statement(statement)
+        request_metrics.slow_query(normalized, elapsed)
+        slow_query_logger.warning(
+            "slow query %.1fms route=%s: %s",
+            elapsed * 1000, stats.route if stats is not None else "-", normalized,
+        )
+
+def install_query_hooks() -> None:
+    """Time every statement on every engine (sync and async alike)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware recording RequestMetrics for each HTTP request.
+
+    Not a BaseHTTPMiddleware: that would buffer streaming responses and
+    run the app in a separate task, which loses the contextvar the SQL
+    hooks write to.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        status = 500
+        size = 0
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            request_metrics.observe(scope["method"], stats, status, time.perf_counter() - start, size)
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+DRAINING_BODY = json.dumps({"detail": "Server is shutting down"}).encode()
+
+class Lifecycle:
+    """Counts in-flight HTTP requests and switches the app to draining.
+
+    The server (uvicorn) stops listening on SIGTERM and lets open
+    requests finish before the lifespan shutdown runs; draining covers
+    what still arrives or runs after that, so the engines are only
+    disposed once no request can be using them. Only touched from the
+    event loop, so no lock is needed.
+    """
+
+    def __init__(self):
+        self.draining = False
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def started(self) -> None:
+        self.in_flight += 1
+        self._idle.clear()
+
+    def finished(self) -> None:
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Refuse new requests and wait for running ones; False on timeout"""
+        self.draining = True
+        if self.in_flight:
+            logger.info("Draining %d in-flight requests", self.in_flight)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Shutdown drain timed out with %d requests in flight", self.in_flight)
+            return False
+        return True
+
+lifecycle = Lifecycle()
+
+class DrainMiddleware:
+    """Tracks requests for Lifecycle; answers 503 once the app is draining.
+
+    The 503 carries ``Connection: close`` so keep-alive clients and load
+    balancers reconnect to another instance, and /health fails too.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if lifecycle.draining:
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(DRAINING_BODY)).encode()),
+                    (b"connection", b"close"),
+                    (b"retry-after", b"5"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": DRAINING_BODY})
+            return
+        lifecycle.started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            lifecycle.finished()
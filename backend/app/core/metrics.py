@@ -0,0 +1,97 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds, tuned for DB/HTTP latencies from sub-ms to ~10s.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram of durations in seconds"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+            self._max = 0.0
+
+    def _quantile(self, counts, q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th observation; the +Inf
+        # bucket reports the largest value seen.
+        if not self._count:
+            return None
+        rank = q * self._count
+        seen = 0
+        for bound, count in zip(self.buckets, counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self._max
+
+    def snapshot(self) -> Tuple[List[Tuple[float, int]], float, int]:
+        """(cumulative (upper bound, count) pairs, sum, count) in one read"""
+        with self._lock:
+            cumulative, running = [], 0
+            for bound, count in zip(self.buckets, self._counts):
+                running += count
+                cumulative.append((bound, running))
+            return cumulative, self._sum, self._count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            cumulative, running = {}, 0
+            for bound, count in zip(self.buckets, counts):
+                running += count
+                cumulative[str(bound)] = running
+            cumulative["+Inf"] = self._count
+            return {
+                "count": self._count,
+                "sum": self._sum,
+                "mean": self._sum / self._count if self._count else 0.0,
+                "max": self._max,
+                "p50": self._quantile(counts, 0.50),
+                "p95": self._quantile(counts, 0.95),
+                "p99": self._quantile(counts, 0.99),
+                "buckets": cumulative,
+            }
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def prometheus_histogram(name: str, histogram: Histogram, labels: Dict[str, str]) -> List[str]:
+    """Prometheus text-format sample lines for one labelled histogram"""
+    cumulative, total, count = histogram.snapshot()
+    base = prometheus_labels(labels)
+    prefix = f"{base}," if base else ""
+    lines = [f'{name}_bucket{{{prefix}le="{bound}"}} {running}' for bound, running in cumulative]
+    lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {count}')
+    lines.append(f"{name}_sum{{{base}}} {total}")
+    lines.append(f"{name}_count{{{base}}} {count}")
+    return lines
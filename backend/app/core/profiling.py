@@ -0,0 +1,283 @@
+import json
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "x-profile-token"
+# Stacks without a frame from the app package are idle threads (waiting in
+# the selector, a queue or the threadpool) and are not recorded.
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+# Sampling settings shared through PROFILE_DIR. Not .json, which is what
+# ProfileStore.list reads as profile metadata.
+SETTINGS_FILE = "profiler-settings"
+SETTINGS_RELOAD_SECONDS = 1.0
+
+_frame_names: Dict[Any, str] = {}
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    name = _frame_names.get(code)
+    if name is None:
+        filename = code.co_filename
+        for root in sys.path:
+            if root and filename.startswith(root):
+                filename = filename[len(root):].lstrip(os.sep)
+                break
+        name = _frame_names[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+    return name
+
+def _folded_stack(frame) -> Optional[str]:
+    names = []
+    in_app = False
+    while frame is not None:
+        in_app = in_app or frame.f_code.co_filename.startswith(APP_ROOT)
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    if not in_app:
+        return None
+    return ";".join(reversed(names))
+
+class StackSampler(threading.Thread):
+    """Samples every busy thread's stack into folded-stack counts.
+
+    A sampling profiler rather than cProfile: sync handlers run on
+    threadpool threads that cProfile, which hooks a single thread, would
+    not see. Other requests this worker serves at the same time show up
+    in the samples too.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        me = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = _folded_stack(frame)
+                if stack is not None:
+                    self.stacks[f"{names.get(ident, ident)};{stack}"] += 1
+            self.samples += 1
+
+    def stop(self) -> str:
+        """Stop sampling and return the profile in folded-stack format"""
+        self._stop_event.set()
+        self.join()
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+class ProfileStore:
+    """Keeps the newest PROFILE_MAX_STORED profiles.
+
+    With PROFILE_DIR set, profiles are files there (shared by the workers
+    on a host); otherwise they stay in this process.
+    """
+
+    def __init__(self):
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, profile_id: str, suffix: str) -> str:
+        return os.path.join(settings.PROFILE_DIR, f"{profile_id}{suffix}")
+
+    def save(self, meta: Dict[str, Any], folded: str) -> None:
+        if not settings.PROFILE_DIR:
+            with self._lock:
+                self._memory[meta["id"]] = {"meta": meta, "folded": folded}
+                while len(self._memory) > settings.PROFILE_MAX_STORED:
+                    self._memory.pop(next(iter(self._memory)))
+            return
+        os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+        with open(self._path(meta["id"], ".folded"), "w") as out:
+            out.write(folded)
+        with open(self._path(meta["id"], ".json"), "w") as out:
+            json.dump(meta, out)
+        for old in self.list()[settings.PROFILE_MAX_STORED:]:
+            for suffix in (".json", ".folded"):
+                try:
+                    os.remove(self._path(old["id"], suffix))
+                except FileNotFoundError:
+                    pass
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Profile metadata, newest first"""
+        if not settings.PROFILE_DIR:
+            with self._lock:
+                metas = [entry["meta"] for entry in self._memory.values()]
+        else:
+            metas = []
+            if os.path.isdir(settings.PROFILE_DIR):
+                for name in os.listdir(settings.PROFILE_DIR):
+                    if name.endswith(".json"):
+                        try:
+                            with open(os.path.join(settings.PROFILE_DIR, name)) as source:
+                                metas.append(json.load(source))
+                        except (OSError, ValueError):
+                            continue
+        return sorted(metas, key=lambda meta: meta["created_at"], reverse=True)
+
+    def get(self, profile_id: str) -> Optional[str]:
+        """Folded stacks for ``profile_id``, or None"""
+        if not settings.PROFILE_DIR:
+            with self._lock:
+                entry = self._memory.get(profile_id)
+            return entry["folded"] if entry else None
+        try:
+            uuid.UUID(profile_id)
+            with open(self._path(profile_id, ".folded")) as source:
+                return source.read()
+        except (ValueError, OSError):
+            return None
+
+class Profiler:
+    """Decides which requests to profile; adjustable at runtime by admins.
+
+    ``sample_rate`` and ``path_prefix`` start from PROFILE_SAMPLE_RATE and
+    PROFILE_PATH_PREFIX. With PROFILE_DIR set, ``configure`` saves them
+    there and every worker picks them up within SETTINGS_RELOAD_SECONDS;
+    otherwise they only apply to this process. A request carrying the
+    PROFILE_TOKEN in the X-Profile-Token header is always profiled. At
+    most one request per worker is profiled at a time.
+    """
+
+    def __init__(self):
+        self.sample_rate = settings.PROFILE_SAMPLE_RATE
+        self.path_prefix = settings.PROFILE_PATH_PREFIX
+        self.store = ProfileStore()
+        self._busy = threading.Lock()
+        self._checked_at = float("-inf")
+        self._settings_mtime: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or bool(settings.PROFILE_TOKEN)
+
+    def _settings_path(self) -> str:
+        return os.path.join(settings.PROFILE_DIR, SETTINGS_FILE)
+
+    def refresh(self) -> None:
+        """Adopt settings another worker saved, checking at most once a second"""
+        if not settings.PROFILE_DIR:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < SETTINGS_RELOAD_SECONDS:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self._settings_path()).st_mtime_ns
+            if mtime == self._settings_mtime:
+                return
+            with open(self._settings_path()) as source:
+                saved = json.load(source)
+            sample_rate, path_prefix = float(saved["sample_rate"]), str(saved["path_prefix"])
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError):
+            logger.warning("Could not read profiler settings", exc_info=True)
+            return
+        self._settings_mtime = mtime
+        self.sample_rate, self.path_prefix = sample_rate, path_prefix
+
+    def configure(self, *, sample_rate: float, path_prefix: str) -> None:
+        if settings.PROFILE_DIR:
+            os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+            # Written whole, then renamed, so readers never see half a file
+            partial = f"{self._settings_path()}.{os.getpid()}"
+            with open(partial, "w") as out:
+                json.dump({"sample_rate": sample_rate, "path_prefix": path_prefix}, out)
+            os.replace(partial, self._settings_path())
+            self._settings_mtime = os.stat(self._settings_path()).st_mtime_ns
+        self.sample_rate = sample_rate
+        self.path_prefix = path_prefix
+
+    def state(self) -> Dict[str, Any]:
+        self.refresh()
+        return {
+            "sample_rate": self.sample_rate,
+            "path_prefix": self.path_prefix,
+            "header_trigger": bool(settings.PROFILE_TOKEN),
+            "interval_ms": settings.PROFILE_INTERVAL_MS,
+        }
+
+    def wants(self, scope) -> bool:
+        if settings.PROFILE_TOKEN:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER.encode():
+                    return secrets.compare_digest(value, settings.PROFILE_TOKEN.encode())
+        if self.sample_rate <= 0 or not scope["path"].startswith(self.path_prefix):
+            return False
+        return random.random() < self.sample_rate
+
+    async def profile(self, app, scope, receive, send) -> None:
+        if not self._busy.acquire(blocking=False):
+            await app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        sampler = StackSampler(settings.PROFILE_INTERVAL_MS / 1000)
+        created_at = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            await app(scope, receive, send_wrapper)
+        finally:
+            folded = sampler.stop()
+            self._busy.release()
+            route = scope.get("route")
+            meta = {
+                "id": str(uuid.uuid4()),
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route.path if route is not None else None,
+                "status": status,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                "samples": sampler.samples,
+                "pid": os.getpid(),
+                "created_at": created_at,
+            }
+            try:
+                await run_in_threadpool(self.store.save, meta, folded)
+            except OSError:
+                logger.exception("Could not store profile %s", meta["id"])
+
+profiler = Profiler()
+
+class ProfilingMiddleware:
+    """Profiles the requests Profiler.wants; a single check for the rest"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        profiler.refresh()
+        if profiler.enabled and profiler.wants(scope):
+            await profiler.profile(self.app, scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
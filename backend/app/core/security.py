@@ -1,13 +1,62 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, TypeVar
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
-from supabase import Client
+from app.core.cache import TTLCache
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from supabase import Client
+
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+_auth_executor: Optional[ThreadPoolExecutor] = None
+_auth_executor_lock = threading.Lock()
+
+def _get_auth_executor() -> ThreadPoolExecutor:
+    global _auth_executor
+    with _auth_executor_lock:
+        if _auth_executor is None:
+            _auth_executor = ThreadPoolExecutor(
+                max_workers=settings.AUTH_WORKERS, thread_name_prefix="auth"
+            )
+        return _auth_executor
+
+async def run_auth_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Await a blocking auth call (Supabase Auth, bcrypt, DB) in the auth pool.
+
+    The pool is separate from the request threadpool and bounded by
+    AUTH_WORKERS, so a login storm queues here instead of stalling the
+    event loop or starving the sync route handlers.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_auth_executor(), functools.partial(fn, *args, **kwargs))
+
+def shutdown_auth_executor() -> None:
+    global _auth_executor
+    with _auth_executor_lock:
+        if _auth_executor is not None:
+            _auth_executor.shutdown(wait=True)
+            _auth_executor = None
+
+# Decoded claims keyed by sha256(token); each entry expires with its token,
+# so a hit skips signature verification without outliving ``exp``.
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_MAX_TTL_SECONDS)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -19,24 +68,116 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# bcrypt is deliberately slow (~0.25s per call); call these through
+# run_auth_blocking from async code.
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+class SupabaseKeys:
+    """Verification keys for access tokens issued by Supabase Auth.
+
+    Projects on the legacy shared secret set SUPABASE_JWT_SECRET (HS256);
+    asymmetric signing keys (RS256/ES256) are fetched from the project's
+    JWKS endpoint and cached for SUPABASE_JWKS_CACHE_SECONDS. An unknown
+    ``kid`` triggers at most one refetch per minute, for key rotation.
+    """
+
+    REFETCH_INTERVAL = 60.0
+
+    def __init__(self):
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def issuer(self) -> str:
+        return f"{settings.SUPABASE_URL.rstrip('/')}/auth/v1"
+
+    def _fetch(self) -> None:
+        with urllib.request.urlopen(f"{self.issuer}/.well-known/jwks.json", timeout=5) as response:
+            jwks = json.load(response)
+        self._keys = {key.get("kid"): key for key in jwks.get("keys", [])}
+        self._fetched_at = time.monotonic()
+
+    def warm(self) -> None:
+        """Fetch the JWKS now rather than on the first Supabase token"""
+        with self._lock:
+            self._fetch()
+
+    def key_for(self, header: Dict[str, Any]) -> Any:
+        if header.get("alg") == "HS256":
+            if not settings.SUPABASE_JWT_SECRET:
+                raise JWTError("SUPABASE_JWT_SECRET is not configured")
+            return settings.SUPABASE_JWT_SECRET
+        kid = header.get("kid")
+        with self._lock:
+            age = time.monotonic() - self._fetched_at
+            stale = age > settings.SUPABASE_JWKS_CACHE_SECONDS
+            if stale or (kid not in self._keys and age > self.REFETCH_INTERVAL):
+                try:
+                    self._fetch()
+                except (OSError, ValueError) as exc:
+                    # Keep serving the keys we have while Auth is unreachable
+                    logger.warning("Could not fetch Supabase JWKS: %s", exc)
+            key = self._keys.get(kid)
+        if key is None:
+            raise JWTError(f"Unknown signing key {kid!r}")
+        return key
+
+supabase_keys = SupabaseKeys()
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    if settings.SUPABASE_JWT_VERIFY:
+        claims = jwt.get_unverified_claims(token)
+        if claims.get("iss") == supabase_keys.issuer:
+            header = jwt.get_unverified_header(token)
+            return jwt.decode(
+                token,
+                supabase_keys.key_for(header),
+                algorithms=["HS256", "RS256", "ES256"],
+                audience=settings.SUPABASE_JWT_AUDIENCE,
+                issuer=supabase_keys.issuer,
+            )
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
 def verify_token(token: str) -> Dict[str, Any]:
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    """Claims of a valid token; the returned dict is shared, do not mutate it.
+
+    A cache miss verifies the signature, which may fetch the JWKS; from
+    async code use verify_token_async.
+    """
+    key = _token_cache_key(token)
+    payload = token_cache.get(key)
+    if payload is not None:
         return payload
+    try:
+        payload = _decode_token(token)
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    expires_in = payload["exp"] - time.time() if "exp" in payload else token_cache.ttl
+    if expires_in > 0:
+        token_cache.set(key, payload, ttl=min(expires_in, token_cache.ttl))
+    return payload
+
+async def verify_token_async(token: str) -> Dict[str, Any]:
+    """verify_token for the event loop: cache hits stay on the loop, while
+    signature checks and JWKS fetches run in the auth pool"""
+    payload = token_cache.get(_token_cache_key(token))
+    if payload is not None:
+        return payload
+    return await run_auth_blocking(verify_token, token)
 
-def authenticate_with_supabase(supabase: Client, email: str, password: str) -> Optional[Dict]:
+def authenticate_with_supabase(supabase: "Client", email: str, password: str) -> Optional[Dict]:
     """Authenticate user with Supabase Auth"""
     try:
         response = supabase.auth.sign_in_with_password({
@@ -54,7 +195,7 @@ def authenticate_with_supabase(supabase: Client, email: str, password: str) -> O
     except Exception as e:
         return None
 
-def create_user_with_supabase(supabase: Client, email: str, password: str, metadata: Dict = None) -> Optional[Dict]:
+def create_user_with_supabase(supabase: "Client", email: str, password: str, metadata: Dict = None) -> Optional[Dict]:
     """Create user with Supabase Auth"""
     try:
         response = supabase.auth.sign_up({
@@ -1,24 +1,337 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import base64
+import enum
+import io
+import json
+import operator
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, load_only
+from app.core.config import settings
 from app.models.base import BaseModel as DBBaseModel
+from app.schemas.bulk import BulkResult, BulkRowError
 
 ModelType = TypeVar("ModelType", bound=DBBaseModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
-class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+class InvalidListQuery(ValueError):
+    pass
+
+class InvalidCursor(InvalidListQuery):
+    pass
+
+class InvalidFilter(InvalidListQuery):
+    pass
+
+RANGE_OPERATORS = {
+    "gte": operator.ge,
+    "lte": operator.le,
+    "gt": operator.gt,
+    "lt": operator.lt,
+}
+
+def _dump_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+def _coerce_value(column, raw: str) -> Any:
+    """Parse a query-string or cursor value into ``column``'s Python type"""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return raw
+    if python_type is bool:
+        if raw.lower() in ("true", "1"):
+            return True
+        if raw.lower() in ("false", "0"):
+            return False
+        raise ValueError(raw)
+    if python_type in (date, datetime):
+        return python_type.fromisoformat(raw)
+    if python_type is str and "\x00" in raw:
+        # Postgres text cannot hold NUL; the driver would fail the query
+        raise ValueError(raw)
+    value = python_type(raw)
+    if python_type is Decimal:
+        # NaN/Infinity, or more integer digits than the column can hold
+        # (Postgres rejects huge literals as an overflow)
+        precision, scale = column.type.precision, column.type.scale or 0
+        if not value.is_finite() or (precision and value.adjusted() >= precision - scale):
+            raise ValueError(raw)
+    return value
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    raw = json.dumps({"s": sort, "k": [_dump_value(v) for v in values]}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[str, List[Any]]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        return data["s"], list(data["k"])
+    except (ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+class _Keyset:
+    """Ordering and seek predicate for one ``sort`` spec.
+
+    Rows are ordered by the sort column (NULLs last), then (created_at, id)
+    in the same direction so the order is total and a cursor can resume it.
+    """
+
+    def __init__(self, model, sort_column, descending: bool, sort: str):
+        self.sort = sort
+        self.sort_column = sort_column
+        self.descending = descending
+        self.tiebreak = (model.created_at, model.id)
+        self.columns = ((sort_column,) if sort_column is not None else ()) + self.tiebreak
+
+    def order_by(self) -> list:
+        direction = operator.methodcaller("desc" if self.descending else "asc")
+        order = [direction(column) for column in self.tiebreak]
+        if self.sort_column is not None:
+            order.insert(0, direction(self.sort_column).nulls_last())
+        return order
+
+    def after(self, cursor: str):
+        sort, raw_values = decode_cursor(cursor)
+        if sort != self.sort or len(raw_values) != len(self.columns):
+            raise InvalidCursor("Cursor does not match the requested sort")
+        try:
+            values = [
+                None if raw is None else _coerce_value(column, raw)
+                for column, raw in zip(self.columns, raw_values)
+            ]
+        except (ValueError, TypeError, ArithmeticError) as exc:
+            raise InvalidCursor("Invalid cursor") from exc
+        seek = operator.lt if self.descending else operator.gt
+        tiebreak = seek(tuple_(*self.tiebreak), tuple_(*values[-2:]))
+        if self.sort_column is None:
+            return tiebreak
+        value = values[0]
+        if value is None:
+            return and_(self.sort_column.is_(None), tiebreak)
+        return or_(
+            seek(self.sort_column, value),
+            and_(self.sort_column == value, tiebreak),
+            self.sort_column.is_(None),
+        )
+
+    def next_cursor(self, rows: list, limit: int) -> Tuple[list, Optional[str]]:
+        # One extra row is fetched to tell whether another page exists.
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor(self.sort, [getattr(last, c.key) for c in self.columns])
+
+def _db_error_detail(exc: Exception) -> str:
+    return str(getattr(exc, "orig", None) or exc).strip().splitlines()[0]
+
+def _copy_text(value: Any) -> str:
+    # COPY ... FROM STDIN text format: \N is NULL, backslash escapes
+    if value is None:
+        return "\\N"
+    text = str(value)
+    return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+class ListQueryMixin:
+    """Whitelisted filter/sort DSL for list endpoints.
+
+    Query parameters map onto the whitelists:
+
+    - ``field=a`` or ``field=a,b`` -- equality / membership (``filter_fields``)
+    - ``field__gte=x`` (also ``gt``, ``lte``, ``lt``) -- ranges (``range_fields``)
+    - ``sort=field`` or ``sort=-field`` -- ordering (``sort_fields``)
+    - ``fields=a,b`` -- columns to load (any column; ``list_fields`` by default)
+    """
+    model: Any
+    # include= name -> factory for the loader option that eager-loads it
+    includes: Dict[str, Callable[[], Any]] = {}
+    # include= name -> model whose rows feed it, for conditional GET fingerprints
+    include_models: Dict[str, Any] = {}
+    filter_fields: Tuple[str, ...] = ("is_active",)
+    range_fields: Tuple[str, ...] = ("created_at",)
+    sort_fields: Tuple[str, ...] = ("created_at",)
+    # Columns loaded for list pages; empty loads whole rows and disables fields=
+    list_fields: Tuple[str, ...] = ()
+
+    def _include_names(self, include: Optional[str]) -> List[str]:
+        names = [name for name in (include or "").split(",") if name]
+        unknown = [name for name in names if name not in self.includes]
+        if unknown:
+            raise InvalidFilter(f"Unsupported include: {', '.join(unknown)}")
+        return names
+
+    def include_options(self, include: Optional[str]) -> list:
+        return [self.includes[name]() for name in self._include_names(include)]
+
+    def load_options(self, fields: Optional[str], keyset: _Keyset) -> list:
+        names = [name for name in (fields or "").split(",") if name]
+        if names and not self.list_fields:
+            raise InvalidFilter("fields is not supported for this resource")
+        columns = self.model.__table__.columns
+        unknown = [name for name in names if name not in columns]
+        if unknown:
+            raise InvalidFilter(f"Unsupported field: {', '.join(unknown)}")
+        if not names and not self.list_fields:
+            return []
+        # The keyset columns are always loaded to build the next cursor
+        keys = dict.fromkeys([*(names or self.list_fields), *(c.key for c in keyset.columns)])
+        return [load_only(*(getattr(self.model, key) for key in keys))]
+
+    def apply_filters(self, query, filters: Optional[Dict[str, str]]):
+        for key, raw in (filters or {}).items():
+            name, _, op = key.partition("__")
+            if op:
+                if name not in self.range_fields or op not in RANGE_OPERATORS:
+                    raise InvalidFilter(f"Unsupported filter: {key}")
+                column = getattr(self.model, name)
+                query = query.filter(RANGE_OPERATORS[op](column, self._filter_value(column, raw)))
+            else:
+                if name not in self.filter_fields:
+                    raise InvalidFilter(f"Unsupported filter: {key}")
+                column = getattr(self.model, name)
+                values = [self._filter_value(column, v) for v in raw.split(",")]
+                query = query.filter(column == values[0] if len(values) == 1 else column.in_(values))
+        return query
+
+    def _filter_value(self, column, raw: str) -> Any:
+        try:
+            return _coerce_value(column, raw)
+        except (ValueError, TypeError, ArithmeticError) as exc:
+            raise InvalidFilter(f"Invalid value for {column.key}: {raw}") from exc
+
+    def _keyset(self, sort: Optional[str]) -> _Keyset:
+        sort = sort or ""
+        name = sort.lstrip("-")
+        if name and name not in self.sort_fields:
+            raise InvalidFilter(f"Unsupported sort: {sort}")
+        sort_column = getattr(self.model, name) if name and name != "created_at" else None
+        return _Keyset(self.model, sort_column, sort.startswith("-"), sort)
+
+    def export_statement(self, *, sort=None, filters=None, scope=None):
+        """Column-only SELECT for streaming exports, plus its column names"""
+        columns = list(self.model.__table__.columns)
+        stmt = select(*columns)
+        if scope is not None:
+            stmt = stmt.filter(scope)
+        stmt = self.apply_filters(stmt, filters).order_by(*self._keyset(sort).order_by())
+        return stmt, [column.key for column in columns]
+
+    def source_tables(self, include: Optional[str] = None) -> Tuple[str, ...]:
+        """Tables a read with ``include`` is built from, for cache invalidation"""
+        names = self._include_names(include)
+        if any(name not in self.include_models for name in names):
+            raise InvalidFilter("include is not cacheable for this resource")
+        tables = [self.model.__tablename__, *(self.include_models[n].__tablename__ for n in names)]
+        return tuple(dict.fromkeys(tables))
+
+    def fingerprint_statement(self, *, id=None, filters=None, include=None, scope=None):
+        """SELECT of (count, max(updated_at)) over the rows a read would return.
+
+        Each included model adds the same pair over its whole table, since
+        a change there alters the embedded values. Returns None when an
+        include has no ``include_models`` entry and so cannot be tracked.
+        """
+        names = self._include_names(include)
+        if any(name not in self.include_models for name in names):
+            return None
+        stmt = select(func.count(), func.max(self.model.updated_at)).select_from(self.model)
+        if id is not None:
+            stmt = stmt.filter(self.model.id == id)
+        if scope is not None:
+            stmt = stmt.filter(scope)
+        stmt = self.apply_filters(stmt, filters)
+        for model in dict.fromkeys(self.include_models[name] for name in names):
+            stmt = stmt.add_columns(
+                select(func.count()).select_from(model).scalar_subquery(),
+                select(func.max(model.updated_at)).scalar_subquery(),
+            )
+        return stmt
+
+    def _list_query(self, query, *, cursor, skip, limit, sort, filters, include, fields=None):
+        """Apply filters, projection, includes, ordering and the page window"""
+        keyset = self._keyset(sort)
+        query = self.apply_filters(query, filters).options(
+            *self.load_options(fields, keyset), *self.include_options(include)
+        )
+        if cursor:
+            query = query.filter(keyset.after(cursor))
+        query = query.order_by(*keyset.order_by())
+        if skip and not cursor:
+            query = query.offset(skip)
+        return query.limit(limit + 1), keyset
+
+class CRUDBase(ListQueryMixin, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        return db.query(self.model).filter(self.model.id == id).first()
+    def get(self, db: Session, id: Any, include: Optional[str] = None) -> Optional[ModelType]:
+        return (
+            db.query(self.model)
+            .options(*self.include_options(include))
+            .filter(self.model.id == id)
+            .first()
+        )
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
+        filters: Optional[Dict[str, str]] = None,
+        include: Optional[str] = None,
+        fields: Optional[str] = None,
+        query=None
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Filtered page ordered by ``sort`` then (created_at, id).
+
+        ``query`` narrows the rows (e.g. per-employee filters). Without a
+        cursor ``skip`` falls back to OFFSET for older clients; either way
+        the returned cursor continues from the last row of the page.
+        """
+        if query is None:
+            query = db.query(self.model)
+        query, keyset = self._list_query(
+            query, cursor=cursor, skip=skip, limit=limit, sort=sort, filters=filters,
+            include=include, fields=fields
+        )
+        return keyset.next_cursor(query.all(), limit)
 
-    def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
-    ) -> List[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+    def fingerprint(
+        self,
+        db: Session,
+        *,
+        id: Any = None,
+        filters: Optional[Dict[str, str]] = None,
+        include: Optional[str] = None,
+        scope=None
+    ) -> Optional[Tuple[Any, ...]]:
+        """Cheap change marker for a list (or the row ``id``) and its includes.
+
+        None if it cannot be computed or ``id`` does not exist; see
+        fingerprint_statement for the columns.
+        """
+        stmt = self.fingerprint_statement(id=id, filters=filters, include=include, scope=scope)
+        if stmt is None:
+            return None
+        row = tuple(db.execute(stmt).one())
+        return None if id is not None and not row[0] else row
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         obj_in_data = jsonable_encoder(obj_in)
@@ -28,6 +341,176 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.refresh(db_obj)
         return db_obj
 
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Dict[int, CreateSchemaType],
+        result: Optional[BulkResult] = None
+    ) -> BulkResult:
+        """Insert ``objs_in`` (keyed by request index) with a single commit.
+
+        Large batches are streamed with COPY on psycopg2; otherwise, or if
+        COPY fails, a multi-row INSERT ... RETURNING is used.
+        """
+        result = result or BulkResult()
+        rows = {index: obj_in.model_dump() for index, obj_in in objs_in.items()}
+        if not rows:
+            return result
+        if len(rows) >= settings.BULK_COPY_THRESHOLD and self._supports_copy(db):
+            try:
+                with db.begin_nested():
+                    ids = self._copy_rows(db, list(rows.values()))
+                result.ids.extend(ids)
+                db.commit()
+                return result
+            except (SQLAlchemyError, db.get_bind().dialect.dbapi.Error):
+                pass
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        self._run_batch(db, rows, result, lambda batch: list(db.scalars(stmt, batch)))
+        db.commit()
+        return result
+
+    def update_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Dict[int, Tuple[Any, UpdateSchemaType]],
+        scope=None,
+        result: Optional[BulkResult] = None
+    ) -> BulkResult:
+        """Apply partial updates keyed by request index as one executemany.
+
+        ``scope`` is an extra criterion rows must match (e.g. ownership);
+        rows outside it are reported as not found.
+        """
+        result = result or BulkResult()
+        found = self._existing_ids(db, {i: id for i, (id, _) in objs_in.items()}, scope, result)
+        rows = {}
+        for index, id in found.items():
+            changes = objs_in[index][1].model_dump(exclude_unset=True)
+            if changes:
+                rows[index] = {**changes, "id": id}
+            else:
+                result.ids.append(id)
+
+        def execute(batch):
+            db.execute(update(self.model), batch)
+            return [row["id"] for row in batch]
+
+        if rows:
+            self._run_batch(db, rows, result, execute)
+        db.commit()
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    def remove_many(
+        self,
+        db: Session,
+        *,
+        ids: Dict[int, Any],
+        scope=None,
+        result: Optional[BulkResult] = None
+    ) -> BulkResult:
+        result = result or BulkResult()
+        found = self._existing_ids(db, ids, scope, result)
+
+        def execute(batch):
+            db.execute(delete(self.model).where(self.model.id.in_(batch)))
+            return list(batch)
+
+        if found:
+            self._run_batch(db, found, result, execute)
+        db.commit()
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    def _run_batch(
+        self,
+        db: Session,
+        rows: Dict[int, Any],
+        result: BulkResult,
+        execute: Callable[[list], List[Any]]
+    ) -> None:
+        # The whole batch runs in one savepoint; if it fails, rows are
+        # retried one savepoint each so only the offending rows are rejected.
+        try:
+            with db.begin_nested():
+                ids = execute(list(rows.values()))
+            result.ids.extend(ids)
+            return
+        except SQLAlchemyError:
+            pass
+        for index, row in rows.items():
+            try:
+                with db.begin_nested():
+                    ids = execute([row])
+                result.ids.extend(ids)
+            except SQLAlchemyError as exc:
+                result.errors.append(BulkRowError(index=index, detail=_db_error_detail(exc)))
+        result.errors.sort(key=lambda error: error.index)
+
+    def _existing_ids(
+        self, db: Session, ids: Dict[int, Any], scope, result: BulkResult
+    ) -> Dict[int, Any]:
+        parsed = {}
+        for index, raw in ids.items():
+            try:
+                parsed[index] = _coerce_value(self.model.id, str(raw))
+            except (ValueError, TypeError):
+                result.errors.append(BulkRowError(index=index, detail="Invalid id"))
+        if not parsed:
+            return {}
+        query = select(self.model.id).where(self.model.id.in_(set(parsed.values())))
+        if scope is not None:
+            query = query.where(scope)
+        existing = set(db.scalars(query))
+        found = {}
+        for index, id in parsed.items():
+            if id in existing:
+                found[index] = id
+            else:
+                result.errors.append(BulkRowError(index=index, detail="Not found"))
+        return found
+
+    def _supports_copy(self, db: Session) -> bool:
+        dialect = db.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+    def _copy_rows(self, db: Session, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Load rows with COPY FROM STDIN; ids are generated client-side"""
+        table = self.model.__table__
+        dialect = db.get_bind().dialect
+        defaults = {
+            column.key: column.default.arg
+            for column in table.columns
+            if column.default is not None and column.default.is_scalar
+        }
+        keys = set(defaults) | set(rows[0]) | {"id"}
+        columns = [column for column in table.columns if column.key in keys]
+        processors = [column.type.bind_processor(dialect) for column in columns]
+        ids = []
+        buffer = io.StringIO()
+        for row in rows:
+            row = {**defaults, **row, "id": uuid.uuid4()}
+            ids.append(row["id"])
+            values = []
+            for column, process in zip(columns, processors):
+                value = row.get(column.key)
+                values.append(_copy_text(process(value) if process and value is not None else value))
+            buffer.write("\t".join(values) + "\n")
+        buffer.seek(0)
+        preparer = dialect.identifier_preparer
+        column_list = ", ".join(preparer.quote(column.name) for column in columns)
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {preparer.format_table(table)} ({column_list}) FROM STDIN", buffer
+            )
+        finally:
+            cursor.close()
+        return ids
+
     def update(
         self,
         db: Session,
@@ -52,4 +535,4 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj = db.query(self.model).get(id)
         db.delete(obj)
         db.commit()
-        return obj
\ No newline at end of file
+        return obj
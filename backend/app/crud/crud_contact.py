@@ -0,0 +1,13 @@
+from app.crud.base import CRUDBase
+from app.models.contact import Contact
+from app.schemas.contact import ContactCreate, ContactUpdate
+
+class CRUDContact(CRUDBase[Contact, ContactCreate, ContactUpdate]):
+    filter_fields = ("is_active", "contact_type", "company", "city", "state")
+    range_fields = ("created_at",)
+    sort_fields = ("created_at", "name", "company")
+    list_fields = (
+        "id", "name", "company", "contact_type", "email", "phone", "city", "state", "is_active",
+    )
+
+contact_crud = CRUDContact(Contact)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from app.crud.base import CRUDBase
+from app.models.developer import Developer
+from app.schemas.developer import DeveloperCreate, DeveloperUpdate
+
+class CRUDDeveloper(CRUDBase[Developer, DeveloperCreate, DeveloperUpdate]):
+    filter_fields = ("is_active",)
+    range_fields = ("created_at",)
+    sort_fields = ("created_at", "name")
+
+developer_crud = CRUDDeveloper(Developer)
\ No newline at end of file
@@ -0,0 +1,11 @@
+from app.crud.base import CRUDBase
+from app.models.document import Document
+from app.schemas.document import DocumentCreate, DocumentAttach
+
+class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentAttach]):
+    # entity_type + entity_id is served by idx_documents_entity
+    filter_fields = ("entity_type", "entity_id", "uploaded_by", "mime_type")
+    range_fields = ("created_at",)
+    sort_fields = ("created_at", "name")
+
+document_crud = CRUDDocument(Document)
\ No newline at end of file
@@ -1,14 +1,28 @@
 from typing import Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.employee import Employee
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate
 
 class CRUDEmployee(CRUDBase[Employee, EmployeeCreate, EmployeeUpdate]):
+    filter_fields = ("is_active", "role", "department")
+    sort_fields = ("created_at", "username", "full_name")
+
     def get_by_username(self, db: Session, *, username: str) -> Optional[Employee]:
         return db.query(Employee).filter(Employee.username == username).first()
     
     def get_by_user_id(self, db: Session, *, user_id: str) -> Optional[Employee]:
         return db.query(Employee).filter(Employee.user_id == user_id).first()
 
-employee = CRUDEmployee(Employee)
\ No newline at end of file
+class AsyncCRUDEmployee:
+    """The one lookup the async stack needs (get_current_user_async)"""
+
+    async def get_by_user_id(self, db: AsyncSession, *, user_id: UUID) -> Optional[Employee]:
+        result = await db.execute(select(Employee).where(Employee.user_id == user_id))
+        return result.scalars().first()
+
+employee = CRUDEmployee(Employee)
+employee_async = AsyncCRUDEmployee()
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import select
+from sqlalchemy.orm import with_expression
+from app.crud.base import CRUDBase
+from app.models.employee import Employee
+from app.models.enquiry import Enquiry
+from app.schemas.enquiry import EnquiryCreate, EnquiryUpdate
+
+class CRUDEnquiry(CRUDBase[Enquiry, EnquiryCreate, EnquiryUpdate]):
+    filter_fields = ("is_active", "status", "enquiry_type", "assigned_employee_id")
+    range_fields = ("created_at", "budget")
+    sort_fields = ("created_at", "status", "budget")
+    list_fields = (
+        "id", "subject", "enquiry_type", "status", "customer_name", "customer_email",
+        "customer_phone", "budget", "assigned_employee_id", "is_active",
+    )
+    includes = {
+        "assignee": lambda: with_expression(
+            Enquiry.assignee_name,
+            select(Employee.full_name)
+            .where(Employee.id == Enquiry.assigned_employee_id)
+            .correlate(Enquiry)
+            .scalar_subquery(),
+        ),
+    }
+
+enquiry_crud = CRUDEnquiry(Enquiry)
\ No newline at end of file
@@ -0,0 +1,27 @@
+from sqlalchemy import select
+from sqlalchemy.orm import with_expression
+from app.crud.base import CRUDBase
+from app.models.inventory import InventoryItem
+from app.models.project import Project
+from app.schemas.inventory import InventoryCreate, InventoryUpdate
+
+class CRUDInventory(CRUDBase[InventoryItem, InventoryCreate, InventoryUpdate]):
+    filter_fields = ("is_active", "project_id", "status", "property_type", "bedrooms", "facing")
+    range_fields = ("created_at", "price", "area", "price_per_sqft")
+    sort_fields = ("created_at", "price", "area", "unit_number")
+    list_fields = (
+        "id", "unit_number", "property_type", "status", "area", "price", "bedrooms",
+        "bathrooms", "project_id", "is_active",
+    )
+    includes = {
+        "project": lambda: with_expression(
+            InventoryItem.project_name,
+            select(Project.name)
+            .where(Project.id == InventoryItem.project_id)
+            .correlate(InventoryItem)
+            .scalar_subquery(),
+        ),
+    }
+    include_models = {"project": Project}
+
+inventory_crud = CRUDInventory(InventoryItem)
\ No newline at end of file
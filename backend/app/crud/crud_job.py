@@ -0,0 +1,10 @@
+from app.crud.base import CRUDBase
+from app.models.job import Job
+from app.schemas.job import JobResponse
+
+class CRUDJob(CRUDBase[Job, JobResponse, JobResponse]):
+    filter_fields = ("kind", "status", "created_by")
+    range_fields = ("created_at", "finished_at")
+    sort_fields = ("created_at",)
+
+job_crud = CRUDJob(Job)
\ No newline at end of file
@@ -0,0 +1,14 @@
+from app.crud.base import CRUDBase
+from app.models.land_parcel import LandParcel
+from app.schemas.land_parcel import LandParcelCreate, LandParcelUpdate
+
+class CRUDLandParcel(CRUDBase[LandParcel, LandParcelCreate, LandParcelUpdate]):
+    filter_fields = ("is_active", "land_type", "state", "district", "village")
+    range_fields = ("created_at", "total_value", "area_acres", "price_per_acre")
+    sort_fields = ("created_at", "total_value", "area_acres", "survey_number")
+    list_fields = (
+        "id", "survey_number", "village", "district", "state", "area_acres", "land_type",
+        "owner_name", "total_value", "is_active",
+    )
+
+land_parcel_crud = CRUDLandParcel(LandParcel)
\ No newline at end of file
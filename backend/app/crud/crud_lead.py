@@ -1,30 +1,36 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session, with_expression
 from app.crud.base import CRUDBase
+from app.models.employee import Employee
 from app.models.lead import Lead
 from app.schemas.lead import LeadCreate, LeadUpdate
 
 class CRUDLead(CRUDBase[Lead, LeadCreate, LeadUpdate]):
-    def get_by_employee(
-        self, db: Session, *, employee_id: str, skip: int = 0, limit: int = 100
-    ) -> List[Lead]:
-        return (
-            db.query(Lead)
-            .filter(Lead.assigned_employee_id == employee_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
-    
-    def get_by_status(
-        self, db: Session, *, status: str, skip: int = 0, limit: int = 100
-    ) -> List[Lead]:
-        return (
-            db.query(Lead)
-            .filter(Lead.status == status)
-            .offset(skip)
-            .limit(limit)
-            .all()
+    filter_fields = ("is_active", "status", "source", "assigned_employee_id")
+    range_fields = ("created_at", "budget")
+    sort_fields = ("created_at", "updated_at", "name", "status", "budget")
+    includes = {
+        "assignee": lambda: with_expression(
+            Lead.assignee_name,
+            select(Employee.full_name)
+            .where(Employee.id == Lead.assigned_employee_id)
+            .correlate(Lead)
+            .scalar_subquery(),
+        ),
+    }
+
+    def get_page_by_employee(
+        self,
+        db: Session,
+        *,
+        employee_id: str,
+        **page: Any
+    ) -> Tuple[List[Lead], Optional[str]]:
+        return self.get_page(
+            db,
+            query=db.query(Lead).filter(Lead.assigned_employee_id == employee_id),
+            **page
         )
 
 lead = CRUDLead(Lead)
\ No newline at end of file
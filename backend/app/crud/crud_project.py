@@ -0,0 +1,29 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload, with_expression
+from app.crud.base import CRUDBase
+from app.models.developer import Developer
+from app.models.inventory import InventoryItem
+from app.models.project import Project
+from app.schemas.project import ProjectCreate, ProjectUpdate
+
+class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
+    filter_fields = ("is_active", "status", "project_type", "developer_id")
+    range_fields = ("created_at", "total_value", "price_per_sqft", "total_area")
+    sort_fields = ("created_at", "name", "status", "total_value", "price_per_sqft")
+    list_fields = (
+        "id", "name", "project_type", "status", "location", "total_area", "total_units",
+        "price_per_sqft", "developer_id", "is_active",
+    )
+    includes = {
+        "developer": lambda: selectinload(Project.developer),
+        "inventory_count": lambda: with_expression(
+            Project.inventory_count,
+            select(func.count(InventoryItem.id))
+            .where(InventoryItem.project_id == Project.id)
+            .correlate(Project)
+            .scalar_subquery(),
+        ),
+    }
+    include_models = {"developer": Developer, "inventory_count": InventoryItem}
+
+project_crud = CRUDProject(Project)
\ No newline at end of file
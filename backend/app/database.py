@@ -1,23 +1,158 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import Any, Dict
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from app.core.config import settings
+from app.core.metrics import Histogram
+
+_pool_stats_lock = threading.Lock()
+
+class _TimedCheckoutMixin:
+    """Records how long each checkout waited for a free connection"""
+    wait_seconds: Histogram
+    timeouts: int
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            with _pool_stats_lock:
+                type(self).timeouts += 1
+            raise
+        finally:
+            self.wait_seconds.observe(time.perf_counter() - start)
+
+# Metrics live on the class so they survive Pool.recreate() on dispose.
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    wait_seconds = Histogram()
+    timeouts = 0
+
+class InstrumentedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    wait_seconds = Histogram()
+    timeouts = 0
+
+def _pool_options(poolclass) -> Dict[str, Any]:
+    if settings.DB_PGBOUNCER:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def _sync_connect_args() -> Dict[str, Any]:
+    if settings.DB_STATEMENT_TIMEOUT_MS and not settings.DB_PGBOUNCER:
+        return {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    return {}
+
+def _async_connect_args() -> Dict[str, Any]:
+    if settings.DB_PGBOUNCER:
+        # pgbouncer in transaction mode cannot route prepared statements
+        return {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        return {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+    return {}
 
 # Create engine with Supabase PostgreSQL URL
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False  # Set to True for SQL debugging
+    connect_args=_sync_connect_args(),
+    echo=False,  # Set to True for SQL debugging
+    **_pool_options(InstrumentedQueuePool)
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+if settings.DB_PGBOUNCER and settings.DB_STATEMENT_TIMEOUT_MS:
+    # pgbouncer rejects startup options and may hand each transaction a
+    # different server connection, so the timeout is scoped per transaction.
+    # Registered on Session so it also covers AsyncSession's sync sessions.
+    @event.listens_for(Session, "after_begin")
+    def _set_statement_timeout(session, transaction, connection):
+        connection.exec_driver_sql(
+            f"SET LOCAL statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}"
+        )
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_async_database_url() -> str:
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = settings.DATABASE_URL
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+# The async engine is only built when the asyncio stack is enabled so the
+# sync deployment does not need asyncpg installed.
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DB_ASYNC:
+    async_engine = create_async_engine(
+        get_async_database_url(),
+        connect_args=_async_connect_args(),
+        echo=False,
+        **_pool_options(InstrumentedAsyncQueuePool)
+    )
+    # expire_on_commit=False: responses are serialized after the session's
+    # greenlet has exited, where lazy attribute refreshes are not possible.
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database stack is disabled; set DB_ASYNC=true")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def dispose_engines() -> None:
+    """Close every pooled connection (lifespan shutdown)"""
+    engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Live checkout/overflow counts and wait-time histograms per engine"""
+    engines = {"sync": engine.pool}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine.pool
+    stats = {}
+    for name, pool in engines.items():
+        entry: Dict[str, Any] = {"pool_class": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            entry.update(
+                size=pool.size(),
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                timeout=pool.timeout(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        if isinstance(pool, _TimedCheckoutMixin):
+            entry.update(
+                timeouts=type(pool).timeouts,
+                wait_seconds=pool.wait_seconds.stats(),
+            )
+        stats[name] = entry
+    stats["statement_timeout_ms"] = settings.DB_STATEMENT_TIMEOUT_MS
+    stats["pgbouncer"] = settings.DB_PGBOUNCER
+    return stats
@@ -1,19 +1,59 @@
-from fastapi import FastAPI, Depends
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
 from fastapi.security import HTTPBearer
+from starlette.concurrency import run_in_threadpool
 import logging
+import secrets
 
-from app.api.routes import auth, employees, leads, developers, projects, inventory, land_parcels, contacts, enquiries, files
+from app.api.routes import auth, employees, leads, developers, projects, inventory, land_parcels, contacts, enquiries, files, imports, jobs, metrics, search, stats
+from app.api.async_router import to_async_router
+from app.api.deps import NEXT_CURSOR_HEADER, get_current_user, get_current_user_async
+from app.crud.base import InvalidListQuery
 from app.core.config import settings
+from app.core.lifecycle import DrainMiddleware, lifecycle
+from app.core.instrumentation import RequestMetricsMiddleware, install_query_hooks, request_metrics
+from app.core.profiling import ProfilingMiddleware
+from app.core.security import shutdown_auth_executor
+from app.services.csv_import import csv_import_service
+from app.services.stats import stats_service
+from app.services.storage import get_storage
+from app.services.supabase_service import supabase_service
+from app.services.warmup import warm_up
+from app.database import dispose_engines
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open pooled connections, run the hot queries and create the storage
+    # clients before the first request instead of during it
+    if settings.STARTUP_WARMUP:
+        await warm_up()
+    stats_service.start()
+    try:
+        yield
+    finally:
+        # uvicorn has stopped listening by now; refuse stragglers and let
+        # running requests finish before their connections go away
+        await lifecycle.drain(settings.SHUTDOWN_DRAIN_SECONDS)
+        # Only busy where import jobs run, but its pools must not outlive the engines
+        await run_in_threadpool(csv_import_service.shutdown, settings.SHUTDOWN_DRAIN_SECONDS)
+        stats_service.stop()
+        shutdown_auth_executor()
+        supabase_service.close()
+        get_storage().close()
+        await dispose_engines()
+
 app = FastAPI(
     title="Real Estate CRM API",
     description="A comprehensive real estate management system with Supabase integration",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -23,19 +63,48 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# A single attribute check per request unless profiling is switched on
+app.add_middleware(ProfilingMiddleware)
+
+if settings.REQUEST_METRICS_ENABLED:
+    # Outside everything but the drain check, so it times the whole stack
+    install_query_hooks()
+    app.add_middleware(RequestMetricsMiddleware)
+
+# Outermost: counts every request for the shutdown drain
+app.add_middleware(DrainMiddleware)
+
+@app.exception_handler(InvalidListQuery)
+async def invalid_list_query_handler(request: Request, exc: InvalidListQuery):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+def api_router(module):
+    # DB_ASYNC serves the same handlers through the AsyncEngine on the event
+    # loop instead of the sync engine on the threadpool.
+    return to_async_router(module.router) if settings.DB_ASYNC else module.router
+
+if settings.DB_ASYNC:
+    app.dependency_overrides[get_current_user] = get_current_user_async
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(employees.router, prefix="/api/employees", tags=["Employees"])
-app.include_router(leads.router, prefix="/api/leads", tags=["Leads"])
-app.include_router(developers.router, prefix="/api/developers", tags=["Developers"])
-app.include_router(projects.router, prefix="/api/projects", tags=["Projects"])
-app.include_router(inventory.router, prefix="/api/inventory", tags=["Inventory"])
-app.include_router(land_parcels.router, prefix="/api/land-parcels", tags=["Land Parcels"])
-app.include_router(contacts.router, prefix="/api/contacts", tags=["Contacts"])
-app.include_router(enquiries.router, prefix="/api/enquiries", tags=["Enquiries"])
+app.include_router(api_router(employees), prefix="/api/employees", tags=["Employees"])
+app.include_router(api_router(leads), prefix="/api/leads", tags=["Leads"])
+app.include_router(api_router(developers), prefix="/api/developers", tags=["Developers"])
+app.include_router(api_router(projects), prefix="/api/projects", tags=["Projects"])
+app.include_router(api_router(inventory), prefix="/api/inventory", tags=["Inventory"])
+app.include_router(api_router(land_parcels), prefix="/api/land-parcels", tags=["Land Parcels"])
+app.include_router(api_router(contacts), prefix="/api/contacts", tags=["Contacts"])
+app.include_router(api_router(enquiries), prefix="/api/enquiries", tags=["Enquiries"])
+app.include_router(imports.router, prefix="/api/imports", tags=["Imports"])
 app.include_router(files.router, prefix="/api/files", tags=["Files"])
+app.include_router(api_router(jobs), prefix="/api/jobs", tags=["Jobs"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["Metrics"])
+app.include_router(api_router(stats), prefix="/api/stats", tags=["Stats"])
+app.include_router(api_router(search), prefix="/api/search", tags=["Search"])
 
 @app.get("/")
 async def root():
@@ -45,6 +114,14 @@ async def root():
         "docs": "/docs"
     }
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics(request: Request):
+    if settings.METRICS_TOKEN:
+        supplied = request.headers.get("authorization", "")
+        if not secrets.compare_digest(supplied, f"Bearer {settings.METRICS_TOKEN}"):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(request_metrics.prometheus(), media_type="text/plain; version=0.0.4")
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "database": "supabase"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, Text, ForeignKey, Enum, Numeric
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 import enum
 from app.models.base import BaseModel
 
@@ -35,4 +35,7 @@ class Enquiry(BaseModel):
     assigned_employee_id = Column(UUID(as_uuid=True), ForeignKey("employees.id"))
     
     # Relationships
-    assigned_employee = relationship("Employee", back_populates="assigned_enquiries")
\ No newline at end of file
+    assigned_employee = relationship("Employee", back_populates="assigned_enquiries")
+    
+    # Populated only when requested via with_expression (include=assignee)
+    assignee_name = query_expression()
\ No newline at end of file
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, ForeignKey, Enum, Numeric, Boolean, Integer
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 import enum
 from app.models.base import BaseModel
 
@@ -38,4 +38,7 @@ class InventoryItem(BaseModel):
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"))
     
     # Relationships
-    project = relationship("Project", back_populates="inventory_items")
\ No newline at end of file
+    project = relationship("Project", back_populates="inventory_items")
+    
+    # Populated only when requested via with_expression (include=project)
+    project_name = query_expression()
\ No newline at end of file
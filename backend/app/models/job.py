@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Text, ForeignKey, Enum, Integer, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+import enum
+from app.models.base import BaseModel
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class Job(BaseModel):
+    __tablename__ = "jobs"
+    
+    kind = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False, default={})
+    status = Column(Enum(JobStatus), nullable=False, default=JobStatus.QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime(timezone=True), nullable=False, server_default=text("now()"))
+    locked_at = Column(DateTime(timezone=True))
+    locked_by = Column(String(100))
+    finished_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    result = Column(JSONB)
+    
+    # Foreign Keys
+    created_by = Column(UUID(as_uuid=True), ForeignKey("employees.id"))
+    
+    __table_args__ = (
+        # Workers only ever scan due, queued jobs
+        Index("ix_jobs_due", "run_at", postgresql_where=text("status = 'QUEUED'")),
+        Index("ix_jobs_created_by", "created_by", "created_at"),
+    )
\ No newline at end of file
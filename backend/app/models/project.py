@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, Text, ForeignKey, Enum, Numeric, Date, Integer
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 import enum
 from app.models.base import BaseModel
 
@@ -39,4 +39,7 @@ class Project(BaseModel):
     
     # Relationships
     developer = relationship("Developer", back_populates="projects")
-    inventory_items = relationship("InventoryItem", back_populates="project")
\ No newline at end of file
+    inventory_items = relationship("InventoryItem", back_populates="project")
+    
+    # Populated only when requested via with_expression (include=inventory_count)
+    inventory_count = query_expression()
\ No newline at end of file
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Any, List
+
+class BulkRowError(BaseModel):
+    index: int
+    detail: Any
+
+class BulkResult(BaseModel):
+    ids: List[Any] = []
+    errors: List[BulkRowError] = []
+
+class BulkDelete(BaseModel):
+    ids: List[Any]
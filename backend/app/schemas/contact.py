@@ -0,0 +1,57 @@
+from pydantic import BaseModel, EmailStr
+from typing import Optional
+from datetime import datetime
+from uuid import UUID
+from app.models.contact import ContactType
+
+class ContactBase(BaseModel):
+    name: str
+    company: Optional[str] = None
+    contact_type: ContactType = ContactType.CLIENT
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = None
+    alternate_phone: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    pincode: Optional[str] = None
+    notes: Optional[str] = None
+
+class ContactCreate(ContactBase):
+    pass
+
+class ContactUpdate(BaseModel):
+    name: Optional[str] = None
+    company: Optional[str] = None
+    contact_type: Optional[ContactType] = None
+    email: Optional[EmailStr] = None
+    phone: Optional[str] = None
+    alternate_phone: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    pincode: Optional[str] = None
+    notes: Optional[str] = None
+    is_active: Optional[bool] = None
+
+class ContactResponse(BaseModel):
+    id: UUID
+    name: str
+    company: Optional[str] = None
+    contact_type: Optional[ContactType] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    is_active: Optional[bool] = None
+    
+    class Config:
+        from_attributes = True
+
+class ContactDetail(ContactResponse):
+    alternate_phone: Optional[str] = None
+    address: Optional[str] = None
+    pincode: Optional[str] = None
+    notes: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
+from uuid import UUID
 
 class DeveloperBase(BaseModel):
     name: str
@@ -27,7 +28,7 @@ class DeveloperUpdate(BaseModel):
     description: Optional[str] = None
 
 class Developer(DeveloperBase):
-    id: int
+    id: UUID
     is_active: bool
     
     class Config:
@@ -0,0 +1,53 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+from datetime import datetime
+from uuid import UUID
+
+class DocumentBase(BaseModel):
+    name: str = Field(..., max_length=255)
+    mime_type: Optional[str] = Field(None, max_length=100)
+    entity_type: Optional[str] = Field(None, max_length=50)
+    entity_id: Optional[UUID] = None
+
+class UploadRequest(DocumentBase):
+    """Ask for a presigned direct-to-storage upload"""
+    pass
+
+class UploadTicket(BaseModel):
+    """Where to send the file; register it afterwards with ``key`` and ``upload_token``"""
+    key: str
+    upload_token: str
+    method: str
+    url: str
+    fields: Dict[str, str] = {}
+    headers: Dict[str, str] = {}
+    expires_in: int
+
+class DocumentCreate(DocumentBase):
+    """Register a file uploaded through an UploadTicket"""
+    key: str = Field(..., max_length=500)
+    upload_token: str = Field(..., max_length=200)
+
+class DocumentResponse(DocumentBase):
+    id: UUID
+    file_path: str
+    file_size: Optional[int] = None
+    uploaded_by: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class DocumentAttach(BaseModel):
+    """Move a document to another entity; nulls detach it"""
+    entity_type: Optional[str] = Field(None, max_length=50)
+    entity_id: Optional[UUID] = None
+
+class DocumentWithURL(DocumentResponse):
+    """List item with a ready-to-use signed download URL"""
+    url: Optional[str] = None
+    url_expires_in: Optional[int] = None
+
+class DownloadURL(BaseModel):
+    url: str
+    expires_in: int
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
+from uuid import UUID
 from app.models.employee import UserRole
 
 class EmployeeBase(BaseModel):
@@ -22,7 +23,9 @@ class EmployeeUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 class Employee(EmployeeBase):
-    id: int
+    id: UUID
+    # Emails live in Supabase Auth, not on the employees row
+    email: Optional[EmailStr] = None
     is_active: bool
     
     class Config:
@@ -0,0 +1,62 @@
+from pydantic import BaseModel, EmailStr
+from typing import Optional
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from app.models.enquiry import EnquiryStatus, EnquiryType
+
+class EnquiryBase(BaseModel):
+    subject: str
+    enquiry_type: EnquiryType = EnquiryType.GENERAL
+    status: EnquiryStatus = EnquiryStatus.OPEN
+    customer_name: Optional[str] = None
+    customer_email: Optional[EmailStr] = None
+    customer_phone: Optional[str] = None
+    budget: Optional[Decimal] = None
+    preferred_location: Optional[str] = None
+    requirements: Optional[str] = None
+    description: Optional[str] = None
+    response: Optional[str] = None
+    assigned_employee_id: Optional[UUID] = None
+
+class EnquiryCreate(EnquiryBase):
+    pass
+
+class EnquiryUpdate(BaseModel):
+    subject: Optional[str] = None
+    enquiry_type: Optional[EnquiryType] = None
+    status: Optional[EnquiryStatus] = None
+    customer_name: Optional[str] = None
+    customer_email: Optional[EmailStr] = None
+    customer_phone: Optional[str] = None
+    budget: Optional[Decimal] = None
+    preferred_location: Optional[str] = None
+    requirements: Optional[str] = None
+    description: Optional[str] = None
+    response: Optional[str] = None
+    assigned_employee_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+
+class EnquiryResponse(BaseModel):
+    id: UUID
+    subject: str
+    enquiry_type: Optional[EnquiryType] = None
+    status: Optional[EnquiryStatus] = None
+    customer_name: Optional[str] = None
+    customer_email: Optional[str] = None
+    customer_phone: Optional[str] = None
+    budget: Optional[float] = None
+    assigned_employee_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+    assignee_name: Optional[str] = None  # include=assignee
+    
+    class Config:
+        from_attributes = True
+
+class EnquiryDetail(EnquiryResponse):
+    preferred_location: Optional[str] = None
+    requirements: Optional[str] = None
+    description: Optional[str] = None
+    response: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
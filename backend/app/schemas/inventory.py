@@ -0,0 +1,65 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+from app.models.inventory import PropertyType, InventoryStatus
+
+class InventoryBase(BaseModel):
+    unit_number: str
+    property_type: PropertyType
+    status: InventoryStatus = InventoryStatus.AVAILABLE
+    floor: Optional[str] = None
+    area: Optional[Decimal] = None
+    price: Optional[Decimal] = None
+    price_per_sqft: Optional[Decimal] = None
+    bedrooms: Optional[int] = None
+    bathrooms: Optional[int] = None
+    parking: bool = False
+    facing: Optional[str] = None
+    description: Optional[str] = None
+    project_id: Optional[UUID] = None
+
+class InventoryCreate(InventoryBase):
+    pass
+
+class InventoryUpdate(BaseModel):
+    unit_number: Optional[str] = None
+    property_type: Optional[PropertyType] = None
+    status: Optional[InventoryStatus] = None
+    floor: Optional[str] = None
+    area: Optional[Decimal] = None
+    price: Optional[Decimal] = None
+    price_per_sqft: Optional[Decimal] = None
+    bedrooms: Optional[int] = None
+    bathrooms: Optional[int] = None
+    parking: Optional[bool] = None
+    facing: Optional[str] = None
+    description: Optional[str] = None
+    project_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+
+class InventorySummary(BaseModel):
+    id: UUID
+    unit_number: str
+    property_type: PropertyType
+    status: Optional[InventoryStatus] = None
+    area: Optional[float] = None
+    price: Optional[float] = None
+    bedrooms: Optional[int] = None
+    bathrooms: Optional[int] = None
+    project_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+    project_name: Optional[str] = None  # include=project
+    
+    class Config:
+        from_attributes = True
+
+class InventoryResponse(InventorySummary):
+    floor: Optional[str] = None
+    price_per_sqft: Optional[float] = None
+    parking: Optional[bool] = None
+    facing: Optional[str] = None
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,67 @@
+from pydantic import BaseModel
+from typing import Any, Dict, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+from app.models.land_parcel import LandType
+
+class LandParcelBase(BaseModel):
+    survey_number: str
+    village: Optional[str] = None
+    district: Optional[str] = None
+    state: Optional[str] = None
+    area_acres: Optional[Decimal] = None
+    area_sqft: Optional[Decimal] = None
+    land_type: Optional[LandType] = None
+    owner_name: Optional[str] = None
+    owner_contact: Optional[str] = None
+    price_per_acre: Optional[Decimal] = None
+    total_value: Optional[Decimal] = None
+    registration_date: Optional[date] = None
+    documents: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+
+class LandParcelCreate(LandParcelBase):
+    pass
+
+class LandParcelUpdate(BaseModel):
+    survey_number: Optional[str] = None
+    village: Optional[str] = None
+    district: Optional[str] = None
+    state: Optional[str] = None
+    area_acres: Optional[Decimal] = None
+    area_sqft: Optional[Decimal] = None
+    land_type: Optional[LandType] = None
+    owner_name: Optional[str] = None
+    owner_contact: Optional[str] = None
+    price_per_acre: Optional[Decimal] = None
+    total_value: Optional[Decimal] = None
+    registration_date: Optional[date] = None
+    documents: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+    is_active: Optional[bool] = None
+
+class LandParcelResponse(BaseModel):
+    id: UUID
+    survey_number: str
+    village: Optional[str] = None
+    district: Optional[str] = None
+    state: Optional[str] = None
+    area_acres: Optional[float] = None
+    land_type: Optional[LandType] = None
+    owner_name: Optional[str] = None
+    total_value: Optional[float] = None
+    is_active: Optional[bool] = None
+    
+    class Config:
+        from_attributes = True
+
+class LandParcelDetail(LandParcelResponse):
+    area_sqft: Optional[float] = None
+    owner_contact: Optional[str] = None
+    price_per_acre: Optional[float] = None
+    registration_date: Optional[date] = None
+    documents: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
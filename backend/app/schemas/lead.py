@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from decimal import Decimal
+from uuid import UUID
 from app.models.lead import LeadStatus, LeadSource
 
 class LeadBase(BaseModel):
@@ -15,7 +16,7 @@ class LeadBase(BaseModel):
     notes: Optional[str] = None
 
 class LeadCreate(LeadBase):
-    assigned_employee_id: Optional[int] = None
+    assigned_employee_id: Optional[UUID] = None
 
 class LeadUpdate(BaseModel):
     name: Optional[str] = None
@@ -27,11 +28,12 @@ class LeadUpdate(BaseModel):
     budget: Optional[Decimal] = None
     requirements: Optional[str] = None
     notes: Optional[str] = None
-    assigned_employee_id: Optional[int] = None
+    assigned_employee_id: Optional[UUID] = None
 
 class Lead(LeadBase):
-    id: int
-    assigned_employee_id: Optional[int] = None
+    id: UUID
+    assigned_employee_id: Optional[UUID] = None
+    assignee_name: Optional[str] = None  # include=assignee
     
     class Config:
         from_attributes = True
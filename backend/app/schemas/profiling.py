@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+class ProfilingSettings(BaseModel):
+    """Profiling switch for every worker; sample_rate 0 turns sampling off"""
+    sample_rate: float = Field(0.0, ge=0.0, le=1.0)
+    path_prefix: str = "/api/"
\ No newline at end of file
@@ -0,0 +1,79 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+from app.models.project import ProjectType, ProjectStatus
+
+class ProjectBase(BaseModel):
+    name: str
+    project_type: ProjectType
+    status: ProjectStatus = ProjectStatus.PLANNING
+    location: Optional[str] = None
+    address: Optional[str] = None
+    total_area: Optional[Decimal] = None
+    built_up_area: Optional[Decimal] = None
+    total_units: Optional[int] = None
+    price_per_sqft: Optional[Decimal] = None
+    total_value: Optional[Decimal] = None
+    start_date: Optional[date] = None
+    expected_completion: Optional[date] = None
+    description: Optional[str] = None
+    amenities: Optional[str] = None
+    developer_id: Optional[UUID] = None
+
+class ProjectCreate(ProjectBase):
+    pass
+
+class ProjectUpdate(BaseModel):
+    name: Optional[str] = None
+    project_type: Optional[ProjectType] = None
+    status: Optional[ProjectStatus] = None
+    location: Optional[str] = None
+    address: Optional[str] = None
+    total_area: Optional[Decimal] = None
+    built_up_area: Optional[Decimal] = None
+    total_units: Optional[int] = None
+    price_per_sqft: Optional[Decimal] = None
+    total_value: Optional[Decimal] = None
+    start_date: Optional[date] = None
+    expected_completion: Optional[date] = None
+    description: Optional[str] = None
+    amenities: Optional[str] = None
+    developer_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+
+class DeveloperRef(BaseModel):
+    id: UUID
+    name: str
+    
+    class Config:
+        from_attributes = True
+
+class ProjectResponse(BaseModel):
+    id: UUID
+    name: str
+    project_type: ProjectType
+    status: Optional[ProjectStatus] = None
+    location: Optional[str] = None
+    total_area: Optional[float] = None
+    total_units: Optional[int] = None
+    price_per_sqft: Optional[float] = None
+    developer_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
+    developer: Optional[DeveloperRef] = None  # include=developer
+    inventory_count: Optional[int] = None  # include=inventory_count
+    
+    class Config:
+        from_attributes = True
+
+class ProjectDetail(ProjectResponse):
+    address: Optional[str] = None
+    built_up_area: Optional[float] = None
+    total_value: Optional[float] = None
+    start_date: Optional[date] = None
+    expected_completion: Optional[date] = None
+    description: Optional[str] = None
+    amenities: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
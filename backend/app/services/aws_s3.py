@@ -1,24 +1,67 @@
-import boto3
-from botocore.exceptions import ClientError
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Type
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.services.storage import ChunkReader, FileTooLarge, PresignedUpload
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _client_error() -> Type[Exception]:
+    """botocore's ClientError, imported on first use like boto3 itself.
+
+    Only evaluated while handling an exception from the client, by which
+    time botocore is loaded.
+    """
+    from botocore.exceptions import ClientError
+    return ClientError
+
 class S3Service:
+    """S3 helpers around one lazily created boto3 client.
+
+    boto3 and the client (which loads the S3 service model) are only
+    created on first use, keeping them out of app import.
+    """
+
     def __init__(self):
-        if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
-            )
-            self.bucket_name = settings.AWS_BUCKET_NAME
-        else:
-            self.s3_client = None
-            logger.warning("AWS credentials not configured")
+        self.bucket_name = settings.AWS_BUCKET_NAME
+        self._s3 = None
+        self._configured: Optional[bool] = None
+        self._lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """The boto3 client, or None when AWS credentials are not configured"""
+        if self._configured is None:
+            with self._lock:
+                if self._configured is None:
+                    if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+                        import boto3
+                        self._s3 = boto3.client(
+                            's3',
+                            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                            region_name=settings.AWS_REGION,
+                            endpoint_url=settings.AWS_S3_ENDPOINT_URL or None
+                        )
+                    else:
+                        logger.warning("AWS credentials not configured")
+                    self._configured = True
+        return self._s3
+
+    def close(self) -> None:
+        """Close the client's connection pool; the next use creates a new client"""
+        with self._lock:
+            client, self._s3, self._configured = self._s3, None, None
+        if client is not None:
+            client.close()
     
+    def _client(self):
+        if not self.s3_client:
+            raise Exception("S3 not configured")
+        return self.s3_client
+
     def upload_file(self, file_obj, file_name: str) -> str:
         """Upload file to S3 and return URL"""
         if not self.s3_client:
@@ -27,10 +70,117 @@ class S3Service:
         try:
             self.s3_client.upload_fileobj(file_obj, self.bucket_name, file_name)
             return f"https://{self.bucket_name}.s3.{settings.AWS_REGION}.amazonaws.com/{file_name}"
-        except ClientError as e:
+        except _client_error() as e:
             logger.error(f"Error uploading file to S3: {e}")
             raise
-    
+
+    async def upload_stream(self, stream: ChunkReader, key: str, content_type: str) -> int:
+        """Stream ``stream`` to ``key`` and return its size in bytes.
+
+        Files smaller than one part are a single PutObject. Larger ones
+        become a multipart upload with up to S3_UPLOAD_CONCURRENCY parts
+        in flight; the next part is only read once a slot frees up, so at
+        most (concurrency + 1) * S3_PART_SIZE bytes are held in memory.
+        """
+        client = self._client()
+        part_size = settings.S3_PART_SIZE
+        chunk = await stream.read(part_size)
+        if len(chunk) < part_size:
+            if len(chunk) > settings.FILE_MAX_BYTES:
+                raise FileTooLarge(settings.FILE_MAX_BYTES)
+            await run_in_threadpool(
+                client.put_object, Bucket=self.bucket_name, Key=key, Body=chunk, ContentType=content_type
+            )
+            return len(chunk)
+
+        created = await run_in_threadpool(
+            client.create_multipart_upload, Bucket=self.bucket_name, Key=key, ContentType=content_type
+        )
+        upload_id = created["UploadId"]
+        slots = asyncio.Semaphore(settings.S3_UPLOAD_CONCURRENCY)
+        tasks: List[asyncio.Task] = []
+
+        async def put_part(number: int, body: bytes) -> Dict[str, Any]:
+            try:
+                part = await run_in_threadpool(
+                    client.upload_part, Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                    PartNumber=number, Body=body
+                )
+                return {"PartNumber": number, "ETag": part["ETag"]}
+            finally:
+                slots.release()
+
+        size = 0
+        try:
+            while chunk:
+                size += len(chunk)
+                if size > settings.FILE_MAX_BYTES:
+                    raise FileTooLarge(settings.FILE_MAX_BYTES)
+                await slots.acquire()
+                tasks.append(asyncio.create_task(put_part(len(tasks) + 1, chunk)))
+                chunk = await stream.read(part_size)
+            parts = await asyncio.gather(*tasks)
+            await run_in_threadpool(
+                client.complete_multipart_upload, Bucket=self.bucket_name, Key=key, UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            # Let in-flight parts finish before aborting, or they would
+            # re-create storage for the upload after the abort.
+            await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await run_in_threadpool(
+                    client.abort_multipart_upload, Bucket=self.bucket_name, Key=key, UploadId=upload_id
+                )
+            except _client_error() as e:
+                logger.error(f"Error aborting multipart upload {upload_id}: {e}")
+            raise
+        return size
+
+    def upload_path(self, path: str, key: str, content_type: str) -> None:
+        """Upload the local file at ``path`` to ``key`` (blocking, multipart if large)"""
+        self._client().upload_file(path, self.bucket_name, key, ExtraArgs={"ContentType": content_type})
+
+    def download_path(self, key: str, path: str) -> None:
+        """Download ``key`` to the local file ``path`` (blocking)"""
+        self._client().download_file(self.bucket_name, key, path)
+
+    def presigned_upload(self, key: str, content_type: str, expires_in: int) -> PresignedUpload:
+        """Browser POST form for uploading straight to the bucket"""
+        post = self._client().generate_presigned_post(
+            self.bucket_name,
+            key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, settings.FILE_MAX_BYTES],
+            ],
+            ExpiresIn=expires_in,
+        )
+        return PresignedUpload(method="POST", url=post["url"], fields=post["fields"], expires_in=expires_in)
+
+    def presigned_download_url(self, key: str, expires_in: int, filename: Optional[str] = None) -> str:
+        params = {"Bucket": self.bucket_name, "Key": key}
+        if filename:
+            params["ResponseContentDisposition"] = f'attachment; filename="{filename}"'
+        return self._client().generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
+
+    def presigned_download_urls(self, keys: Sequence[str], expires_in: int) -> Dict[str, str]:
+        # Presigning is local to the client, so one call per key is fine
+        return {key: self.presigned_download_url(key, expires_in) for key in keys}
+
+    def object_size(self, key: str) -> Optional[int]:
+        """Size of ``key`` in bytes, or None if it does not exist"""
+        try:
+            return self._client().head_object(Bucket=self.bucket_name, Key=key)["ContentLength"]
+        except _client_error() as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    async def delete_object(self, key: str) -> bool:
+        return await run_in_threadpool(self.delete_file, key)
+
     def delete_file(self, file_name: str) -> bool:
         """Delete file from S3"""
         if not self.s3_client:
@@ -39,7 +189,7 @@ class S3Service:
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=file_name)
             return True
-        except ClientError as e:
+        except _client_error() as e:
             logger.error(f"Error deleting file from S3: {e}")
             return False
 
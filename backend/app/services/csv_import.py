@@ -0,0 +1,243 @@
+import csv
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+from app.core.cache import reference_cache
+from app.core.config import settings
+from app.crud.base import CRUDBase
+from app.crud.crud_contact import contact_crud
+from app.crud.crud_inventory import inventory_crud
+from app.crud.crud_land_parcel import land_parcel_crud
+from app.crud.crud_lead import lead
+from app.schemas.contact import ContactCreate
+from app.schemas.inventory import InventoryCreate
+from app.schemas.land_parcel import LandParcelCreate
+from app.schemas.lead import LeadCreate
+from app.services.jobs import PermanentJobError, job_queue
+from app.services.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class ImportTarget:
+    crud: CRUDBase
+    schema: Type[BaseModel]
+    admin_only: bool
+
+# Mirrors the permissions of each resource's single-row create endpoint
+IMPORT_TARGETS = {
+    "inventory": ImportTarget(inventory_crud, InventoryCreate, admin_only=True),
+    "land-parcels": ImportTarget(land_parcel_crud, LandParcelCreate, admin_only=True),
+    "contacts": ImportTarget(contact_crud, ContactCreate, admin_only=False),
+    "leads": ImportTarget(lead, LeadCreate, admin_only=False),
+}
+
+def error_report_key(upload_key: str) -> str:
+    """Storage key of the error report for the upload at ``upload_key``"""
+    return f"{upload_key}.errors.csv"
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+def _validate_batch(
+    schema: Type[BaseModel],
+    rows: List[Tuple[int, Dict[str, str]]],
+    defaults: Dict[str, Any]
+) -> Tuple[Dict[int, BaseModel], List[Tuple[int, str]]]:
+    """Validate one batch of CSV rows keyed by line number.
+
+    Runs in the validation process pool, so it must stay module-level and
+    only exchange picklable values.
+    """
+    valid: Dict[int, BaseModel] = {}
+    errors: List[Tuple[int, str]] = []
+    for line, raw in rows:
+        # Empty cells mean "not provided"; keys are None for surplus cells
+        data = {key: value for key, value in raw.items() if key and value not in ("", None)}
+        try:
+            valid[line] = schema.model_validate({**defaults, **data})
+        except ValidationError as exc:
+            errors.append((line, _format_validation_error(exc)))
+    return valid, errors
+
+class CSVImportService:
+    """Runs CSV import jobs from the job queue.
+
+    The API spools each upload to shared storage and enqueues a job, so
+    any worker process can run it. The file is downloaded to disk, parsed
+    incrementally, validated in a process pool a bounded number of batches
+    ahead and inserted one transaction per batch, so memory stays flat for
+    any file size. Counts are published to the job's ``result`` after each
+    batch; rejected rows end up in an error report next to the upload.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._active = 0
+        self._closing = False
+        self._abort = threading.Event()
+        self._validators: Optional[ProcessPoolExecutor] = None
+
+    def shutdown(self, timeout: float) -> None:
+        """Stop taking imports and give running ones ``timeout`` seconds.
+
+        Imports still running after that stop at their next batch and
+        fail, keeping the progress they reported. The validation processes
+        are shut down either way.
+        """
+        with self._idle:
+            self._closing = True
+            finished = self._idle.wait_for(lambda: self._active == 0, timeout)
+            validators, self._validators = self._validators, None
+        if not finished:
+            logger.warning("Interrupting %d running CSV imports", self._active)
+            self._abort.set()
+        if validators is not None:
+            validators.shutdown(wait=False, cancel_futures=True)
+
+    def _get_validators(self) -> Optional[ProcessPoolExecutor]:
+        if settings.IMPORT_WORKERS <= 0:
+            return None
+        with self._lock:
+            if self._closing:
+                raise PermanentJobError("CSV imports are shutting down")
+            if self._validators is None:
+                # spawn: forking a threaded process is not safe
+                self._validators = ProcessPoolExecutor(
+                    max_workers=settings.IMPORT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._validators
+
+    def _read_batches(self, reader: csv.DictReader) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+        batch: List[Tuple[int, Dict[str, str]]] = []
+        for row in reader:
+            batch.append((reader.line_num, row))
+            if len(batch) >= settings.IMPORT_BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _validated_batches(self, reader: csv.DictReader, schema, defaults):
+        """Yield (raw rows, valid rows, errors) per batch in file order"""
+        validators = self._get_validators()
+        if validators is None:
+            for batch in self._read_batches(reader):
+                yield (batch, *_validate_batch(schema, batch, defaults))
+            return
+        # Keep a bounded number of batches in flight so a huge file is never
+        # read far ahead of the inserts.
+        pending: Deque = deque()
+        max_pending = settings.IMPORT_WORKERS * 2
+        for batch in self._read_batches(reader):
+            pending.append((batch, validators.submit(_validate_batch, schema, batch, defaults)))
+            if len(pending) >= max_pending:
+                batch, future = pending.popleft()
+                yield (batch, *future.result())
+        while pending:
+            batch, future = pending.popleft()
+            yield (batch, *future.result())
+
+    def run(self, db: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Import the upload described by a job ``payload``; returns the counts.
+
+        ``payload`` holds ``resource``, ``filename``, ``key`` (the upload on
+        storage) and ``defaults`` merged under every row. The upload itself
+        is left for the caller to delete.
+        """
+        target = IMPORT_TARGETS.get(payload["resource"])
+        if target is None:
+            raise PermanentJobError(f"Unknown import resource: {payload['resource']}")
+        with self._lock:
+            if self._closing:
+                raise PermanentJobError("CSV imports are shutting down")
+            self._active += 1
+        try:
+            return self._run(db, target, payload)
+        finally:
+            with self._idle:
+                self._active -= 1
+                self._idle.notify_all()
+
+    def _run(self, db: Session, target: ImportTarget, payload: Dict[str, Any]) -> Dict[str, Any]:
+        progress: Dict[str, Any] = {
+            "resource": payload["resource"],
+            "filename": payload.get("filename"),
+            "rows_read": 0,
+            "rows_inserted": 0,
+            "rows_failed": 0,
+            "error_report_key": None,
+        }
+        storage = get_storage()
+        upload_fd, upload_path = tempfile.mkstemp(prefix="import-", suffix=".csv")
+        report_fd, report_path = tempfile.mkstemp(prefix="import-", suffix="-errors.csv")
+        os.close(upload_fd)
+        try:
+            with os.fdopen(report_fd, "w", newline="") as report:
+                storage.download_path(payload["key"], upload_path)
+                with open(upload_path, newline="", encoding="utf-8-sig") as source:
+                    self._import(db, target, payload.get("defaults") or {}, source, report, progress)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            try:
+                # Rows rejected before a failure are reported too
+                if progress["rows_failed"]:
+                    key = error_report_key(payload["key"])
+                    storage.upload_path(report_path, key, "text/csv")
+                    progress["error_report_key"] = key
+                    job_queue.report_progress(db, progress)
+            finally:
+                self._remove_file(upload_path)
+                self._remove_file(report_path)
+        return progress
+
+    def _import(self, db: Session, target: ImportTarget, defaults, source, report, progress) -> None:
+        reader = csv.DictReader(source)
+        columns = list(reader.fieldnames or [])
+        report_writer = csv.writer(report)
+        report_writer.writerow(["line", "error", *columns])
+
+        def report_error(line: int, detail: Any, raw: Dict[str, str]) -> None:
+            progress["rows_failed"] += 1
+            report_writer.writerow([line, detail, *(raw.get(c, "") for c in columns)])
+
+        for batch, valid, errors in self._validated_batches(reader, target.schema, defaults):
+            if self._abort.is_set():
+                raise PermanentJobError("Import interrupted by shutdown")
+            progress["rows_read"] += len(batch)
+            raw_rows = dict(batch)
+            for line, detail in errors:
+                report_error(line, detail, raw_rows[line])
+            if valid:
+                result = target.crud.create_many(db, objs_in=valid)
+                reference_cache.invalidate(target.crud.model.__tablename__)
+                progress["rows_inserted"] += len(result.ids)
+                for error in result.errors:
+                    report_error(error.index, error.detail, raw_rows[error.index])
+            report.flush()
+            job_queue.report_progress(db, progress)
+
+    @staticmethod
+    def _remove_file(path: Optional[str]) -> None:
+        if path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+csv_import_service = CSVImportService()
@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from typing import Any, Dict
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.services.csv_import import csv_import_service, error_report_key
+from app.services.jobs import job_queue
+from app.services.stats import stats_service
+from app.services.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Job kinds; the worker imports this module to register the handlers
+STORAGE_DELETE = "storage.delete"
+STATS_REFRESH = "stats.refresh"
+CSV_IMPORT = "csv.import"
+
+@job_queue.handler(STORAGE_DELETE)
+def delete_stored_file(db: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+    # The storage services report failure instead of raising; raise so
+    # the job is retried.
+    if not asyncio.run(get_storage().delete_object(payload["key"])):
+        raise RuntimeError(f"Could not delete {payload['key']}")
+    return {"key": payload["key"]}
+
+@job_queue.handler(STATS_REFRESH)
+def refresh_stats(db: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+    # False means another worker was refreshing at the same moment
+    return {"refreshed": stats_service.refresh(db)}
+
+@job_queue.handler(CSV_IMPORT)
+def import_csv(db: Session, payload: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return csv_import_service.run(db, payload)
+    finally:
+        # The upload is read once; the error report (if any) is kept for
+        # IMPORT_REPORT_RETENTION_SECONDS
+        job_queue.enqueue(db, STORAGE_DELETE, {"key": payload["key"]})
+        job_queue.enqueue(
+            db, STORAGE_DELETE, {"key": error_report_key(payload["key"])},
+            delay=settings.IMPORT_REPORT_RETENTION_SECONDS,
+        )
@@ -0,0 +1,224 @@
+import itertools
+import logging
+import os
+import random
+import socket
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# handler(db, payload) -> JSON-serializable result or None
+JobHandler = Callable[[Session, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help; the job fails at once"""
+
+class JobQueue:
+    """Background jobs stored in the ``jobs`` table.
+
+    Postgres is the broker: enqueue is an INSERT (optionally in the same
+    transaction as the write that needs it), and workers claim due jobs
+    with SELECT ... FOR UPDATE SKIP LOCKED, so any number of worker
+    processes can poll without handing the same job out twice. Failed
+    attempts are retried with exponential backoff up to max_attempts.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, JobHandler] = {}
+        # The job each worker thread is running, for report_progress
+        self._running = threading.local()
+
+    def handler(self, kind: str) -> Callable[[JobHandler], JobHandler]:
+        """Register the function that runs jobs of ``kind``"""
+        def register(fn: JobHandler) -> JobHandler:
+            self._handlers[kind] = fn
+            return fn
+        return register
+
+    def enqueue(
+        self,
+        db: Session,
+        kind: str,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        created_by: Any = None,
+        delay: float = 0,
+        max_attempts: Optional[int] = None,
+        commit: bool = True
+    ) -> Job:
+        """Queue a job; with ``commit=False`` it lands with the caller's commit"""
+        job = Job(
+            kind=kind,
+            payload=payload or {},
+            status=JobStatus.QUEUED,
+            attempts=0,
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            created_by=created_by,
+        )
+        if delay:
+            job.run_at = func.now() + timedelta(seconds=delay)
+        db.add(job)
+        if commit:
+            db.commit()
+            db.refresh(job)
+        else:
+            db.flush()
+        return job
+
+    def claim(self, db: Session, worker_id: str) -> Optional[Job]:
+        """Lock the next due job for ``worker_id``, or None if there is none"""
+        due = (
+            select(Job.id)
+            .where(Job.status == JobStatus.QUEUED, Job.run_at <= func.now())
+            .order_by(Job.run_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Job)
+            .where(Job.id == due)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=Job.attempts + 1,
+                locked_at=func.now(),
+                locked_by=worker_id,
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        job = db.scalars(stmt).first()
+        db.commit()
+        return job
+
+    def requeue_stale(self, db: Session) -> int:
+        """Hand jobs locked by a worker that died mid-run back to the queue"""
+        stale = (Job.status == JobStatus.RUNNING) & (
+            Job.locked_at < func.now() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+        )
+        requeued = db.execute(
+            update(Job)
+            .where(stale, Job.attempts < Job.max_attempts)
+            .values(status=JobStatus.QUEUED, locked_at=None, locked_by=None, run_at=func.now())
+        ).rowcount
+        db.execute(
+            update(Job)
+            .where(stale)
+            .values(
+                status=JobStatus.FAILED,
+                locked_at=None,
+                locked_by=None,
+                finished_at=func.now(),
+                last_error="Worker lost while running the job",
+            )
+        )
+        db.commit()
+        return requeued
+
+    @staticmethod
+    def backoff(attempts: int) -> float:
+        """Seconds before retrying after the ``attempts``-th failure (jittered)"""
+        delay = min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_SECONDS)
+        return random.uniform(delay / 2, delay)
+
+    def run(self, db: Session, job: Job) -> None:
+        """Run a claimed job and record its outcome"""
+        handler = self._handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise PermanentJobError(f"No handler for job kind {job.kind!r}")
+            self._running.job = job
+            result = handler(db, dict(job.payload or {}))
+        except Exception as exc:
+            db.rollback()
+            self._failed(db, job, exc)
+            return
+        finally:
+            self._running.job = None
+        job.status = JobStatus.SUCCEEDED
+        job.result = result
+        job.last_error = None
+        job.locked_at = None
+        job.locked_by = None
+        job.finished_at = func.now()
+        db.commit()
+
+    def report_progress(self, db: Session, result: Dict[str, Any]) -> None:
+        """Publish a partial ``result`` for the job this thread is running.
+
+        Commits ``db`` (the session the handler was given). A failed job
+        keeps the last progress it reported.
+        """
+        job = getattr(self._running, "job", None)
+        if job is None:
+            raise RuntimeError("report_progress called outside a running job")
+        job.result = dict(result)
+        db.commit()
+
+    def _failed(self, db: Session, job: Job, exc: Exception) -> None:
+        retry = not isinstance(exc, PermanentJobError) and job.attempts < job.max_attempts
+        logger.warning(
+            "Job %s (%s) attempt %s/%s failed: %s",
+            job.id, job.kind, job.attempts, job.max_attempts, exc, exc_info=not retry,
+        )
+        if retry:
+            job.status = JobStatus.QUEUED
+            job.run_at = func.now() + timedelta(seconds=self.backoff(job.attempts))
+        else:
+            job.status = JobStatus.FAILED
+            job.finished_at = func.now()
+        job.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+        job.locked_at = None
+        job.locked_by = None
+        db.commit()
+
+class Worker:
+    """Polls the queue and runs jobs one at a time; one per worker thread"""
+
+    # Look for orphaned jobs every this many idle polls
+    STALE_CHECK_POLLS = 60
+    _ids = itertools.count(1)
+
+    def __init__(self, queue: "JobQueue", worker_id: Optional[str] = None):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{next(self._ids)}"
+
+    def run_once(self) -> bool:
+        """Claim and run one job; False if none was due"""
+        db = SessionLocal()
+        try:
+            job = self.queue.claim(db, self.worker_id)
+            if job is None:
+                return False
+            self.queue.run(db, job)
+            return True
+        finally:
+            db.close()
+
+    def run(self, stop: threading.Event) -> None:
+        idle_polls = 0
+        while not stop.is_set():
+            try:
+                if self.run_once():
+                    idle_polls = 0
+                    continue
+                if idle_polls % self.STALE_CHECK_POLLS == 0:
+                    db = SessionLocal()
+                    try:
+                        self.queue.requeue_stale(db)
+                    finally:
+                        db.close()
+                idle_polls += 1
+            except Exception:
+                # Keep polling through database hiccups
+                logger.exception("Job worker %s poll failed", self.worker_id)
+            stop.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+
+job_queue = JobQueue()
@@ -0,0 +1,157 @@
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Float, Text, case, cast, func, literal, literal_column, or_, select, union_all
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+from app.models.contact import Contact
+from app.models.enquiry import Enquiry
+from app.models.land_parcel import LandParcel
+from app.models.lead import Lead
+
+MIN_QUERY_LENGTH = 2
+MIN_PHONE_DIGITS = 4
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """How one entity type is matched and presented in search results.
+
+    ``fuzzy`` columns carry trigram indexes and ``phones`` are matched on
+    digit substrings; both come from alembic revision 0004 together with the
+    generated ``search_vector`` column.
+    """
+    model: Any
+    title: Any
+    subtitle: Tuple[Any, ...]
+    fuzzy: Tuple[Any, ...]
+    phones: Tuple[Any, ...] = ()
+
+def phone_digits(column):
+    # Inlined literals so the expression matches the index from revision 0004
+    return func.regexp_replace(
+        column, literal_column(r"'\D'"), literal_column("''"), literal_column("'g'")
+    )
+
+SEARCH_TARGETS: Dict[str, SearchTarget] = {
+    "lead": SearchTarget(
+        Lead,
+        title=Lead.name,
+        subtitle=(Lead.company, Lead.email, Lead.phone),
+        fuzzy=(Lead.name, Lead.email),
+        phones=(Lead.phone,),
+    ),
+    "contact": SearchTarget(
+        Contact,
+        title=Contact.name,
+        subtitle=(Contact.company, Contact.email, Contact.phone),
+        fuzzy=(Contact.name, Contact.email),
+        phones=(Contact.phone, Contact.alternate_phone),
+    ),
+    "enquiry": SearchTarget(
+        Enquiry,
+        title=Enquiry.customer_name,
+        subtitle=(Enquiry.subject, Enquiry.customer_email, Enquiry.customer_phone),
+        fuzzy=(Enquiry.customer_name, Enquiry.customer_email),
+        phones=(Enquiry.customer_phone,),
+    ),
+    "land_parcel": SearchTarget(
+        LandParcel,
+        title=LandParcel.survey_number,
+        subtitle=(LandParcel.village, LandParcel.district, LandParcel.owner_name),
+        fuzzy=(LandParcel.survey_number, LandParcel.village, LandParcel.owner_name),
+        phones=(LandParcel.owner_contact,),
+    ),
+}
+
+def _prefix_tsquery(q: str) -> Optional[str]:
+    # Every word must match as a prefix: "jo smi" -> "jo:* & smi:*"
+    words = re.findall(r"\w+", q)
+    return " & ".join(f"{word}:*" for word in words) if words else None
+
+class SearchService:
+    """Ranked search across leads, contacts, enquiries and land parcels.
+
+    A row matches on its full-text ``search_vector`` (word prefixes), on
+    trigram word similarity of its name-like columns or on a digit
+    substring of its phone numbers. Each match is scored in [0, 1.5]:
+    full-text hits rank above fuzzy ones, so exact words beat typos.
+    """
+
+    def _target_query(self, kind: str, target: SearchTarget, q: str, limit: int, scope=None):
+        model = target.model
+        vector = literal_column(f"{model.__tablename__}.search_vector", type_=TSVECTOR)
+        conditions = []
+        scores = []
+        prefix_query = _prefix_tsquery(q)
+        if prefix_query:
+            tsquery = func.to_tsquery(literal_column("'simple'::regconfig"), prefix_query)
+            matched = vector.op("@@")(tsquery)
+            conditions.append(matched)
+            scores.append(case(
+                # normalization 32 scales the rank into [0, 1)
+                (matched, 0.5 + func.ts_rank_cd(vector, tsquery, 32, type_=Float)), else_=0.0
+            ))
+        for column in target.fuzzy:
+            # 'q <% column' is the index-assisted form of word_similarity()
+            conditions.append(literal(q).op("<%")(column))
+            scores.append(func.word_similarity(q, func.coalesce(column, ""), type_=Float))
+        digits = re.sub(r"\D", "", q)
+        if len(digits) >= MIN_PHONE_DIGITS:
+            for column in target.phones:
+                # Compare digits only so "98765 43210" matches "+91-9876543210"
+                phone_match = phone_digits(column).contains(digits)
+                conditions.append(phone_match)
+                scores.append(case((phone_match, 1.0), else_=0.0))
+
+        score = (func.greatest(*scores) if len(scores) > 1 else scores[0]).label("score")
+        stmt = (
+            select(
+                literal(kind).label("type"),
+                cast(model.id, Text).label("id"),
+                target.title.label("title"),
+                func.concat_ws(" · ", *target.subtitle).label("subtitle"),
+                score,
+            )
+            .where(or_(*conditions))
+            .order_by(score.desc())
+            .limit(limit)
+        )
+        if scope is not None:
+            stmt = stmt.where(scope)
+        return stmt.subquery()
+
+    def search(
+        self,
+        db: Session,
+        q: str,
+        *,
+        types: Optional[Iterable[str]] = None,
+        limit: int = 20,
+        scopes: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top ``limit`` matches for ``q`` across ``types`` (default: all).
+
+        ``scopes`` maps a type to an extra WHERE clause, e.g. restricting
+        leads to the current employee.
+        """
+        scopes = scopes or {}
+        kinds = list(types) if types else list(SEARCH_TARGETS)
+        # Each type contributes at most `limit` rows, so the merge stays small
+        parts = [
+            self._target_query(kind, SEARCH_TARGETS[kind], q, limit, scopes.get(kind))
+            for kind in kinds
+        ]
+        merged = union_all(*(select(*part.c) for part in parts)).subquery()
+        stmt = select(merged).order_by(merged.c.score.desc(), merged.c.title).limit(limit)
+        return [
+            {
+                "type": row.type,
+                "id": row.id,
+                "title": row.title,
+                "subtitle": row.subtitle or None,
+                "score": round(float(row.score), 4),
+            }
+            for row in db.execute(stmt)
+        ]
+
+search_service = SearchService()
@@ -0,0 +1,167 @@
+import logging
+import threading
+from typing import Any, Dict, Optional
+from sqlalchemy import Integer, Numeric, column, func, select, table, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.enquiry import Enquiry, EnquiryStatus
+from app.models.inventory import InventoryItem
+from app.models.lead import Lead
+from app.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+# Materialized views created by alembic revision 0003
+lead_summary = table(
+    "lead_summary",
+    column("assigned_employee_id", Lead.assigned_employee_id.type),
+    column("status", Lead.status.type),
+    column("source", Lead.source.type),
+    column("lead_count", Integer),
+    column("refreshed_at", Lead.created_at.type),
+)
+inventory_summary = table(
+    "inventory_summary",
+    column("project_id", InventoryItem.project_id.type),
+    column("status", InventoryItem.status.type),
+    column("unit_count", Integer),
+    column("total_value", Numeric),
+    column("refreshed_at", InventoryItem.created_at.type),
+)
+enquiry_summary = table(
+    "enquiry_summary",
+    column("status", Enquiry.status.type),
+    column("enquiry_count", Integer),
+    column("oldest_created_at", Enquiry.created_at.type),
+    column("refreshed_at", Enquiry.created_at.type),
+)
+SUMMARY_VIEWS = (lead_summary, inventory_summary, enquiry_summary)
+
+BACKLOG_STATUSES = (EnquiryStatus.OPEN, EnquiryStatus.IN_PROGRESS)
+
+# pg advisory lock id so only one worker refreshes at a time
+REFRESH_LOCK_ID = 0x5ca1ab1e
+
+def _key(value) -> Optional[str]:
+    return value.value if value is not None else None
+
+class StatsService:
+    """Dashboard aggregates served from materialized views.
+
+    Reads cost the same no matter how large the base tables grow; the views
+    are refreshed concurrently every STATS_REFRESH_SECONDS by a background
+    thread (or on demand), so figures lag writes by at most that interval.
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self, db: Session) -> bool:
+        """Refresh all summary views; False if another worker holds the lock"""
+        acquired = db.execute(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_ID))
+        ).scalar()
+        if not acquired:
+            db.rollback()
+            return False
+        for view in SUMMARY_VIEWS:
+            db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view.name}"))
+        db.commit()
+        return True
+
+    def dashboard(self, db: Session, *, employee_id: Any = None) -> Dict[str, Any]:
+        """Dashboard payload; lead figures are limited to employee_id if given"""
+        lead_query = select(
+            lead_summary.c.status,
+            lead_summary.c.source,
+            func.sum(lead_summary.c.lead_count).label("lead_count"),
+            func.min(lead_summary.c.refreshed_at).label("refreshed_at"),
+        ).group_by(lead_summary.c.status, lead_summary.c.source)
+        if employee_id is not None:
+            lead_query = lead_query.where(lead_summary.c.assigned_employee_id == employee_id)
+
+        by_status: Dict[Optional[str], int] = {}
+        by_source: Dict[Optional[str], int] = {}
+        refreshed = []
+        for row in db.execute(lead_query):
+            count = int(row.lead_count)
+            by_status[_key(row.status)] = by_status.get(_key(row.status), 0) + count
+            by_source[_key(row.source)] = by_source.get(_key(row.source), 0) + count
+            refreshed.append(row.refreshed_at)
+
+        projects: Dict[Any, Dict[str, Any]] = {}
+        inventory_query = (
+            select(inventory_summary, Project.name.label("project_name"))
+            .outerjoin(Project, Project.id == inventory_summary.c.project_id)
+            .order_by(Project.name)
+        )
+        for row in db.execute(inventory_query):
+            entry = projects.setdefault(row.project_id, {
+                "project_id": row.project_id,
+                "project_name": row.project_name,
+                "units": 0,
+                "value": 0.0,
+                "by_status": {},
+            })
+            value = float(row.total_value)
+            entry["units"] += row.unit_count
+            entry["value"] += value
+            entry["by_status"][_key(row.status)] = {"units": row.unit_count, "value": value}
+            refreshed.append(row.refreshed_at)
+
+        enquiries: Dict[Optional[str], Dict[str, Any]] = {}
+        for row in db.execute(select(enquiry_summary)):
+            enquiries[_key(row.status)] = {
+                "count": row.enquiry_count,
+                "oldest_created_at": row.oldest_created_at,
+            }
+            refreshed.append(row.refreshed_at)
+
+        return {
+            "leads": {
+                "total": sum(by_status.values()),
+                "by_status": by_status,
+                "by_source": by_source,
+            },
+            "inventory": list(projects.values()),
+            "enquiries": {
+                "by_status": enquiries,
+                "backlog": sum(enquiries.get(s.value, {}).get("count", 0) for s in BACKLOG_STATUSES),
+            },
+            # Oldest refresh across the views; None until the first refresh
+            # has populated anything.
+            "refreshed_at": min(refreshed) if refreshed else None,
+        }
+
+    def _refresh_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            db = SessionLocal()
+            try:
+                self.refresh(db)
+            except Exception:
+                logger.exception("Dashboard summary refresh failed")
+            finally:
+                db.close()
+
+    def start(self) -> None:
+        """Start the periodic refresh thread (no-op if disabled or running)"""
+        if settings.STATS_REFRESH_SECONDS <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(settings.STATS_REFRESH_SECONDS,),
+            name="stats-refresh",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+stats_service = StatsService()
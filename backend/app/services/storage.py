@@ -0,0 +1,101 @@
+import hashlib
+import hmac
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Protocol, Sequence, Tuple
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+class FileTooLarge(ValueError):
+    def __init__(self, limit: int):
+        super().__init__(f"File exceeds the {limit} byte limit")
+        self.limit = limit
+
+class ChunkReader(Protocol):
+    """Anything with an async ``read(size)``, e.g. fastapi.UploadFile"""
+
+    async def read(self, size: int = -1) -> bytes:
+        ...
+
+@dataclass(frozen=True)
+class PresignedUpload:
+    """Direct-to-storage upload: send the file to ``url`` with ``method``.
+
+    POST uploads are multipart forms carrying ``fields`` before the file
+    part (S3); PUT uploads send the raw body with ``headers`` (Supabase).
+    """
+    method: str
+    url: str
+    expires_in: int
+    fields: Dict[str, str] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+
+def get_storage():
+    """The service for STORAGE_BACKEND (imported here: both import this module)"""
+    if settings.STORAGE_BACKEND == "s3":
+        from app.services.aws_s3 import s3_service
+        return s3_service
+    from app.services.supabase_service import supabase_service
+    return supabase_service
+
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+def object_key(filename: Optional[str], entity_type: Optional[str] = None) -> str:
+    """Unique storage key that keeps a readable, sanitized file name"""
+    name = _UNSAFE_NAME.sub("-", filename or "").strip("-.")[:120] or "file"
+    prefix = _UNSAFE_NAME.sub("-", entity_type or "").strip("-") or "misc"
+    return f"{prefix}/{uuid.uuid4()}/{name}"
+
+# A direct upload can be registered until this long after its upload URL
+# expires (the upload itself may finish right at the deadline)
+UPLOAD_TOKEN_GRACE_SECONDS = 3600
+
+def _upload_signature(key: str, user_id: Any, expires_at: int) -> str:
+    message = f"upload\n{key}\n{user_id}\n{expires_at}".encode()
+    return hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+def upload_token(key: str, user_id: Any, expires_in: int) -> str:
+    """Proof that ``key`` was issued to ``user_id`` by POST /uploads"""
+    expires_at = int(time.time()) + expires_in + UPLOAD_TOKEN_GRACE_SECONDS
+    return f"{expires_at}.{_upload_signature(key, user_id, expires_at)}"
+
+def verify_upload_token(token: str, key: str, user_id: Any) -> bool:
+    expires_at, _, signature = token.partition(".")
+    if not expires_at.isdigit() or int(expires_at) < time.time():
+        return False
+    return hmac.compare_digest(signature, _upload_signature(key, user_id, int(expires_at)))
+
+class URLSigner(Protocol):
+    def presigned_download_urls(self, keys: Sequence[str], expires_in: int) -> Dict[str, str]:
+        ...
+
+# key -> (signed url, time.time() it expires)
+signed_url_cache = TTLCache(maxsize=settings.SIGNED_URL_CACHE_MAX_SIZE, ttl=settings.FILE_URL_EXPIRE_SECONDS)
+
+def signed_download_urls(signer: URLSigner, keys: Sequence[str]) -> Dict[str, Tuple[str, int]]:
+    """Signed download URLs for ``keys`` as key -> (url, seconds left).
+
+    Cached URLs are reused until SIGNED_URL_MIN_REMAINING_SECONDS before
+    they expire; everything else is signed in a single batched call.
+    Keys the backend could not sign are left out.
+    """
+    expires_in = settings.FILE_URL_EXPIRE_SECONDS
+    reuse_for = expires_in - settings.SIGNED_URL_MIN_REMAINING_SECONDS
+    now = time.time()
+    urls: Dict[str, Tuple[str, int]] = {}
+    missing = []
+    for key in dict.fromkeys(keys):
+        cached = signed_url_cache.get(key)
+        if cached is None:
+            missing.append(key)
+        else:
+            url, expires_at = cached
+            urls[key] = (url, int(expires_at - now))
+    if missing:
+        for key, url in signer.presigned_download_urls(missing, expires_in).items():
+            if reuse_for > 0:
+                signed_url_cache.set(key, (url, now + expires_in), ttl=reuse_for)
+            urls[key] = (url, expires_in)
+    return urls
@@ -1,18 +1,61 @@
-from supabase import create_client, Client
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
+from app.services.storage import ChunkReader, FileTooLarge, PresignedUpload
 import logging
-from typing import Optional, Dict, Any
+import os
+import posixpath
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Optional, Dict, Any, Sequence
 import uuid
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = logging.getLogger(__name__)
 
+# Fixed by Supabase Storage for create_signed_upload_url
+SIGNED_UPLOAD_URL_SECONDS = 2 * 60 * 60
+
 class SupabaseService:
+    """Supabase Storage and table helpers around one lazily created client.
+
+    The supabase package and its client are only loaded on first use, so
+    importing the app stays fast and works without Supabase credentials.
+    """
+
     def __init__(self):
-        self.supabase: Client = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_SERVICE_ROLE_KEY
-        )
+        self._client: Optional["Client"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def supabase(self) -> "Client":
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    if not (settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY):
+                        raise Exception("Supabase not configured")
+                    from supabase import create_client
+                    self._client = create_client(
+                        settings.SUPABASE_URL,
+                        settings.SUPABASE_SERVICE_ROLE_KEY
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """Close the client's HTTP connections; the next use opens new ones"""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is None:
+            return
+        # PostgREST and Storage sessions only exist once they were used
+        for sub_client in (getattr(client, "_postgrest", None), getattr(client, "_storage", None)):
+            if sub_client is not None:
+                try:
+                    sub_client.session.close()
+                except Exception as e:
+                    logger.warning(f"Error closing Supabase client session: {e}")
     
     async def upload_file(self, file_content: bytes, file_name: str, bucket: str = "documents") -> Optional[str]:
         """Upload file to Supabase Storage and return public URL"""
@@ -21,19 +64,17 @@ class SupabaseService:
             file_extension = file_name.split('.')[-1] if '.' in file_name else ''
             unique_filename = f"{uuid.uuid4()}.{file_extension}" if file_extension else str(uuid.uuid4())
             
-            # Upload file
-            result = self.supabase.storage.from_(bucket).upload(
+            # Upload file; the storage client is synchronous
+            storage = self.supabase.storage.from_(bucket)
+            await run_in_threadpool(
+                storage.upload,
                 unique_filename,
                 file_content,
-                file_options={"content-type": "application/octet-stream"}
+                {"content-type": "application/octet-stream"}
             )
             
-            if result.error:
-                logger.error(f"Error uploading file: {result.error}")
-                return None
-            
             # Get public URL
-            public_url = self.supabase.storage.from_(bucket).get_public_url(unique_filename)
+            public_url = storage.get_public_url(unique_filename)
             return public_url
             
         except Exception as e:
@@ -43,8 +84,8 @@ class SupabaseService:
     async def delete_file(self, file_path: str, bucket: str = "documents") -> bool:
         """Delete file from Supabase Storage"""
         try:
-            result = self.supabase.storage.from_(bucket).remove([file_path])
-            return not result.error
+            await run_in_threadpool(self.supabase.storage.from_(bucket).remove, [file_path])
+            return True
         except Exception as e:
             logger.error(f"Error deleting file from Supabase: {e}")
             return False
@@ -57,6 +98,93 @@ class SupabaseService:
             logger.error(f"Error getting file URL: {e}")
             return None
     
+    async def upload_stream(self, stream: ChunkReader, key: str, content_type: str) -> int:
+        """Stream ``stream`` into STORAGE_BUCKET at ``key`` and return its size.
+
+        The storage client needs a real file, so chunks are spooled to a
+        temporary file (never held in memory as a whole) which the client
+        then streams from a worker thread.
+        """
+        fd, path = tempfile.mkstemp(prefix="upload-")
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                while True:
+                    chunk = await stream.read(settings.UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > settings.FILE_MAX_BYTES:
+                        raise FileTooLarge(settings.FILE_MAX_BYTES)
+                    await run_in_threadpool(spool.write, chunk)
+            await run_in_threadpool(self.upload_path, path, key, content_type)
+        finally:
+            os.remove(path)
+        return size
+
+    def upload_path(self, path: str, key: str, content_type: str) -> None:
+        """Upload the local file at ``path`` to ``key`` (blocking)"""
+        with open(path, "rb") as source:
+            self.supabase.storage.from_(settings.STORAGE_BUCKET).upload(
+                key, source, {"content-type": content_type}
+            )
+
+    def download_path(self, key: str, path: str) -> None:
+        """Download ``key`` to the local file ``path`` (blocking).
+
+        The storage client returns the object as one bytes value, so it is
+        held in memory while being written out.
+        """
+        data = self.supabase.storage.from_(settings.STORAGE_BUCKET).download(key)
+        with open(path, "wb") as target:
+            target.write(data)
+
+    def presigned_upload(self, key: str, content_type: str, expires_in: int) -> PresignedUpload:
+        """Signed PUT URL for uploading straight to the bucket.
+
+        Supabase fixes the lifetime of signed upload URLs at two hours,
+        whatever ``expires_in`` asks for.
+        """
+        signed = self.supabase.storage.from_(settings.STORAGE_BUCKET).create_signed_upload_url(key)
+        return PresignedUpload(
+            method="PUT",
+            url=signed["signed_url"],
+            headers={"content-type": content_type},
+            expires_in=SIGNED_UPLOAD_URL_SECONDS,
+        )
+
+    def presigned_download_url(self, key: str, expires_in: int, filename: Optional[str] = None) -> str:
+        options = {"download": filename} if filename else None
+        signed = self.supabase.storage.from_(settings.STORAGE_BUCKET).create_signed_url(key, expires_in, options)
+        return signed.get("signedUrl") or signed["signedURL"]
+
+    def presigned_download_urls(self, keys: Sequence[str], expires_in: int) -> Dict[str, str]:
+        """Sign ``keys`` in one request; keys that failed to sign are left out"""
+        if not keys:
+            return {}
+        signed = self.supabase.storage.from_(settings.STORAGE_BUCKET).create_signed_urls(
+            list(keys), expires_in, {"download": True}
+        )
+        urls = {}
+        for item in signed:
+            if item.get("error"):
+                logger.warning(f"Could not sign {item.get('path')}: {item['error']}")
+                continue
+            urls[item["path"]] = item.get("signedUrl") or item["signedURL"]
+        return urls
+
+    def object_size(self, key: str) -> Optional[int]:
+        """Size of ``key`` in bytes, or None if it does not exist"""
+        folder, name = posixpath.split(key)
+        entries = self.supabase.storage.from_(settings.STORAGE_BUCKET).list(folder, {"search": name})
+        for entry in entries:
+            if entry.get("name") == name:
+                return (entry.get("metadata") or {}).get("size")
+        return None
+
+    async def delete_object(self, key: str) -> bool:
+        return await self.delete_file(key, bucket=settings.STORAGE_BUCKET)
+    
     def create_user_profile(self, user_id: str, profile_data: Dict[str, Any]) -> Optional[Dict]:
         """Create user profile in employees table"""
         try:
@@ -0,0 +1,102 @@
+import logging
+import time
+from typing import Awaitable, Callable, List
+from sqlalchemy import Connection
+from sqlalchemy.orm import Session, configure_mappers
+from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+from app.core.security import supabase_keys
+from app.crud.crud_developer import developer_crud
+from app.crud.crud_inventory import inventory_crud
+from app.crud.crud_lead import lead
+from app.crud.crud_project import project_crud
+from app.database import async_engine, engine
+from app.services.storage import get_storage
+from app.services.supabase_service import supabase_service
+
+logger = logging.getLogger(__name__)
+
+# First pages of the busiest lists, as their routes query them. Running
+# them once compiles and caches their SQL; on asyncpg connections it also
+# prepares the statements, which are cached per connection.
+HOT_QUERIES: List[Callable[[Session], object]] = [
+    lambda db: lead.get_page(db, limit=1),
+    lambda db: inventory_crud.get_page(db, limit=1, include="project"),
+    lambda db: project_crud.get_page(db, limit=1, include="developer"),
+    lambda db: developer_crud.get_page(db, limit=1),
+]
+
+def _warm_count(pool) -> int:
+    # NullPool (DB_PGBOUNCER) keeps nothing to warm; overflow connections
+    # are closed on check-in, so only the core pool is worth filling.
+    if not isinstance(pool, QueuePool):
+        return 0
+    return max(0, min(settings.DB_POOL_WARM_CONNECTIONS, settings.DB_POOL_SIZE))
+
+def _run_hot_queries(connection: Connection) -> None:
+    db = Session(bind=connection)
+    try:
+        for query in HOT_QUERIES:
+            query(db)
+    finally:
+        db.close()
+
+def warm_database() -> int:
+    """Fill the sync pool and run the hot queries; returns connections opened"""
+    configure_mappers()
+    connections = []
+    try:
+        # Held open together, or the pool would hand back the same one
+        for _ in range(_warm_count(engine.pool)):
+            connections.append(engine.connect())
+        if connections:
+            _run_hot_queries(connections[0])
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+async def warm_async_database() -> int:
+    """Fill the async pool, running the hot queries on every connection"""
+    if async_engine is None:
+        return 0
+    connections = []
+    try:
+        for _ in range(_warm_count(async_engine.sync_engine.pool)):
+            connections.append(await async_engine.connect())
+        for connection in connections:
+            await connection.run_sync(_run_hot_queries)
+    finally:
+        for connection in connections:
+            await connection.close()
+    return len(connections)
+
+def warm_clients() -> str:
+    """Create the storage clients and fetch Supabase signing keys"""
+    warmed = []
+    if settings.STORAGE_BACKEND == "s3" and get_storage().s3_client is not None:
+        warmed.append("s3")
+    if settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY and supabase_service.supabase:
+        warmed.append("supabase")
+    if settings.SUPABASE_JWT_VERIFY and not settings.SUPABASE_JWT_SECRET:
+        supabase_keys.warm()
+        warmed.append("jwks")
+    return ",".join(warmed) or "none"
+
+async def _step(name: str, fn: Callable[..., Awaitable[object]], *args) -> None:
+    start = time.perf_counter()
+    try:
+        result = await fn(*args)
+    except Exception:
+        # A cold start is still better than a worker that will not boot
+        logger.exception("Warmup step %s failed", name)
+        return
+    logger.info("Warmup %s: %s in %.0fms", name, result, (time.perf_counter() - start) * 1000)
+
+async def warm_up() -> None:
+    """Lifespan startup warmup; failures are logged, never raised"""
+    await _step("database", run_in_threadpool, warm_database)
+    if async_engine is not None:
+        await _step("async database", warm_async_database)
+    await _step("clients", run_in_threadpool, warm_clients)
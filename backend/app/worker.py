@@ -0,0 +1,45 @@
+"""Background job worker.
+
+Run one or more alongside the API (``python -m app.worker``); each claims
+due jobs from the ``jobs`` table, so no broker is needed. SIGTERM/SIGINT
+let the running jobs finish before exiting; CSV imports get
+SHUTDOWN_DRAIN_SECONDS and are then failed at their next batch.
+"""
+import argparse
+import logging
+import signal
+import threading
+from app.core.config import settings
+from app.services import job_handlers  # noqa: F401 -- registers the handlers
+from app.services.csv_import import csv_import_service
+from app.services.jobs import Worker, job_queue
+
+logger = logging.getLogger(__name__)
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=settings.JOB_WORKER_THREADS)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stop.set())
+
+    threads = [
+        threading.Thread(target=Worker(job_queue).run, args=(stop,), name=f"job-worker-{i}")
+        for i in range(max(args.threads, 1))
+    ]
+    for thread in threads:
+        thread.start()
+    logger.info("Job worker started with %d threads", len(threads))
+    # Thread.join() would not wake up for signals; Event.wait does
+    while not stop.wait(1):
+        pass
+    csv_import_service.shutdown(settings.SHUTDOWN_DRAIN_SECONDS)
+    for thread in threads:
+        thread.join()
+    logger.info("Job worker stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measure per-request bearer token verification cost.
+
+Issues --tokens distinct HS256 tokens (as /api/auth/login does) and times
+verify_token over --requests requests spread across them, once with the
+claims cache cleared before every call (a full jwt.decode each time) and
+once with it warm. No database or network is needed.
+
+    python -m benchmarks.auth_overhead --tokens 50 --requests 20000
+"""
+import argparse
+import random
+import time
+from app.core.metrics import Histogram
+from app.core.security import create_access_token, token_cache, verify_token
+
+
+def run(name, tokens, requests, cold):
+    rng = random.Random(7)
+    latency = Histogram(buckets=(0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001))
+    token_cache.clear()
+    for _ in range(requests):
+        token = rng.choice(tokens)
+        if cold:
+            token_cache.clear()
+        start = time.perf_counter()
+        verify_token(token)
+        latency.observe(time.perf_counter() - start)
+    stats = latency.stats()
+    print(
+        f"{name:>6}: mean {stats['mean'] * 1e6:.1f}us p50<={stats['p50'] * 1e6:.0f}us "
+        f"p99<={stats['p99'] * 1e6:.0f}us max {stats['max'] * 1e6:.0f}us"
+    )
+    return stats["mean"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    tokens = [create_access_token({"sub": f"user-{i}"}) for i in range(args.tokens)]
+    cold = run("decode", tokens, args.requests, cold=True)
+    warm = run("cached", tokens, args.requests, cold=False)
+    print(f"speedup: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare single-row vs bulk insert throughput for leads.
+
+Runs against DATABASE_URL and deletes the rows it creates afterwards.
+
+    python -m benchmarks.bulk_insert --rows 2000
+"""
+import argparse
+import time
+import uuid
+from app.crud.crud_lead import lead
+from app.database import SessionLocal
+from app.models.lead import Lead
+from app.schemas.lead import LeadCreate
+
+
+def make_rows(count: int, tag: str):
+    return [
+        LeadCreate(name=f"{tag}-{i}", company="Bench Co", budget=1000 + i)
+        for i in range(count)
+    ]
+
+
+def single_row(db, rows):
+    for obj_in in rows:
+        lead.create(db, obj_in=obj_in)
+
+
+def bulk(db, rows):
+    result = lead.create_many(db, objs_in=dict(enumerate(rows)))
+    assert not result.errors, result.errors[:5]
+
+
+def run(name, fn, count):
+    tag = f"bench-{uuid.uuid4().hex[:8]}"
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        fn(db, make_rows(count, tag))
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12}: {count} rows in {elapsed:.2f}s ({count / elapsed:,.0f} rows/s)")
+    finally:
+        db.query(Lead).filter(Lead.name.like(f"{tag}-%")).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+    run("single-row", single_row, args.rows)
+    run("bulk", bulk, args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Check how long importing app.main takes against a budget.
+
+Runs ``python -X importtime -c "import app.main"`` in fresh interpreters
+(--runs of them, keeping the fastest to cut noise), prints the slowest
+modules by cumulative and self time, and exits 1 when the import exceeds
+--budget-ms or pulls in a module that should only load on first use
+(the Supabase and AWS SDKs; see --forbid). Environment variables pass
+through, so run it with the settings a worker would boot with.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 1500 --top 25
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# Loaded lazily by the service clients; importing one of them at startup
+# is a regression even when the total still fits the budget.
+LAZY_MODULES = ("supabase", "storage3", "postgrest", "boto3", "botocore")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure(target: str) -> Dict[str, Tuple[int, int, int]]:
+    """{module: (self_us, cumulative_us, depth)} for one fresh import of ``target``"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=os.environ.copy(),
+    )
+    if result.returncode != 0:
+        sys.exit(f"import {target} failed:\n{result.stderr[-2000:]}")
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=2000)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--forbid", nargs="*", default=list(LAZY_MODULES),
+                        help="top-level packages that must not be imported")
+    args = parser.parse_args()
+
+    runs = [measure(args.target) for _ in range(args.runs)]
+    totals = [modules[args.target][1] / 1000 for modules in runs]
+    fastest = runs[totals.index(min(totals))]
+
+    print(f"import {args.target}: min {min(totals):.1f}ms, max {max(totals):.1f}ms "
+          f"over {args.runs} runs (budget {args.budget_ms:.0f}ms)")
+    for label, index in (("cumulative", 1), ("self", 0)):
+        print(f"\nslowest by {label} time:")
+        ranked = sorted(fastest.items(), key=lambda item: item[1][index], reverse=True)
+        for name, timings in ranked[:args.top]:
+            print(f"{timings[index] / 1000:>9.1f}ms  {name}")
+
+    failures = []
+    if min(totals) > args.budget_ms:
+        failures.append(f"import took {min(totals):.1f}ms, budget is {args.budget_ms:.0f}ms")
+    loaded = {name.split(".")[0] for name in fastest}
+    for package in args.forbid:
+        if package in loaded:
+            failures.append(f"{package} is imported at startup")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""Load-test the read API against the data from benchmarks.seed.
+
+--users virtual users each loop over weighted scenarios (lead, inventory
+and project listings with filters, cursor paging and includes, project
+detail and /api/auth/me) for --seconds after a --warmup that is not
+recorded. Each endpoint reports throughput, p50/p95/p99 latency and SQL
+statements per request; the statement counts are the change in the
+app's own /metrics histograms over the measured window.
+
+By default the app runs in-process behind httpx.ASGITransport (the
+client's overhead is then part of the numbers); --base-url drives a
+running server instead. Either way the token is minted for the seeded
+admin, so the server must share SECRET_KEY (or pass --token).
+
+--save writes the results as JSON; --compare checks them against such a
+file and exits 1 when an endpoint got slower or noisier than --tolerance
+allows, or issues more statements per request, so two commits can be
+compared on the same machine and data.
+
+    python -m benchmarks.seed
+    python -m benchmarks.load --users 50 --seconds 30 --save baseline.json
+    git checkout my-branch
+    python -m benchmarks.load --users 50 --seconds 30 --compare baseline.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+import httpx
+from app.core.security import create_access_token
+from benchmarks.seed import BENCH_ADMIN_USER_ID
+
+NEXT_CURSOR_HEADER = "x-next-cursor"
+# Statements per request may grow by less than this before it counts as a
+# regression; the average moves a little with cache hits.
+QUERY_SLACK = 0.5
+
+_SERIES = re.compile(r'^(http_request_sql_statements_(?:sum|count))\{(.*)\} (\S+)$')
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+class Scenario:
+    """One endpoint: a request builder, its weight and its /metrics route"""
+
+    def __init__(self, name: str, route: str, weight: int, build, pages: int = 1):
+        self.name = name
+        self.route = route
+        self.weight = weight
+        self.build = build
+        self.pages = pages
+
+
+def _project_id(ctx) -> Optional[str]:
+    return random.choice(ctx["project_ids"]) if ctx["project_ids"] else None
+
+
+SCENARIOS = (
+    Scenario("leads", "/api/leads/", 30, lambda ctx: {
+        "limit": 50, "sort": "-created_at",
+    }, pages=3),
+    Scenario("leads?status", "/api/leads/", 15, lambda ctx: {
+        "limit": 50, "status": random.choice(["new", "contacted", "qualified", "negotiation"]),
+        "sort": random.choice(["-created_at", "-budget"]),
+    }),
+    Scenario("inventory", "/api/inventory/", 20, lambda ctx: {
+        "limit": 50, "status": "available", "sort": "price", "include": "project",
+    }, pages=2),
+    Scenario("inventory?project", "/api/inventory/", 10, lambda ctx: {
+        "limit": 100, "project_id": _project_id(ctx),
+    }),
+    Scenario("projects", "/api/projects/", 10, lambda ctx: {
+        "limit": 50, "include": "developer,inventory_count",
+    }),
+    Scenario("project", "/api/projects/{project_id}", 5, lambda ctx: {
+        "_path": f"/api/projects/{_project_id(ctx)}", "include": "developer",
+    }),
+    Scenario("auth/me", "/api/auth/me", 10, lambda ctx: {}),
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.recording = False
+
+    def record(self, name: str, seconds: float, ok: bool) -> None:
+        if not self.recording:
+            return
+        self.latencies[name].append(seconds)
+        if not ok:
+            self.errors[name] += 1
+
+
+async def _request(client, recorder: Recorder, scenario: Scenario, ctx) -> None:
+    params = {key: value for key, value in scenario.build(ctx).items() if value is not None}
+    path = params.pop("_path", scenario.route)
+    for _ in range(scenario.pages):
+        start = time.perf_counter()
+        try:
+            response = await client.get(path, params=params)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            response, ok = None, False
+        recorder.record(scenario.name, time.perf_counter() - start, ok)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER) if ok else None
+        if not cursor:
+            return
+        params = {**params, "cursor": cursor}
+
+
+async def _user(client, recorder: Recorder, ctx, stop: asyncio.Event, think: float) -> None:
+    weights = [scenario.weight for scenario in SCENARIOS]
+    while not stop.is_set():
+        scenario = random.choices(SCENARIOS, weights)[0]
+        await _request(client, recorder, scenario, ctx)
+        if think:
+            await asyncio.sleep(random.uniform(0, 2 * think))
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (exact, no buckets)"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def parse_sql_counts(text: str) -> Dict[str, Tuple[float, float]]:
+    """{route: (statements, requests)} for GET routes in a /metrics scrape"""
+    totals: Dict[str, List[float]] = defaultdict(lambda: [0.0, 0.0])
+    for line in text.splitlines():
+        match = _SERIES.match(line)
+        if not match:
+            continue
+        labels = dict(_LABEL.findall(match.group(2)))
+        if labels.get("method") != "GET":
+            continue
+        index = 0 if match.group(1).endswith("_sum") else 1
+        totals[labels["route"]][index] += float(match.group(3))
+    return {route: (sums, count) for route, (sums, count) in totals.items()}
+
+
+async def _scrape(client, metrics_token: Optional[str]) -> Optional[Dict[str, Tuple[float, float]]]:
+    headers = {"Authorization": f"Bearer {metrics_token}"} if metrics_token else {}
+    try:
+        response = await client.get("/metrics", headers=headers)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200:
+        return None
+    return parse_sql_counts(response.text)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(recorder: Recorder, seconds: float, before, after) -> Dict[str, Dict[str, float]]:
+    # Scenarios sharing a route share its statement counts
+    queries: Dict[str, Optional[float]] = {}
+    if before is not None and after is not None:
+        for route, (sums, count) in after.items():
+            base_sums, base_count = before.get(route, (0.0, 0.0))
+            if count > base_count:
+                queries[route] = (sums - base_sums) / (count - base_count)
+    results = {}
+    for scenario in SCENARIOS:
+        latencies = recorder.latencies.get(scenario.name)
+        if not latencies:
+            continue
+        results[scenario.name] = {
+            "requests": len(latencies),
+            "errors": recorder.errors.get(scenario.name, 0),
+            "rps": len(latencies) / seconds,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "queries_per_request": queries.get(scenario.route),
+        }
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'endpoint':<20} {'requests':>9} {'errors':>7} {'req/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'sql/req':>8}")
+    for name, row in results.items():
+        queries = row["queries_per_request"]
+        print(f"{name:<20} {row['requests']:>9} {row['errors']:>7} {row['rps']:>8.1f} "
+              f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+              f"{'-' if queries is None else f'{queries:.2f}':>8}")
+
+
+def compare(results, baseline, tolerance: float) -> List[str]:
+    """Regressions of ``results`` against ``baseline`` as readable lines"""
+    regressions = []
+    for name, row in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if row["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.2f}ms -> {row['p95_ms']:.2f}ms")
+        if row["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['rps']:.1f} -> {row['rps']:.1f} req/s")
+        if row["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {row['errors']}")
+        queries, base_queries = row["queries_per_request"], base.get("queries_per_request")
+        if queries is not None and base_queries is not None and queries > base_queries + QUERY_SLACK:
+            regressions.append(f"{name}: sql/req {base_queries:.2f} -> {queries:.2f}")
+    return regressions
+
+
+async def _load_context(client) -> Dict[str, List[str]]:
+    response = await client.get("/api/projects/", params={"limit": 200, "fields": "id"})
+    response.raise_for_status()
+    return {"project_ids": [project["id"] for project in response.json()]}
+
+
+async def run(args) -> Dict[str, Dict[str, float]]:
+    token = args.token or create_access_token(
+        data={"sub": str(BENCH_ADMIN_USER_ID)}, expires_delta=timedelta(hours=1)
+    )
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout)
+    else:
+        from app.main import app
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=args.timeout
+        )
+    client.headers["Authorization"] = f"Bearer {token}"
+    async with client:
+        ctx = await _load_context(client)
+        if not ctx["project_ids"]:
+            sys.exit("No projects found; run python -m benchmarks.seed first")
+        recorder = Recorder()
+        stop = asyncio.Event()
+        users = [
+            asyncio.create_task(_user(client, recorder, ctx, stop, args.think_ms / 1000))
+            for _ in range(args.users)
+        ]
+        await asyncio.sleep(args.warmup)
+        before = await _scrape(client, args.metrics_token)
+        recorder.recording = True
+        start = time.perf_counter()
+        await asyncio.sleep(args.seconds)
+        recorder.recording = False
+        elapsed = time.perf_counter() - start
+        after = await _scrape(client, args.metrics_token)
+        stop.set()
+        await asyncio.gather(*users)
+    if before is None or after is None:
+        print("/metrics not readable (REQUEST_METRICS_ENABLED off or --metrics-token missing); "
+              "no SQL counts", file=sys.stderr)
+    return summarize(recorder, elapsed, before, after)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--think-ms", type=float, default=0, help="mean pause between a user's requests")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--base-url", help="drive a running server instead of the in-process app")
+    parser.add_argument("--token", help="bearer token to use instead of minting one")
+    parser.add_argument("--metrics-token", help="METRICS_TOKEN of the server, if set")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the request mix")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON from --save to check against")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    results = asyncio.run(run(args))
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w") as out:
+            json.dump({
+                "revision": _git_revision(),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "users": args.users,
+                "seconds": args.seconds,
+                "target": args.base_url or "in-process",
+                "endpoints": results,
+            }, out, indent=2)
+    if args.compare:
+        with open(args.compare) as source:
+            baseline = json.load(source)
+        print(f"\ncompared with {baseline.get('revision') or args.compare} "
+              f"(tolerance {args.tolerance:.0%})")
+        if (baseline.get("users"), baseline.get("target")) != (args.users, args.base_url or "in-process"):
+            print("warning: baseline used a different --users or target")
+        regressions = compare(results, baseline["endpoints"], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Measure /health latency while a storm of logins is in flight.
+
+Supabase Auth and the employee lookup are replaced by fakes that block
+for --auth-ms (a network round trip), so no credentials or database are
+needed. --concurrency logins run continuously while /health is probed on
+the same event loop; a blocked loop shows up directly in its p99.
+--inline runs the blocking calls on the event loop, as the auth routes
+used to, for comparison.
+
+    python -m benchmarks.login_storm --concurrency 50 --seconds 5
+    python -m benchmarks.login_storm --inline
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+import httpx
+from app.api import deps
+from app.api.routes import auth
+from app.core.metrics import Histogram
+from app.database import get_db
+from app.main import app
+from app.models.employee import UserRole
+
+
+class FakeAuth:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def sign_in_with_password(self, credentials):
+        time.sleep(self.delay)
+        user = SimpleNamespace(id=str(uuid.uuid4()), email=credentials["email"])
+        return SimpleNamespace(user=user, session=None)
+
+
+class FakeSession:
+    """Stands in for the employee lookup, blocking like a DB round trip"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def query(self, *entities):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        time.sleep(self.delay)
+        return SimpleNamespace(
+            id=uuid.uuid4(), username="storm", full_name="Storm User", role=UserRole.EMPLOYEE,
+            is_active=True
+        )
+
+
+async def _inline(fn, *args, **kwargs):
+    return fn(*args, **kwargs)
+
+
+async def login_loop(client, deadline, done):
+    body = {"email": "storm@example.com", "password": "x"}
+    while time.monotonic() < deadline:
+        response = await client.post("/api/auth/login", json=body)
+        response.raise_for_status()
+        done.append(1)
+
+
+async def probe_loop(client, deadline, latency, interval):
+    # Timed from when each probe was due, so time spent waiting for a
+    # blocked event loop to get round to sending it is counted too.
+    due = time.perf_counter()
+    while time.monotonic() < deadline:
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        response = await client.get("/health")
+        latency.observe(time.perf_counter() - due)
+        response.raise_for_status()
+        due = max(due + interval, time.perf_counter())
+
+
+async def storm(args):
+    supabase = SimpleNamespace(auth=FakeAuth(args.auth_ms / 1000))
+    session = FakeSession(args.db_ms / 1000)
+    app.dependency_overrides[deps.get_supabase] = lambda: supabase
+    app.dependency_overrides[get_db] = lambda: session
+    if args.inline:
+        auth.run_auth_blocking = _inline
+
+    latency = Histogram()
+    done = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://storm") as client:
+        deadline = time.monotonic() + args.seconds
+        await asyncio.gather(
+            *(login_loop(client, deadline, done) for _ in range(args.concurrency)),
+            probe_loop(client, deadline, latency, args.probe_ms / 1000),
+        )
+    stats = latency.stats()
+    mode = "inline" if args.inline else "auth pool"
+    print(
+        f"{mode}: {len(done)} logins in {args.seconds}s; /health over {stats['count']} probes: "
+        f"p50<={stats['p50'] * 1000:.1f}ms p99<={stats['p99'] * 1000:.1f}ms "
+        f"max {stats['max'] * 1000:.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--auth-ms", type=float, default=150.0, help="fake Supabase Auth latency")
+    parser.add_argument("--db-ms", type=float, default=5.0, help="fake employee lookup latency")
+    parser.add_argument("--probe-ms", type=float, default=10.0, help="pause between /health probes")
+    parser.add_argument("--inline", action="store_true", help="block the event loop like before")
+    asyncio.run(storm(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Check the number of SQL statements each list endpoint issues per request.
+
+Runs the list endpoints (with and without include=) against DATABASE_URL
+as an admin and exits non-zero if any request goes over its budget, which
+catches relationships that are lazy-loaded once per row. The reference
+cache is off and the app's lifespan (warmup, cache priming) does not run,
+so cached reads are counted as a cold request would issue them.
+
+    python -m benchmarks.query_budget --limit 100
+"""
+import argparse
+import sys
+import threading
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from app import database
+from app.api.deps import Principal, get_current_admin, get_current_user, get_current_user_async
+from app.core.cache import reference_cache
+from app.main import app
+from app.models.employee import UserRole
+
+# Statements allowed per request, independent of page size
+BUDGETS = {
+    "/api/projects/": 1,
+    "/api/projects/?include=inventory_count": 1,
+    "/api/projects/?include=developer": 2,
+    "/api/projects/?include=developer,inventory_count": 2,
+    # +1: the (count, max(updated_at)) fingerprint checked against
+    # If-None-Match before the page query, so a 304 skips the page entirely
+    "/api/inventory/": 2,
+    "/api/inventory/?include=project": 2,
+    "/api/leads/": 1,
+    "/api/leads/?include=assignee": 1,
+    "/api/enquiries/": 1,
+    "/api/enquiries/?include=assignee": 1,
+    "/api/contacts/": 1,
+    "/api/land-parcels/": 1,
+    "/api/developers/": 1,
+}
+
+
+class StatementCounter:
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.count += 1
+
+    def attach(self, engine):
+        event.listen(engine, "before_cursor_execute", self)
+
+
+ADMIN = Principal(
+    id=uuid.uuid4(), user_id=uuid.uuid4(), username="query-budget", full_name="Query Budget",
+    role=UserRole.ADMIN, phone=None, department=None, is_active=True,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    counter = StatementCounter()
+    counter.attach(database.engine)
+    if database.async_engine is not None:
+        counter.attach(database.async_engine.sync_engine)
+    for dependency in (get_current_user, get_current_user_async, get_current_admin):
+        app.dependency_overrides[dependency] = lambda: ADMIN
+    # Every read goes to the database, even with a shared Redis cache
+    reference_cache.ttl = 0
+
+    failures = 0
+    # Not entered as a context manager, so the lifespan does not run
+    client = TestClient(app)
+    for path, budget in BUDGETS.items():
+        url = f"{path}{'&' if '?' in path else '?'}limit={args.limit}"
+        counter.count = 0
+        response = client.get(url)
+        used = counter.count
+        ok = response.status_code == 200 and used <= budget
+        failures += not ok
+        print(
+            f"{'ok' if ok else 'FAIL':>4}  {url:<60} {response.status_code} "
+            f"rows={len(response.json()) if response.status_code == 200 else '-':<5} "
+            f"statements={used}/{budget}"
+        )
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measure /api/search query latency against a large synthetic contacts table.
+
+Generates --rows synthetic contacts server-side (generate_series), runs a
+mix of prefix, typo and phone-digit queries through the search service
+and prints latency percentiles. The rows are deleted afterwards unless
+--keep is given. Needs alembic revision 0004 applied to DATABASE_URL.
+
+    python -m benchmarks.search_latency --rows 1000000 --queries 200
+"""
+import argparse
+import random
+import time
+import uuid
+from sqlalchemy import text
+from app.core.metrics import Histogram
+from app.database import SessionLocal
+from app.models import document  # noqa: F401  registers Employee.documents' target
+from app.services.search import search_service
+
+FIRST_NAMES = ["Aarav", "Vivaan", "Aditya", "Priya", "Ananya", "Rohan", "Kavya", "Ishaan", "Meera", "Arjun"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Nair", "Gupta", "Desai", "Kulkarni", "Joshi", "Mehta"]
+
+INSERT_ROWS = text("""
+    INSERT INTO contacts (name, company, email, phone, city, notes, is_active)
+    SELECT
+        (:first)[1 + n % 10] || ' ' || (:last)[1 + (n / 10) % 10] || ' ' || n,
+        'Company ' || (n % 5000),
+        'user' || n || '@example.com',
+        '+91-' || lpad((9000000000 + n)::text, 10, '0'),
+        'City ' || (n % 300),
+        :tag,
+        true
+    FROM generate_series(1, :rows) AS n
+""")
+
+
+def make_queries(count: int, rows: int):
+    rng = random.Random(42)
+    queries = []
+    for _ in range(count):
+        n = rng.randint(1, rows)
+        kind = rng.choice(("prefix", "typo", "phone", "email"))
+        first, last = FIRST_NAMES[n % 10], LAST_NAMES[(n // 10) % 10]
+        if kind == "prefix":
+            queries.append(f"{first[:3]} {last[:4]}")
+        elif kind == "typo":
+            queries.append(f"{first} {last[:-2]}{last[-1]}{last[-2]}")
+        elif kind == "phone":
+            queries.append(str(9000000000 + n)[-6:])
+        else:
+            queries.append(f"user{n}@exam")
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic rows")
+    args = parser.parse_args()
+
+    tag = f"search-bench-{uuid.uuid4().hex[:8]}"
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        db.execute(INSERT_ROWS, {"first": FIRST_NAMES, "last": LAST_NAMES, "tag": tag, "rows": args.rows})
+        db.commit()
+        db.execute(text("ANALYZE contacts"))
+        db.commit()
+        print(f"inserted {args.rows} contacts in {time.perf_counter() - start:.1f}s")
+
+        latency = Histogram()
+        for q in make_queries(args.queries, args.rows):
+            start = time.perf_counter()
+            search_service.search(db, q, limit=args.limit)
+            latency.observe(time.perf_counter() - start)
+            db.rollback()
+        stats = latency.stats()
+        print(
+            f"{stats['count']} queries: mean {stats['mean'] * 1000:.1f}ms "
+            f"p50<={stats['p50'] * 1000:.1f}ms p95<={stats['p95'] * 1000:.1f}ms "
+            f"p99<={stats['p99'] * 1000:.1f}ms max {stats['max'] * 1000:.1f}ms"
+        )
+    finally:
+        if not args.keep:
+            db.rollback()
+            db.execute(text("DELETE FROM contacts WHERE notes = :tag"), {"tag": tag})
+            db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Seed DATABASE_URL with benchmark volumes for the load test.
+
+Rows are generated server-side (INSERT ... SELECT from generate_series),
+so a million leads take seconds rather than minutes, and every seeded row
+is tagged with SEED_PREFIX so re-seeding or --reset removes exactly what
+was seeded. Enum columns are bound through the models' own types, so the
+stored values match what the ORM writes.
+
+    docker compose up -d db && alembic upgrade head
+    python -m benchmarks.seed --leads 1000000 --inventory 200000 --land-parcels 50000
+    python -m benchmarks.seed --reset
+"""
+import argparse
+import time
+import uuid
+from sqlalchemy import case, delete, func, insert, literal, literal_column, select, text
+from app.database import SessionLocal
+from app.models import contact, document, enquiry, job  # noqa: F401 -- register mappers
+from app.models.developer import Developer
+from app.models.employee import Employee, UserRole
+from app.models.inventory import InventoryItem, InventoryStatus, PropertyType
+from app.models.land_parcel import LandParcel, LandType
+from app.models.lead import Lead, LeadSource, LeadStatus
+from app.models.project import Project, ProjectStatus, ProjectType
+
+SEED_PREFIX = "bench-seed-"
+# user_id of the seeded admin; benchmarks.load mints its token for it
+BENCH_ADMIN_USER_ID = uuid.UUID("00000000-0000-4000-8000-00000000b001")
+
+# (model, tag column) in delete order: children before parents
+TAGGED = (
+    (Lead, Lead.name),
+    (InventoryItem, InventoryItem.unit_number),
+    (Project, Project.name),
+    (Developer, Developer.name),
+    (LandParcel, LandParcel.survey_number),
+    (Employee, Employee.username),
+)
+
+
+def _series(count: int):
+    return func.generate_series(1, count).table_valued("g").render_derived()
+
+
+def _pick(g, column, values):
+    """Cycle through ``values`` by row number, bound as ``column``'s type"""
+    return case(
+        *[(g % len(values) == i, literal(value, column.type)) for i, value in enumerate(values)]
+    )
+
+
+def _tag(kind: str, g):
+    return func.concat(f"{SEED_PREFIX}{kind}-", g)
+
+
+def _ago(g, seconds_per_row: int):
+    # Spread created_at back in time so sort/cursor pagination sees
+    # distinct, realistic timestamps.
+    return func.now() - g * literal_column(f"interval '{seconds_per_row} seconds'")
+
+
+def _numbered(model, tag_column):
+    """Seeded rows of ``model`` numbered 0..n-1 for picking parents by g % n"""
+    return (
+        select(model.id, (func.row_number().over(order_by=model.id) - 1).label("n"))
+        .where(tag_column.like(f"{SEED_PREFIX}%"))
+        .subquery()
+    )
+
+
+def _insert(db, model, count: int, columns, parent=None, parent_count: int = 0) -> None:
+    series = _series(count)
+    g = series.c.g
+    values = columns(g, parent)
+    source = series
+    if parent is not None:
+        source = series.join(parent, parent.c.n == g % parent_count)
+    start = time.perf_counter()
+    db.execute(insert(model).from_select(list(values), select(*values.values()).select_from(source)))
+    db.commit()
+    print(f"{model.__tablename__:>14}: {count:>9,} rows in {time.perf_counter() - start:.1f}s")
+
+
+def reset(db) -> None:
+    for model, tag_column in TAGGED:
+        deleted = db.execute(delete(model).where(tag_column.like(f"{SEED_PREFIX}%"))).rowcount
+        if deleted:
+            print(f"{model.__tablename__:>14}: removed {deleted:,} seeded rows")
+    db.commit()
+
+
+def seed(db, args) -> None:
+    _insert(db, Employee, args.employees, lambda g, _: {
+        "username": _tag("employee", g),
+        "full_name": func.concat("Bench Employee ", g),
+        "role": case((g == 1, literal(UserRole.ADMIN, Employee.role.type)),
+                     else_=literal(UserRole.EMPLOYEE, Employee.role.type)),
+        "user_id": case((g == 1, literal(BENCH_ADMIN_USER_ID, Employee.user_id.type)),
+                        else_=func.gen_random_uuid()),
+        "department": _pick(g, Employee.department, ["Sales", "Marketing", "Operations"]),
+        "is_active": literal(True),
+    })
+    _insert(db, Developer, args.developers, lambda g, _: {
+        "name": _tag("developer", g),
+        "contact_person": func.concat("Contact ", g),
+        "email": func.concat("developer", g, "@example.com"),
+        "is_active": literal(True),
+        "created_at": _ago(g, 3600),
+        "updated_at": _ago(g, 3600),
+    })
+    developers = _numbered(Developer, Developer.name)
+    _insert(db, Project, args.projects, lambda g, parent: {
+        "name": _tag("project", g),
+        "project_type": _pick(g, Project.project_type, list(ProjectType)),
+        "status": _pick(g, Project.status, list(ProjectStatus)),
+        "location": _pick(g, Project.location, ["Pune", "Mumbai", "Bengaluru", "Hyderabad", "Chennai"]),
+        "total_units": 50 + g % 450,
+        "price_per_sqft": 4000 + g % 9000,
+        "total_value": 10_000_000 + (g * 7919) % 900_000_000,
+        "developer_id": parent.c.id,
+        "is_active": literal(True),
+        "created_at": _ago(g, 600),
+        "updated_at": _ago(g, 600),
+    }, developers, args.developers)
+    projects = _numbered(Project, Project.name)
+    _insert(db, InventoryItem, args.inventory, lambda g, parent: {
+        "unit_number": _tag("unit", g),
+        "property_type": _pick(g, InventoryItem.property_type, list(PropertyType)),
+        "status": _pick(g, InventoryItem.status, list(InventoryStatus)),
+        "floor": func.cast(g % 30, InventoryItem.floor.type),
+        "area": 500 + g % 3000,
+        "price": 2_500_000 + (g * 104729) % 50_000_000,
+        "bedrooms": 1 + g % 5,
+        "bathrooms": 1 + g % 4,
+        "project_id": parent.c.id,
+        "is_active": literal(True),
+        "created_at": _ago(g, 60),
+        "updated_at": _ago(g, 60),
+    }, projects, args.projects)
+    employees = _numbered(Employee, Employee.username)
+    _insert(db, Lead, args.leads, lambda g, parent: {
+        "name": _tag("lead", g),
+        "email": func.concat("lead", g, "@example.com"),
+        "phone": func.concat("+91", 9000000000 + g),
+        "company": func.concat("Company ", g % 5000),
+        "status": _pick(g, Lead.status, list(LeadStatus)),
+        "source": _pick(g, Lead.source, list(LeadSource)),
+        "budget": 1_000_000 + (g * 7919) % 90_000_000,
+        "assigned_employee_id": parent.c.id,
+        "is_active": literal(True),
+        "created_at": _ago(g, 15),
+        "updated_at": _ago(g, 15),
+    }, employees, args.employees)
+    _insert(db, LandParcel, args.land_parcels, lambda g, _: {
+        "survey_number": _tag("survey", g),
+        "village": func.concat("Village ", g % 2000),
+        "district": _pick(g, LandParcel.district, ["Pune", "Nashik", "Satara", "Thane", "Nagpur"]),
+        "state": literal("Maharashtra"),
+        "area_acres": 1 + g % 40,
+        "land_type": _pick(g, LandParcel.land_type, list(LandType)),
+        "owner_name": func.concat("Owner ", g),
+        "total_value": 500_000 + (g * 15485863) % 200_000_000,
+        "is_active": literal(True),
+        "created_at": _ago(g, 120),
+        "updated_at": _ago(g, 120),
+    })
+    for model, _ in TAGGED:
+        db.execute(text(f"ANALYZE {model.__tablename__}"))
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--leads", type=int, default=1_000_000)
+    parser.add_argument("--inventory", type=int, default=200_000)
+    parser.add_argument("--land-parcels", type=int, default=50_000)
+    parser.add_argument("--projects", type=int, default=2_000)
+    parser.add_argument("--developers", type=int, default=200)
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--reset", action="store_true", help="only remove previously seeded rows")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        reset(db)
+        if not args.reset:
+            seed(db, args)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare hand-built dict responses with the precompiled Serializer path.
+
+Serializes --rows transient Project rows (no database needed) the old way
+(per-row dict, jsonable_encoder, JSON render) and through
+app.api.serializers.Serializer, and prints the time per path.
+
+    python -m benchmarks.serialization --rows 10000
+"""
+import argparse
+import time
+import uuid
+from decimal import Decimal
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.api.routes.projects import project_list
+from app.models import employee, lead, developer, inventory, contact, enquiry, land_parcel, document  # noqa: F401  mapper registry
+from app.models.project import Project, ProjectStatus, ProjectType
+
+
+def make_rows(count: int):
+    return [
+        Project(
+            id=uuid.uuid4(),
+            name=f"Project {i}",
+            project_type=ProjectType.RESIDENTIAL,
+            status=ProjectStatus.UNDER_CONSTRUCTION,
+            location="Pune",
+            total_area=Decimal("125000.50"),
+            total_units=240,
+            price_per_sqft=Decimal("7450.00"),
+            developer_id=uuid.uuid4(),
+            is_active=True,
+        )
+        for i in range(count)
+    ]
+
+
+def dict_path(rows) -> bytes:
+    payload = [
+        {
+            "id": p.id,
+            "name": p.name,
+            "project_type": p.project_type,
+            "status": p.status,
+            "location": p.location,
+            "total_area": float(p.total_area) if p.total_area else None,
+            "total_units": p.total_units,
+            "price_per_sqft": float(p.price_per_sqft) if p.price_per_sqft else None,
+            "developer_id": p.developer_id,
+            "is_active": p.is_active
+        }
+        for p in rows
+    ]
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def serializer_path(rows) -> bytes:
+    return project_list.dump_many(rows)
+
+
+def run(name, fn, rows, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn(rows)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:>10}: {len(rows)} rows in {best * 1000:.1f}ms ({len(body) / 1024:.0f} KiB)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    rows = make_rows(args.rows)
+    baseline = run("dict", dict_path, rows, args.repeat)
+    compiled = run("serializer", serializer_path, rows, args.repeat)
+    print(f"speedup: {baseline / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
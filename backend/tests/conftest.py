@@ -0,0 +1,119 @@
+import os
+
+# Settings are read at import time; point them at throwaway values before
+# any app module is imported.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("REQUEST_METRICS_ENABLED", "false")
+os.environ.setdefault("STARTUP_WARMUP", "false")
+
+import uuid
+import pytest
+from sqlalchemy import ColumnDefault, create_engine, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.api.deps import Principal
+from app.models.base import Base
+from app.models import contact, developer, document, employee, enquiry, inventory, job, land_parcel, lead, project  # noqa: F401
+from app.models.employee import UserRole
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    return "CHAR(32)"
+
+
+def _sqlite_defaults() -> None:
+    """Swap the Postgres-only server defaults for ones SQLite understands"""
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            default = column.server_default
+            if default is None or not hasattr(default.arg, "text"):
+                continue
+            if "gen_random_uuid" in default.arg.text:
+                column.server_default = None
+                ColumnDefault(uuid.uuid4)._set_parent(column)
+            elif "now()" in default.arg.text:
+                column.server_default.arg = text("CURRENT_TIMESTAMP")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "postgres: needs TEST_DATABASE_URL (a scratch Postgres database); skipped otherwise"
+    )
+
+
+@pytest.fixture
+def pg_engine():
+    """Engine on TEST_DATABASE_URL with the schema created (and dropped after)"""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_engine():
+    _sqlite_defaults()
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    session = sessionmaker(bind=db_engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+def make_principal(role: UserRole = UserRole.EMPLOYEE) -> Principal:
+    return Principal(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), username=f"user-{uuid.uuid4().hex[:8]}", full_name="Test User",
+        role=role, phone=None, department=None, is_active=True,
+    )
+
+
+@pytest.fixture
+def user():
+    return make_principal()
+
+
+@pytest.fixture
+def client(db_engine, user):
+    """TestClient on app.main with the test database and ``user`` signed in.
+
+    Not entered as a context manager, so the lifespan (warmup, stats
+    refresher) does not run.
+    """
+    from fastapi.testclient import TestClient
+    from app.api.deps import get_current_admin, get_current_user
+    from app.database import get_db
+    from app.main import app
+
+    Session = sessionmaker(bind=db_engine, autoflush=False)
+
+    def get_test_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_current_admin] = lambda: user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from sqlalchemy.util import greenlet_spawn
+from app.core.cache import ReferenceCache, RedisCacheBackend
+
+
+class RecordingRedis:
+    """Just enough of redis-py, noting the thread each call ran on"""
+
+    def __init__(self):
+        self.data = {}
+        self.threads = []
+
+    def mget(self, keys):
+        self.threads.append(threading.current_thread())
+        return [self.data.get(key) for key in keys]
+
+    def set(self, key, value, ex):
+        self.threads.append(threading.current_thread())
+        self.data[key] = value
+
+    def incr(self, key):
+        self.threads.append(threading.current_thread())
+        self.data[key] = int(self.data.get(key) or 0) + 1
+        return self.data[key]
+
+
+def _read(cache):
+    return cache.get_or_load(["developers"], "/api/developers/?", lambda: b"[]")
+
+
+def test_redis_calls_stay_on_the_calling_thread_off_the_loop():
+    client = RecordingRedis()
+    cache = ReferenceCache(RedisCacheBackend(client))
+
+    assert _read(cache) == _read(cache) == b"[]"
+    cache.invalidate("developers")
+
+    assert client.threads == [threading.current_thread()] * 6
+    assert cache.stats()["hits"] == 1
+
+
+def test_redis_calls_leave_the_loop_inside_run_sync():
+    client = RecordingRedis()
+    cache = ReferenceCache(RedisCacheBackend(client))
+
+    async def handler():
+        # What AsyncSession.run_sync does with a sync handler body
+        first = await greenlet_spawn(_read, cache)
+        second = await greenlet_spawn(_read, cache)
+        await greenlet_spawn(cache.invalidate, "developers")
+        return first, second, threading.current_thread()
+
+    first, second, loop_thread = asyncio.run(handler())
+
+    assert first == second == b"[]"
+    assert len(client.threads) == 6
+    assert loop_thread not in client.threads
+    assert cache.errors == 0
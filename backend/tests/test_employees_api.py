@@ -0,0 +1,78 @@
+import uuid
+import pytest
+from datetime import timedelta
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import sessionmaker
+from app.api.deps import get_current_user, principal_cache
+from app.core.security import create_access_token
+from app.models.employee import Employee, UserRole
+
+
+@pytest.fixture
+def admin(db_session):
+    principal_cache.clear()
+    employee = Employee(user_id=uuid.uuid4(), username="asha", full_name="Asha Rao", role=UserRole.ADMIN)
+    db_session.add(employee)
+    db_session.commit()
+    yield employee
+    principal_cache.clear()
+
+
+@pytest.fixture
+def authenticate(db_engine):
+    """get_current_user for an employee's token, on a fresh session"""
+    Session = sessionmaker(bind=db_engine)
+
+    def authenticate(employee):
+        token = create_access_token({"sub": str(employee.user_id)}, expires_delta=timedelta(minutes=5))
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        with Session() as db:
+            return get_current_user(db=db, credentials=credentials)
+
+    return authenticate
+
+
+def test_role_change_is_seen_by_the_next_request(client, admin, authenticate):
+    assert authenticate(admin).role == UserRole.ADMIN
+
+    response = client.put(f"/api/employees/{admin.id}", json={"role": "employee"})
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(admin.id)
+    assert authenticate(admin).role == UserRole.EMPLOYEE
+
+
+def test_deactivated_employee_is_rejected_at_once(client, admin, authenticate):
+    authenticate(admin)
+
+    assert client.put(f"/api/employees/{admin.id}", json={"is_active": False}).status_code == 200
+
+    with pytest.raises(HTTPException) as exc:
+        authenticate(admin)
+    assert exc.value.status_code == 400
+
+
+def test_deleted_employee_is_rejected_at_once(client, admin, authenticate):
+    authenticate(admin)
+
+    assert client.delete(f"/api/employees/{admin.id}").status_code == 200
+
+    assert client.get(f"/api/employees/{admin.id}").status_code == 404
+    with pytest.raises(HTTPException) as exc:
+        authenticate(admin)
+    assert exc.value.status_code == 401
+
+
+def test_employee_routes_take_uuid_ids(client, admin):
+    assert client.get(f"/api/employees/{admin.id}").json()["username"] == "asha"
+    assert client.get("/api/employees/42").status_code == 422
+
+
+def test_token_subject_must_be_a_uuid(db_session):
+    token = create_access_token({"sub": "42"})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(db=db_session, credentials=credentials)
+    assert exc.value.status_code == 401
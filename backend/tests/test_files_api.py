@@ -0,0 +1,123 @@
+import pytest
+from moto import mock_aws
+from app.api.routes import files
+from app.core.config import settings
+from app.models.job import Job
+from app.services.aws_s3 import S3Service
+from app.services.job_handlers import STORAGE_DELETE
+from app.services.storage import signed_url_cache, upload_token
+from tests.conftest import make_principal
+
+BUCKET = "documents"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """files.storage as an S3Service backed by moto"""
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "AWS_S3_ENDPOINT_URL", None)
+    monkeypatch.setattr(settings, "AWS_BUCKET_NAME", BUCKET)
+    with mock_aws():
+        service = S3Service()
+        service.s3_client.create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION}
+        )
+        monkeypatch.setattr(files, "storage", service)
+        signed_url_cache.clear()
+        yield service
+        service.close()
+
+
+def _ticket(client, name="plan.pdf"):
+    response = client.post(
+        "/api/files/uploads", json={"name": name, "mime_type": "application/pdf", "entity_type": "project"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def _put(s3, key, body=b"%PDF-1.4 plan"):
+    # Stands in for the browser sending the presigned POST form
+    s3.s3_client.put_object(Bucket=BUCKET, Key=key, Body=body)
+
+
+def test_direct_upload_register_and_list(client, s3, user):
+    ticket = _ticket(client)
+    assert ticket["method"] == "POST"
+    assert ticket["fields"]["key"] == ticket["key"]
+    _put(s3, ticket["key"])
+
+    response = client.post("/api/files/", json={
+        "name": "plan.pdf", "mime_type": "application/pdf", "entity_type": "project",
+        "key": ticket["key"], "upload_token": ticket["upload_token"],
+    })
+    assert response.status_code == 201
+    document = response.json()
+    assert document["file_size"] == len(b"%PDF-1.4 plan")
+    assert document["uploaded_by"] == str(user.id)
+
+    listed = client.get("/api/files/", params={"entity_type": "project"}).json()
+    assert [item["id"] for item in listed] == [document["id"]]
+    assert ticket["key"] in listed[0]["url"]
+
+    again = client.post("/api/files/", json={
+        "name": "plan.pdf", "key": ticket["key"], "upload_token": ticket["upload_token"],
+    })
+    assert again.status_code == 409
+
+
+def test_register_requires_token_for_that_key_and_user(client, s3, user):
+    ticket = _ticket(client)
+    _put(s3, ticket["key"])
+    other = _ticket(client, "other.pdf")
+    foreign_key = "project/00000000-0000-4000-8000-000000000001/secret.pdf"
+    _put(s3, foreign_key)
+
+    attempts = [
+        {"key": foreign_key, "upload_token": ticket["upload_token"]},
+        {"key": foreign_key, "upload_token": "9999999999.forged"},
+        {"key": ticket["key"], "upload_token": other["upload_token"]},
+        {"key": ticket["key"], "upload_token": upload_token(ticket["key"], make_principal().id, 60)},
+        {"key": ticket["key"], "upload_token": upload_token(ticket["key"], user.id, -7200)},
+    ]
+    for attempt in attempts:
+        response = client.post("/api/files/", json={"name": "x.pdf", **attempt})
+        assert response.status_code == 403, attempt
+
+
+def test_register_before_upload(client, s3):
+    ticket = _ticket(client)
+
+    response = client.post("/api/files/", json={
+        "name": "plan.pdf", "key": ticket["key"], "upload_token": ticket["upload_token"],
+    })
+    assert response.status_code == 400
+
+
+def test_oversized_upload_is_queued_for_deletion(client, s3, db_session, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_MAX_BYTES", 4)
+    ticket = _ticket(client)
+    _put(s3, ticket["key"], b"too large")
+
+    response = client.post("/api/files/", json={
+        "name": "plan.pdf", "key": ticket["key"], "upload_token": ticket["upload_token"],
+    })
+    assert response.status_code == 413
+    jobs = db_session.query(Job).all()
+    assert [(job.kind, job.payload) for job in jobs] == [(STORAGE_DELETE, {"key": ticket["key"]})]
+
+
+def test_streamed_upload_and_download(client, s3):
+    response = client.post(
+        "/api/files/upload",
+        files={"file": ("notes.txt", b"site visit notes", "text/plain")},
+        data={"entity_type": "lead"},
+    )
+    assert response.status_code == 201
+    document = response.json()
+    assert s3.object_size(document["file_path"]) == len(b"site visit notes")
+
+    download = client.get(f"/api/files/{document['id']}/download", params={"redirect": "false"})
+    assert download.status_code == 200
+    assert document["file_path"] in download.json()["url"]
@@ -0,0 +1,161 @@
+import csv
+import io
+import threading
+import uuid
+import pytest
+from moto import mock_aws
+from app.api.routes import imports
+from app.core.config import settings
+from app.models.contact import Contact
+from app.models.job import Job, JobStatus
+from app.services.aws_s3 import s3_service
+from app.services.job_handlers import CSV_IMPORT, STORAGE_DELETE
+from app.services.jobs import job_queue
+
+BUCKET = "documents"
+
+CONTACTS_CSV = b"""name,email,city
+Asha Rao,asha@example.com,Pune
+,nobody@example.com,Mumbai
+Ravi Iyer,not-an-email,Chennai
+Meera Shah,,Delhi
+"""
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """The S3 backend, backed by moto, for the route and the job handler"""
+    monkeypatch.setattr(settings, "STORAGE_BACKEND", "s3")
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "AWS_S3_ENDPOINT_URL", None)
+    monkeypatch.setattr(settings, "IMPORT_WORKERS", 0)
+    # SQLite cannot add an interval to now(); keep every job due
+    monkeypatch.setattr(settings, "IMPORT_REPORT_RETENTION_SECONDS", 0)
+    monkeypatch.setattr(s3_service, "bucket_name", BUCKET)
+    monkeypatch.setattr(imports, "storage", s3_service)
+    with mock_aws():
+        s3_service.close()
+        s3_service.s3_client.create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION}
+        )
+        yield s3_service
+        s3_service.close()
+
+
+def _run(db, kind, key=None):
+    """Run the queued ``kind`` job (for ``key``) the way a worker would"""
+    for job in db.query(Job).filter(Job.kind == kind, Job.status == JobStatus.QUEUED):
+        if key is None or job.payload["key"] == key:
+            job.attempts += 1
+            job_queue.run(db, job)
+            return job
+    raise AssertionError(f"No queued {kind} job")
+
+
+def test_import_runs_as_job_with_progress_and_error_report(client, s3, db_session):
+    response = client.post("/api/imports/contacts", files={"file": ("contacts.csv", CONTACTS_CSV, "text/csv")})
+
+    assert response.status_code == 202
+    job = response.json()
+    assert job["kind"] == CSV_IMPORT
+    assert job["status"] == JobStatus.QUEUED
+    assert response.headers["Location"] == f"/api/jobs/{job['id']}"
+    upload_key = db_session.get(Job, uuid.UUID(job["id"])).payload["key"]
+    assert s3.object_size(upload_key) == len(CONTACTS_CSV)
+
+    _run(db_session, CSV_IMPORT)
+
+    job = client.get(f"/api/imports/jobs/{job['id']}").json()
+    assert job["status"] == JobStatus.SUCCEEDED
+    result = job["result"]
+    assert (result["rows_read"], result["rows_inserted"], result["rows_failed"]) == (4, 2, 2)
+    assert sorted(name for (name,) in db_session.query(Contact.name)) == ["Asha Rao", "Meera Shah"]
+    # Both files are queued for deletion; the report only after retention
+    queued = db_session.query(Job).filter(Job.kind == STORAGE_DELETE).all()
+    assert sorted(queued_job.payload["key"] for queued_job in queued) == [upload_key, result["error_report_key"]]
+    _run(db_session, STORAGE_DELETE, upload_key)
+    assert s3.object_size(upload_key) is None
+    assert s3.object_size(result["error_report_key"]) is not None
+
+    errors = client.get(f"/api/imports/jobs/{job['id']}/errors", params={"redirect": "false"})
+    assert errors.status_code == 200
+    assert result["error_report_key"] in errors.json()["url"]
+    body = s3.s3_client.get_object(Bucket=BUCKET, Key=result["error_report_key"])["Body"].read()
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert rows[0] == ["line", "error", "name", "email", "city"]
+    assert [row[0] for row in rows[1:]] == ["3", "4"]
+
+
+def test_import_errors_before_the_job_ran(client, s3):
+    job = client.post("/api/imports/contacts", files={"file": ("c.csv", CONTACTS_CSV, "text/csv")}).json()
+
+    assert client.get(f"/api/imports/jobs/{job['id']}/errors").status_code == 409
+
+
+def test_import_permissions(client, s3):
+    upload = {"file": ("c.csv", b"name\n", "text/csv")}
+
+    assert client.post("/api/imports/inventory", files=upload).status_code == 403
+    assert client.post("/api/imports/unknown", files=upload).status_code == 404
+
+
+def test_failed_import_keeps_progress_and_report(client, s3, db_session, monkeypatch):
+    from app.crud.crud_contact import contact_crud
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    create_many = contact_crud.create_many
+    calls = []
+
+    def fail_second_batch(db, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 2:
+            raise RuntimeError("database went away")
+        return create_many(db, **kwargs)
+
+    monkeypatch.setattr(contact_crud, "create_many", fail_second_batch)
+    job = client.post("/api/imports/contacts", files={"file": ("c.csv", CONTACTS_CSV, "text/csv")}).json()
+
+    _run(db_session, CSV_IMPORT)
+
+    job = client.get(f"/api/imports/jobs/{job['id']}").json()
+    assert job["status"] == JobStatus.FAILED
+    assert job["attempts"] == job["max_attempts"] == 1
+    assert "database went away" in job["last_error"]
+    result = job["result"]
+    assert (result["rows_read"], result["rows_inserted"], result["rows_failed"]) == (4, 1, 2)
+    assert s3.object_size(result["error_report_key"]) is not None
+
+
+def test_shutdown_fails_imports_still_running(client, s3, db_session, monkeypatch):
+    from app.crud.crud_contact import contact_crud
+    from app.services import job_handlers
+    from app.services.csv_import import CSVImportService
+    service = CSVImportService()
+    monkeypatch.setattr(job_handlers, "csv_import_service", service)
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 1)
+    create_many = contact_crud.create_many
+    started, release = threading.Event(), threading.Event()
+
+    def slow_create_many(db, **kwargs):
+        started.set()
+        release.wait(5)
+        return create_many(db, **kwargs)
+
+    monkeypatch.setattr(contact_crud, "create_many", slow_create_many)
+    job = client.post("/api/imports/contacts", files={"file": ("c.csv", CONTACTS_CSV, "text/csv")}).json()
+    runner = threading.Thread(target=_run, args=(db_session, CSV_IMPORT))
+    runner.start()
+    assert started.wait(5)
+
+    service.shutdown(0.05)
+    release.set()
+    runner.join(5)
+
+    job = client.get(f"/api/imports/jobs/{job['id']}").json()
+    assert job["status"] == JobStatus.FAILED
+    assert "interrupted by shutdown" in job["last_error"]
+    assert job["result"]["rows_inserted"] == 1
+
+    late = client.post("/api/imports/contacts", files={"file": ("c.csv", CONTACTS_CSV, "text/csv")}).json()
+    _run(db_session, CSV_IMPORT)
+    assert "shutting down" in client.get(f"/api/imports/jobs/{late['id']}").json()["last_error"]
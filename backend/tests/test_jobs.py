@@ -0,0 +1,185 @@
+import threading
+from datetime import timedelta
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models.job import Job, JobStatus
+from app.services.jobs import JobQueue, PermanentJobError
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue()
+
+    @queue.handler("ok")
+    def ok(db, payload):
+        return {"echo": payload}
+
+    @queue.handler("flaky")
+    def flaky(db, payload):
+        raise RuntimeError("boom")
+
+    @queue.handler("hopeless")
+    def hopeless(db, payload):
+        raise PermanentJobError("bad payload")
+
+    return queue
+
+
+def _claim_and_run(queue, db):
+    job = queue.claim(db, "test-worker")
+    assert job is not None
+    queue.run(db, job)
+    return job
+
+
+def test_successful_job_stores_its_result(queue, db_session):
+    job = queue.enqueue(db_session, "ok", {"n": 1})
+
+    _claim_and_run(queue, db_session)
+
+    db_session.refresh(job)
+    assert (job.status, job.attempts, job.result) == (JobStatus.SUCCEEDED, 1, {"echo": {"n": 1}})
+    assert job.locked_by is None and job.finished_at is not None
+    assert queue.claim(db_session, "test-worker") is None
+
+
+def test_permanent_error_fails_at_once(queue, db_session):
+    job = queue.enqueue(db_session, "hopeless", max_attempts=5)
+
+    _claim_and_run(queue, db_session)
+
+    db_session.refresh(job)
+    assert (job.status, job.attempts) == (JobStatus.FAILED, 1)
+    assert job.last_error == "PermanentJobError: bad payload"
+
+
+def test_missing_handler_fails_at_once(queue, db_session):
+    job = queue.enqueue(db_session, "unknown.kind", max_attempts=5)
+
+    _claim_and_run(queue, db_session)
+
+    db_session.refresh(job)
+    assert (job.status, job.attempts) == (JobStatus.FAILED, 1)
+    assert "No handler for job kind 'unknown.kind'" in job.last_error
+
+
+def test_backoff_doubles_with_jitter_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_SECONDS", 10)
+    monkeypatch.setattr(settings, "JOB_RETRY_MAX_SECONDS", 60)
+
+    for attempts, ceiling in [(1, 10), (2, 20), (3, 40), (4, 60), (10, 60)]:
+        delays = [JobQueue.backoff(attempts) for _ in range(50)]
+        assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+
+
+def test_report_progress_needs_a_running_job(queue, db_session):
+    with pytest.raises(RuntimeError):
+        queue.report_progress(db_session, {"rows": 1})
+
+
+# Retry scheduling, stale locks and SKIP LOCKED rely on Postgres semantics
+# (interval arithmetic on now(), row locks), so these run against a real one.
+
+@pytest.fixture
+def pg_session(pg_engine):
+    session = sessionmaker(bind=pg_engine)()
+    yield session
+    session.close()
+
+
+def _db_now(db):
+    return db.scalar(select(func.now()))
+
+
+@pytest.mark.postgres
+def test_failures_retry_with_backoff_until_max_attempts(queue, pg_session, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_SECONDS", 60)
+    job = queue.enqueue(pg_session, "flaky", max_attempts=3)
+
+    for attempt in (1, 2):
+        _claim_and_run(queue, pg_session)
+        pg_session.refresh(job)
+        assert (job.status, job.attempts, job.last_error) == (JobStatus.QUEUED, attempt, "RuntimeError: boom")
+        delay = (job.run_at - _db_now(pg_session)).total_seconds()
+        ceiling = 60 * 2 ** (attempt - 1)
+        assert ceiling / 2 - 5 <= delay <= ceiling
+        # Not due until the backoff has passed
+        assert queue.claim(pg_session, "test-worker") is None
+        pg_session.execute(update(Job).where(Job.id == job.id).values(run_at=func.now()))
+        pg_session.commit()
+
+    _claim_and_run(queue, pg_session)
+    pg_session.refresh(job)
+    assert (job.status, job.attempts) == (JobStatus.FAILED, 3)
+    assert job.finished_at is not None
+    assert queue.claim(pg_session, "test-worker") is None
+
+
+@pytest.mark.postgres
+def test_requeue_stale_requeues_or_fails_by_attempts_left(queue, pg_session):
+    retryable = queue.enqueue(pg_session, "ok", max_attempts=3)
+    exhausted = queue.enqueue(pg_session, "ok", max_attempts=1)
+    alive = queue.enqueue(pg_session, "ok", max_attempts=3)
+    for job in (retryable, exhausted, alive):
+        assert queue.claim(pg_session, "dead-worker") is not None
+    orphaned = func.now() - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS + 1)
+    pg_session.execute(
+        update(Job).where(Job.id.in_([retryable.id, exhausted.id])).values(locked_at=orphaned)
+    )
+    pg_session.commit()
+
+    assert queue.requeue_stale(pg_session) == 1
+
+    for job in (retryable, exhausted, alive):
+        pg_session.refresh(job)
+    assert (retryable.status, retryable.locked_by) == (JobStatus.QUEUED, None)
+    assert (exhausted.status, exhausted.last_error) == (JobStatus.FAILED, "Worker lost while running the job")
+    assert (alive.status, alive.locked_by) == (JobStatus.RUNNING, "dead-worker")
+
+
+@pytest.mark.postgres
+def test_claim_skips_jobs_locked_by_another_worker(queue, pg_engine):
+    Session = sessionmaker(bind=pg_engine)
+    with Session() as db:
+        first = queue.enqueue(db, "ok")
+        second = queue.enqueue(db, "ok")
+        db.execute(update(Job).where(Job.id == first.id).values(run_at=func.now() - timedelta(minutes=1)))
+        db.commit()
+        first_id, second_id = first.id, second.id
+
+    with Session() as claiming, Session() as other:
+        # Another worker's claim transaction is holding the first job
+        claiming.execute(select(Job).where(Job.id == first_id).with_for_update())
+        # Fail rather than hang if claim ever waits on the lock
+        other.execute(text("SET lock_timeout = '2s'"))
+
+        job = queue.claim(other, "other-worker")
+        assert job.id == second_id
+        assert queue.claim(other, "other-worker") is None
+        claiming.rollback()
+        assert queue.claim(other, "other-worker").id == first_id
+
+
+@pytest.mark.postgres
+def test_concurrent_workers_never_claim_a_job_twice(queue, pg_engine):
+    Session = sessionmaker(bind=pg_engine)
+    with Session() as db:
+        job_ids = {queue.enqueue(db, "ok").id for _ in range(40)}
+    claimed = []
+    start = threading.Barrier(8)
+
+    def worker(n):
+        start.wait()
+        with Session() as db:
+            while (job := queue.claim(db, f"worker-{n}")) is not None:
+                claimed.append(job.id)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert sorted(claimed) == sorted(job_ids)
@@ -0,0 +1,144 @@
+import uuid
+from datetime import datetime
+import pytest
+from app.crud.base import InvalidCursor, decode_cursor, encode_cursor
+from app.models.lead import Lead, LeadStatus
+
+CREATED = datetime(2026, 1, 1, 9, 30)
+
+
+@pytest.fixture
+def leads(db_session, user):
+    """Five leads that tie on name and created_at, so only id orders them"""
+    rows = [Lead(name="Same Name", created_at=CREATED, assigned_employee_id=user.id) for _ in range(5)]
+    db_session.add_all(rows)
+    db_session.commit()
+    return sorted(rows, key=lambda lead: lead.id.hex)
+
+
+def _ids(response):
+    assert response.status_code == 200, response.text
+    return [uuid.UUID(lead["id"]) for lead in response.json()]
+
+
+def _walk(client, limit, **params):
+    """Every id a client paging by cursor sees, and the number of pages"""
+    ids, pages, cursor = [], 0, None
+    while True:
+        query = dict(params, limit=limit, **({"cursor": cursor} if cursor else {}))
+        response = client.get("/api/leads/", params=query)
+        ids += _ids(response)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids, pages
+
+
+def test_cursor_round_trips_sort_and_values():
+    lead_id = uuid.uuid4()
+    cursor = encode_cursor("-name", ["Asha", LeadStatus.NEW, CREATED, lead_id, None])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("-name", ["Asha", "new", CREATED.isoformat(), str(lead_id), None])
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", encode_cursor("name", [])[:-3], "e30"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("sort", [None, "name", "-name"])
+def test_ties_are_broken_on_id(client, leads, sort):
+    params = {"sort": sort} if sort else {}
+
+    ids, pages = _walk(client, 2, **params)
+
+    expected = [lead.id for lead in leads]
+    assert ids == (expected[::-1] if sort == "-name" else expected)
+    assert pages == 3
+
+
+def test_skip_still_pages_and_hands_over_to_the_cursor(client, leads):
+    response = client.get("/api/leads/", params={"skip": 2, "limit": 2, "sort": "name"})
+
+    assert _ids(response) == [lead.id for lead in leads[2:4]]
+    rest = client.get(
+        "/api/leads/", params={"cursor": response.headers["X-Next-Cursor"], "limit": 2, "sort": "name"}
+    )
+    assert _ids(rest) == [leads[4].id]
+    assert "X-Next-Cursor" not in rest.headers
+
+
+def test_cursor_must_match_the_sort(client, leads):
+    response = client.get("/api/leads/", params={"limit": 2, "sort": "name"})
+    cursor = response.headers["X-Next-Cursor"]
+
+    for params in ({"sort": "-name"}, {"sort": "created_at"}, {}):
+        mismatched = client.get("/api/leads/", params=dict(params, cursor=cursor))
+        assert mismatched.status_code == 400
+        assert mismatched.json()["detail"] == "Cursor does not match the requested sort"
+    bad = client.get("/api/leads/", params={"sort": "name", "cursor": encode_cursor("name", ["x", "not a date", "y"])})
+    assert (bad.status_code, bad.json()["detail"]) == (400, "Invalid cursor")
+
+
+@pytest.fixture
+def budgets(db_session, user):
+    rows = [
+        Lead(name=f"Lead {budget}", budget=budget, status=status, assigned_employee_id=user.id)
+        for budget, status in [(50, LeadStatus.NEW), (100, LeadStatus.QUALIFIED), (250, LeadStatus.NEW), (500, LeadStatus.CLOSED_WON)]
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def _budgets(client, **params):
+    response = client.get("/api/leads/", params=dict(params, sort="budget"))
+    assert response.status_code == 200, response.text
+    return [float(lead["budget"]) for lead in response.json()]
+
+
+def test_equality_and_range_filters(client, budgets):
+    assert _budgets(client, status="new") == [50, 250]
+    assert _budgets(client, status="new,closed_won") == [50, 250, 500]
+    assert _budgets(client, budget__gte=100, budget__lt=500) == [100, 250]
+    assert _budgets(client, budget__gt=100, budget__lte=500) == [250, 500]
+
+
+@pytest.mark.parametrize("params, detail", [
+    ({"email": "asha@example.com"}, "Unsupported filter: email"),
+    ({"status__gte": "new"}, "Unsupported filter: status__gte"),
+    ({"budget": "100"}, "Unsupported filter: budget"),
+    ({"budget__between": "1,2"}, "Unsupported filter: budget__between"),
+    ({"sort": "email"}, "Unsupported sort: email"),
+    ({"sort": "-requirements"}, "Unsupported sort: -requirements"),
+])
+def test_fields_outside_the_whitelists_are_rejected(client, budgets, params, detail):
+    response = client.get("/api/leads/", params=params)
+
+    assert (response.status_code, response.json()["detail"]) == (400, detail)
+
+
+@pytest.mark.parametrize("params", [
+    {"budget__gte": "lots"},
+    {"created_at__lt": "yesterday"},
+    {"status": "won"},
+    {"status": "new,"},
+    {"is_active": "maybe"},
+    {"assigned_employee_id": "42"},
+    {"budget__lt": "NaN"},
+    {"budget__gte": "1e200000"},
+    {"budget__lte": "10000000000"},
+])
+def test_bad_filter_values_are_a_400_not_a_500(client, budgets, params):
+    response = client.get("/api/leads/", params=params)
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid value for ")
+
+
+def test_nul_in_a_text_filter_is_a_400(client):
+    response = client.get("/api/contacts/", params={"city": "Pu\x00ne"})
+
+    assert (response.status_code, response.json()["detail"]) == (400, "Invalid value for city: Pu\x00ne")
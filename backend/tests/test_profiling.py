@@ -0,0 +1,123 @@
+import uuid
+import pytest
+from app.api.deps import get_current_admin, get_current_user
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import PROFILE_HEADER, Profiler, ProfileStore
+from app.models.employee import UserRole
+from tests.conftest import make_principal
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    """A fresh Profiler in place of the app's, with nothing switched on"""
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "")
+    monkeypatch.setattr(settings, "PROFILE_DIR", "")
+    fresh = Profiler()
+    monkeypatch.setattr(profiling, "profiler", fresh)
+    monkeypatch.setattr("app.api.routes.metrics.profiler", fresh)
+    return fresh
+
+
+@pytest.fixture
+def admin(client):
+    from app.main import app
+    admin = make_principal(UserRole.ADMIN)
+    app.dependency_overrides[get_current_admin] = lambda: admin
+    return admin
+
+
+def _scope(path="/api/leads/", headers=()):
+    return {"type": "http", "path": path, "headers": [(name.encode(), value.encode()) for name, value in headers]}
+
+
+def _meta(n):
+    return {"id": str(uuid.uuid4()), "created_at": f"2026-01-01T00:00:{n:02d}+00:00"}
+
+
+def test_requests_are_sampled_at_the_rate_under_the_prefix(profiler, monkeypatch):
+    assert not profiler.enabled
+    assert not profiler.wants(_scope())
+
+    profiler.configure(sample_rate=0.25, path_prefix="/api/leads")
+    monkeypatch.setattr(profiling.random, "random", lambda: 0.2)
+    assert profiler.enabled and profiler.wants(_scope())
+    assert not profiler.wants(_scope("/api/projects/"))
+    monkeypatch.setattr(profiling.random, "random", lambda: 0.3)
+    assert not profiler.wants(_scope())
+
+
+def test_the_token_header_forces_or_skips_profiling(profiler, monkeypatch):
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "let-me-see")
+
+    assert profiler.enabled
+    assert profiler.wants(_scope("/health", [(PROFILE_HEADER, "let-me-see")]))
+    assert not profiler.wants(_scope())
+    profiler.configure(sample_rate=1.0, path_prefix="/")
+    assert not profiler.wants(_scope(headers=[(PROFILE_HEADER, "guess")]))
+
+
+@pytest.mark.parametrize("in_dir", [False, True])
+def test_store_keeps_the_newest_profiles(monkeypatch, tmp_path, in_dir):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path) if in_dir else "")
+    monkeypatch.setattr(settings, "PROFILE_MAX_STORED", 3)
+    store = ProfileStore()
+    metas = [_meta(n) for n in range(5)]
+
+    for meta in metas:
+        store.save(meta, f"main;handler {meta['id']}\n")
+
+    assert [meta["id"] for meta in store.list()] == [meta["id"] for meta in metas[:1:-1]]
+    assert store.get(metas[1]["id"]) is None
+    assert store.get(metas[4]["id"]) == f"main;handler {metas[4]['id']}\n"
+    if in_dir:
+        assert len(list(tmp_path.iterdir())) == 6
+
+
+def test_profiled_request_is_stored_and_downloadable_by_admins(client, profiler, monkeypatch):
+    from app.main import app
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "let-me-see")
+    app.dependency_overrides.pop(get_current_admin)
+
+    assert client.get("/api/leads/", headers={PROFILE_HEADER: "let-me-see"}).status_code == 200
+
+    [meta] = profiler.store.list()
+    assert (meta["method"], meta["path"], meta["status"]) == ("GET", "/api/leads/", 200)
+    for path in ("/api/metrics/profiling", f"/api/metrics/profiling/{meta['id']}"):
+        assert client.get(path).status_code == 403
+    assert client.put("/api/metrics/profiling", json={"sample_rate": 1.0}).status_code == 403
+
+    app.dependency_overrides[get_current_user] = lambda: make_principal(UserRole.ADMIN)
+    download = client.get(f"/api/metrics/profiling/{meta['id']}")
+    assert download.status_code == 200
+    assert download.headers["content-disposition"] == f'attachment; filename="profile-{meta["id"]}.folded"'
+    assert client.get(f"/api/metrics/profiling/{uuid.uuid4()}").status_code == 404
+
+
+def test_settings_changes_reach_every_worker_through_profile_dir(client, admin, profiler, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 4)
+    other_worker = Profiler()
+    other_worker.refresh()
+
+    response = client.put("/api/metrics/profiling", json={"sample_rate": 0.5, "path_prefix": "/api/leads"})
+
+    assert response.status_code == 200
+    assert (other_worker.sample_rate, other_worker.path_prefix) == (0.0, "/api/")
+    other_worker._checked_at -= profiling.SETTINGS_RELOAD_SECONDS
+    other_worker.refresh()
+    assert (other_worker.sample_rate, other_worker.path_prefix) == (0.5, "/api/leads")
+    assert Profiler().state()["sample_rate"] == 0.5
+    assert client.get("/api/metrics/profiling").json()["profiles"] == []
+
+
+def test_settings_changes_need_profile_dir_with_several_workers(client, admin, profiler, monkeypatch):
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 2)
+
+    response = client.put("/api/metrics/profiling", json={"sample_rate": 0.5})
+
+    assert response.status_code == 409
+    assert profiler.sample_rate == 0.0
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 1)
+    assert client.put("/api/metrics/profiling", json={"sample_rate": 0.5}).json()["sample_rate"] == 0.5
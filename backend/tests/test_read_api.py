@@ -0,0 +1,39 @@
+import uuid
+import pytest
+from app.models.developer import Developer
+from app.models.inventory import InventoryItem, PropertyType
+from app.models.lead import Lead
+from app.models.project import Project, ProjectType
+
+
+@pytest.fixture
+def catalog(db_session, user):
+    developer = Developer(name="Skyline Builders")
+    project = Project(name="Lake View", project_type=ProjectType.RESIDENTIAL, developer=developer)
+    item = InventoryItem(unit_number="A-101", property_type=PropertyType.APARTMENT, project=project)
+    lead = Lead(name="Asha Rao", assigned_employee_id=user.id)
+    db_session.add_all([developer, project, item, lead])
+    db_session.commit()
+    return developer, project, item
+
+
+def test_detail_routes_take_uuid_ids(client, catalog):
+    developer, project, item = catalog
+
+    for path, expected in [
+        (f"/api/developers/{developer.id}", developer.id),
+        (f"/api/projects/{project.id}", project.id),
+        (f"/api/inventory/{item.id}", item.id),
+    ]:
+        response = client.get(path)
+        assert response.status_code == 200, path
+        assert response.json()["id"] == str(expected)
+        assert client.get(path.replace(str(expected), str(uuid.uuid4()))).status_code == 404
+        assert client.get(path.replace(str(expected), "42")).status_code == 422
+
+
+def test_lead_list_serializes_uuid_ids(client, catalog, user):
+    response = client.get("/api/leads/")
+
+    assert response.status_code == 200
+    assert [lead["assigned_employee_id"] for lead in response.json()] == [str(user.id)]
@@ -0,0 +1,101 @@
+import asyncio
+import io
+import pytest
+from moto import mock_aws
+from app.core.config import settings
+from app.services.aws_s3 import S3Service
+from app.services.storage import FileTooLarge
+
+MiB = 1024 * 1024
+BUCKET = "documents"
+
+
+class Upload:
+    """Async reader over bytes, standing in for fastapi.UploadFile"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "AWS_S3_ENDPOINT_URL", None)
+    monkeypatch.setattr(settings, "AWS_BUCKET_NAME", BUCKET)
+    monkeypatch.setattr(settings, "S3_PART_SIZE", 5 * MiB)
+    with mock_aws():
+        service = S3Service()
+        service.s3_client.create_bucket(
+            Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": settings.AWS_REGION}
+        )
+        yield service
+        service.close()
+
+
+def _body(service: S3Service, key: str) -> bytes:
+    return service.s3_client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+
+
+def test_upload_stream_small_file_is_single_put(s3):
+    size = asyncio.run(s3.upload_stream(Upload(b"hello"), "documents/a/hello.txt", "text/plain"))
+
+    assert size == 5
+    assert _body(s3, "documents/a/hello.txt") == b"hello"
+    head = s3.s3_client.head_object(Bucket=BUCKET, Key="documents/a/hello.txt")
+    assert head["ContentType"] == "text/plain"
+
+
+def test_upload_stream_large_file_is_multipart(s3):
+    data = bytes(range(256)) * (11 * MiB // 256)
+
+    size = asyncio.run(s3.upload_stream(Upload(data), "documents/b/big.bin", "application/octet-stream"))
+
+    assert size == len(data)
+    assert _body(s3, "documents/b/big.bin") == data
+    assert s3.object_size("documents/b/big.bin") == len(data)
+
+
+def test_upload_stream_over_limit_aborts_multipart(s3, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_MAX_BYTES", 8 * MiB)
+
+    with pytest.raises(FileTooLarge):
+        asyncio.run(s3.upload_stream(Upload(b"x" * 12 * MiB), "documents/c/big.bin", "text/plain"))
+
+    assert s3.object_size("documents/c/big.bin") is None
+    assert not s3.s3_client.list_multipart_uploads(Bucket=BUCKET).get("Uploads")
+
+
+def test_object_size_missing_key(s3):
+    assert s3.object_size("documents/missing") is None
+
+
+def test_presigned_upload_is_post_form(s3):
+    ticket = s3.presigned_upload("documents/d/form.pdf", "application/pdf", 300)
+
+    assert ticket.method == "POST"
+    assert ticket.fields["key"] == "documents/d/form.pdf"
+    assert ticket.fields["Content-Type"] == "application/pdf"
+    assert ticket.expires_in == 300
+
+
+def test_presigned_download_urls(s3):
+    url = s3.presigned_download_url("documents/e/report.pdf", 60, filename="report.pdf")
+    assert "documents/e/report.pdf" in url
+    assert "response-content-disposition" in url
+
+    urls = s3.presigned_download_urls(["documents/e/1", "documents/e/2"], 60)
+    assert set(urls) == {"documents/e/1", "documents/e/2"}
+    assert all("X-Amz-Signature" in value for value in urls.values())
+
+
+def test_unconfigured_client(monkeypatch):
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", None)
+    service = S3Service()
+
+    assert service.s3_client is None
+    with pytest.raises(Exception, match="S3 not configured"):
+        service.presigned_download_url("documents/f", 60)
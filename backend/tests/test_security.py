@@ -0,0 +1,148 @@
+import asyncio
+import io
+import json
+import threading
+import time
+from datetime import timedelta
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from jose import jwk, jwt
+from app.core import security
+from app.core.config import settings
+from app.core.security import SupabaseKeys, token_cache, verify_token, verify_token_async
+
+SUPABASE_URL = "https://project.supabase.co"
+ISSUER = f"{SUPABASE_URL}/auth/v1"
+JWT_SECRET = "supabase-jwt-secret"
+
+
+def _rsa_key():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem, public_pem
+
+
+PRIVATE_PEM, PUBLIC_PEM = _rsa_key()
+
+
+def _claims(**overrides):
+    claims = {"sub": "user-1", "aud": "authenticated", "iss": ISSUER, "exp": int(time.time()) + 600}
+    claims.update(overrides)
+    return claims
+
+
+def _rs256(kid="key-1", **claims):
+    return jwt.encode(_claims(**claims), PRIVATE_PEM, algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture(autouse=True)
+def fresh_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    """Supabase verification on, with the JWKS endpoint serving one RS256 key"""
+    monkeypatch.setattr(settings, "SUPABASE_JWT_VERIFY", True)
+    monkeypatch.setattr(settings, "SUPABASE_URL", SUPABASE_URL)
+    monkeypatch.setattr(settings, "SUPABASE_JWT_SECRET", JWT_SECRET)
+    monkeypatch.setattr(security, "supabase_keys", SupabaseKeys())
+    public = dict(jwk.construct(PUBLIC_PEM, "RS256").to_dict(), kid="key-1")
+    fetches = []
+
+    def urlopen(url, timeout):
+        fetches.append(url)
+        return io.BytesIO(json.dumps({"keys": [public]}).encode())
+
+    monkeypatch.setattr(security.urllib.request, "urlopen", urlopen)
+    return fetches
+
+
+def _rejected(token):
+    with pytest.raises(HTTPException) as exc:
+        verify_token(token)
+    return exc.value.status_code == 401
+
+
+def _cache_ttl(token):
+    _, expires_at = token_cache._data[security._token_cache_key(token)]
+    return expires_at - time.monotonic()
+
+
+def test_cache_entry_expires_with_the_token():
+    short = security.create_access_token({"sub": "a"}, expires_delta=timedelta(seconds=30))
+    long = security.create_access_token({"sub": "b"}, expires_delta=timedelta(hours=1))
+
+    verify_token(short)
+    verify_token(long)
+
+    assert 0 < _cache_ttl(short) <= 30
+    assert 30 < _cache_ttl(long) <= token_cache.ttl
+
+
+def test_expired_token_is_rejected_and_not_cached():
+    token = security.create_access_token({"sub": "a"}, expires_delta=timedelta(seconds=-1))
+
+    assert _rejected(token)
+    assert token_cache.stats()["size"] == 0
+
+
+def test_hs256_uses_the_supabase_secret_without_fetching_keys(jwks):
+    token = jwt.encode(_claims(), JWT_SECRET, algorithm="HS256")
+
+    assert verify_token(token)["sub"] == "user-1"
+    assert jwks == []
+    assert _rejected(jwt.encode(_claims(sub="user-2"), settings.SECRET_KEY, algorithm="HS256"))
+
+
+def test_asymmetric_tokens_use_the_cached_jwks(jwks):
+    assert verify_token(_rs256(sub="user-1"))["sub"] == "user-1"
+    assert verify_token(_rs256(sub="user-2"))["sub"] == "user-2"
+
+    assert jwks == [f"{ISSUER}/.well-known/jwks.json"]
+
+
+def test_unknown_kid_is_rejected_and_refetched_at_most_once_a_minute(jwks):
+    verify_token(_rs256())
+
+    assert _rejected(_rs256(kid="rotated"))
+    assert len(jwks) == 1  # fetched less than REFETCH_INTERVAL ago
+    security.supabase_keys._fetched_at -= SupabaseKeys.REFETCH_INTERVAL + 1
+    assert _rejected(_rs256(kid="rotated", sub="user-2"))
+    assert len(jwks) == 2
+
+
+def test_other_issuers_are_not_trusted(jwks):
+    assert _rejected(_rs256(iss="https://attacker.example/auth/v1"))
+    assert _rejected(jwt.encode(_claims(iss="https://attacker.example"), JWT_SECRET, algorithm="HS256"))
+    # App-issued tokens still verify against SECRET_KEY
+    assert verify_token(security.create_access_token({"sub": "app-user"}))["sub"] == "app-user"
+
+
+def test_async_verification_only_leaves_the_loop_on_a_miss(monkeypatch):
+    decoded_on = []
+    decode = security._decode_token
+
+    def recording_decode(token):
+        decoded_on.append(threading.current_thread().name)
+        return decode(token)
+
+    monkeypatch.setattr(security, "_decode_token", recording_decode)
+    token = security.create_access_token({"sub": "a"})
+
+    async def verify_twice():
+        return await verify_token_async(token), await verify_token_async(token)
+
+    first, second = asyncio.run(verify_twice())
+
+    assert first["sub"] == second["sub"] == "a"
+    assert len(decoded_on) == 1 and decoded_on[0].startswith("auth")